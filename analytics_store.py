@@ -0,0 +1,216 @@
+"""
+Executive AI Prompts - SQLite Analytics Store
+
+This module provides a local SQLite backend for prompt execution history so
+single-node deployments can keep more history than fits in memory. Inserts are
+batched through ``executemany`` and every report is answered by an aggregate
+SQL query over indexed columns.
+"""
+
+from typing import Dict, List, Optional, Any, Tuple
+from datetime import datetime
+import json
+import math
+import sqlite3
+
+from prompt_manager import PromptExecution, PromptCategory
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS executions (
+    id TEXT PRIMARY KEY,
+    template_id TEXT NOT NULL,
+    category TEXT,
+    industry TEXT,
+    role TEXT,
+    company_size TEXT,
+    region TEXT,
+    user_id TEXT,
+    quality_score REAL,
+    execution_time TEXT NOT NULL,
+    hour INTEGER NOT NULL,
+    generated_prompt TEXT,
+    response TEXT,
+    feedback TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_executions_template_time ON executions (template_id, execution_time);
+CREATE INDEX IF NOT EXISTS idx_executions_time ON executions (execution_time);
+CREATE INDEX IF NOT EXISTS idx_executions_industry ON executions (industry);
+CREATE INDEX IF NOT EXISTS idx_executions_role ON executions (role);
+"""
+
+INSERT_SQL = """
+INSERT OR REPLACE INTO executions (
+    id, template_id, category, industry, role, company_size, region, user_id,
+    quality_score, execution_time, hour, generated_prompt, response, feedback
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+GROUP_COLUMNS = ('template_id', 'category', 'industry', 'role', 'hour')
+
+# In-memory unless the caller names a database file; nothing is written inside the package
+DEFAULT_DB_PATH = ":memory:"
+
+
+class SQLiteExecutionStore:
+    """
+    WAL-mode SQLite store for prompt executions with SQL-side aggregation.
+
+    Pass a file ``path`` to keep history across runs; the default database
+    lives in memory for the lifetime of the store.
+    """
+
+    def __init__(self, path: str = DEFAULT_DB_PATH, batch_size: int = 500):
+        self.path = path
+        self.batch_size = batch_size
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+        self._pending: List[Tuple[Any, ...]] = []
+
+    def add(self, execution: PromptExecution, user_id: Optional[str] = None,
+            category: Optional[PromptCategory] = None) -> None:
+        """Queue an execution; rows are written in batches of ``batch_size``."""
+        context = execution.context
+        self._pending.append((
+            execution.id,
+            execution.prompt_id,
+            category.value if category else None,
+            context.industry.value if context else None,
+            context.role.value if context and context.role else None,
+            context.company_size if context else None,
+            context.region if context else None,
+            user_id,
+            execution.quality_score,
+            execution.execution_time.isoformat(),
+            execution.execution_time.hour,
+            execution.generated_prompt,
+            execution.response,
+            json.dumps(execution.feedback) if execution.feedback is not None else None
+        ))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all queued executions in a single transaction."""
+        if not self._pending:
+            return
+        with self.connection:
+            self.connection.executemany(INSERT_SQL, self._pending)
+        self._pending = []
+
+    def update_response(self, execution_id: str, response: str,
+                        quality_score: Optional[float] = None) -> bool:
+        """Set the response and quality score of a stored execution."""
+        self.flush()
+        with self.connection:
+            cursor = self.connection.execute(
+                "UPDATE executions SET response = ?, quality_score = ? WHERE id = ?",
+                (response, quality_score, execution_id)
+            )
+        return cursor.rowcount > 0
+
+    def close(self) -> None:
+        self.flush()
+        self.connection.close()
+
+    def _where(self, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None,
+               **equals: Optional[str]) -> Tuple[str, List[Any]]:
+        """Build a WHERE clause from a date range and column equality filters."""
+        clauses, params = [], []
+        if start_date:
+            clauses.append("execution_time >= ?")
+            params.append(start_date.isoformat())
+        if end_date:
+            clauses.append("execution_time <= ?")
+            params.append(end_date.isoformat())
+        for column, value in equals.items():
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def count(self, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None) -> int:
+        """Number of stored executions in the date range."""
+        self.flush()
+        where, params = self._where(start_date, end_date)
+        return self.connection.execute(f"SELECT COUNT(*) FROM executions{where}", params).fetchone()[0]
+
+    def quality_summary(self, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None,
+                        success_threshold: float = 7.0) -> Dict[str, Any]:
+        """Total executions, average quality and success count in one scan."""
+        self.flush()
+        where, params = self._where(start_date, end_date)
+        total, average, successes = self.connection.execute(
+            f"SELECT COUNT(*), AVG(quality_score), "
+            f"SUM(CASE WHEN quality_score >= ? THEN 1 ELSE 0 END) FROM executions{where}",
+            [success_threshold] + params
+        ).fetchone()
+        return {'total_executions': total, 'average_quality': average or 0.0, 'successes': successes or 0}
+
+    def top_counts(self, column: str, start_date: Optional[datetime] = None,
+                   end_date: Optional[datetime] = None, limit: Optional[int] = None,
+                   **equals: Optional[str]) -> List[Tuple[Any, int]]:
+        """Execution counts grouped by ``column``, most frequent first."""
+        if column not in GROUP_COLUMNS:
+            raise ValueError(f"Cannot group by {column}")
+        self.flush()
+        where, params = self._where(start_date, end_date, **equals)
+        where += (" AND " if where else " WHERE ") + f"{column} IS NOT NULL"
+        sql = f"SELECT {column}, COUNT(*) AS n FROM executions{where} GROUP BY {column} ORDER BY n DESC"
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        return [tuple(row) for row in self.connection.execute(sql, params)]
+
+    def grouped_quality(self, column: str, start_date: Optional[datetime] = None,
+                        end_date: Optional[datetime] = None,
+                        **equals: Optional[str]) -> Dict[str, Dict[str, Any]]:
+        """Per-group execution count and quality count/mean/min/max/stdev."""
+        if column not in GROUP_COLUMNS:
+            raise ValueError(f"Cannot group by {column}")
+        self.flush()
+        where, params = self._where(start_date, end_date, **equals)
+        where += (" AND " if where else " WHERE ") + f"{column} IS NOT NULL"
+        rows = self.connection.execute(
+            f"SELECT {column}, COUNT(*), COUNT(quality_score), SUM(quality_score), "
+            f"SUM(quality_score * quality_score), MIN(quality_score), MAX(quality_score) "
+            f"FROM executions{where} GROUP BY {column}",
+            params
+        )
+
+        groups = {}
+        for key, executions, scored, total, total_sq, minimum, maximum in rows:
+            mean = total / scored if scored else 0.0
+            variance = (total_sq - scored * mean * mean) / (scored - 1) if scored > 1 else 0.0
+            groups[key] = {
+                'executions': executions,
+                'scored': scored,
+                'mean': mean,
+                'min': minimum,
+                'max': maximum,
+                'stdev': math.sqrt(max(variance, 0.0))
+            }
+        return groups
+
+    def executions_by_day(self, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None,
+                          **equals: Optional[str]) -> Dict[str, int]:
+        """Execution counts keyed by YYYY-MM-DD."""
+        self.flush()
+        where, params = self._where(start_date, end_date, **equals)
+        rows = self.connection.execute(
+            f"SELECT substr(execution_time, 1, 10) AS day, COUNT(*) FROM executions{where} "
+            f"GROUP BY day ORDER BY day",
+            params
+        )
+        return dict(rows.fetchall())
+
+    def average_quality(self, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None,
+                        **equals: Optional[str]) -> Tuple[int, Optional[float]]:
+        """Execution count and average quality (None when nothing is scored)."""
+        self.flush()
+        where, params = self._where(start_date, end_date, **equals)
+        total, average = self.connection.execute(
+            f"SELECT COUNT(*), AVG(quality_score) FROM executions{where}", params
+        ).fetchone()
+        return total, average
@@ -0,0 +1,199 @@
+"""
+Executive AI Prompts - Execution History Exporter
+
+This module streams raw prompt execution history into columnar files for
+offline analysis. Parquet output is written with pyarrow when it is installed;
+otherwise the exporter falls back to CSV with the same column layout.
+"""
+
+from typing import Dict, List, Optional, Any, Tuple, Callable, Iterable, Iterator, Collection
+from datetime import datetime
+import csv
+import json
+import os
+
+from prompt_manager import PromptExecution, PromptCategory, prompt_manager
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+
+EXECUTION_COLUMNS = (
+    'id', 'prompt_id', 'category', 'industry', 'role', 'company_size', 'region',
+    'urgency_level', 'confidentiality', 'execution_time', 'quality_score',
+    'generated_prompt', 'response', 'feedback'
+)
+
+
+def _default_category_resolver(prompt_id: str) -> Optional[PromptCategory]:
+    """Resolve a template's category through the global prompt manager."""
+    template = prompt_manager.get_template(prompt_id)
+    return template.category if template else None
+
+
+class ExecutionExporter:
+    """Batched columnar exporter for PromptExecution streams."""
+
+    def __init__(self, batch_size: int = 10_000,
+                 category_resolver: Optional[Callable[[str], Optional[PromptCategory]]] = None):
+        self.batch_size = batch_size
+        self.category_resolver = category_resolver or _default_category_resolver
+
+    @staticmethod
+    def parquet_available() -> bool:
+        """Whether the optional pyarrow dependency is installed."""
+        return pa is not None
+
+    def iter_column_batches(self, executions: Iterable[PromptExecution],
+                            start_date: Optional[datetime] = None,
+                            end_date: Optional[datetime] = None,
+                            categories: Optional[Collection[PromptCategory]] = None) -> Iterator[List[List[Any]]]:
+        """
+        Yield filtered executions as column-major batches.
+
+        Date and category predicates are evaluated before a row is materialized,
+        and values are appended straight into per-column lists, so no per-row
+        dict is ever built.
+        """
+        category_values = {c.value for c in categories} if categories else None
+        category_cache: Dict[str, Optional[str]] = {}
+
+        columns: List[List[Any]] = [[] for _ in EXECUTION_COLUMNS]
+        (ids, prompt_ids, cats, industries, roles, sizes, regions, urgencies,
+         confidentialities, times, scores, prompts, responses, feedbacks) = columns
+        rows = 0
+
+        for execution in executions:
+            when = execution.execution_time
+            if start_date and when < start_date:
+                continue
+            if end_date and when > end_date:
+                continue
+
+            prompt_id = execution.prompt_id
+            if prompt_id in category_cache:
+                category = category_cache[prompt_id]
+            else:
+                resolved = self.category_resolver(prompt_id)
+                category = category_cache[prompt_id] = resolved.value if resolved else None
+            if category_values is not None and category not in category_values:
+                continue
+
+            context = execution.context
+            ids.append(execution.id)
+            prompt_ids.append(prompt_id)
+            cats.append(category)
+            industries.append(context.industry.value if context else None)
+            roles.append(context.role.value if context and context.role else None)
+            sizes.append(context.company_size if context else None)
+            regions.append(context.region if context else None)
+            urgencies.append(context.urgency_level if context else None)
+            confidentialities.append(context.confidentiality if context else None)
+            times.append(when)
+            scores.append(execution.quality_score)
+            prompts.append(execution.generated_prompt)
+            responses.append(execution.response)
+            feedbacks.append(json.dumps(execution.feedback) if execution.feedback is not None else None)
+            rows += 1
+
+            if rows == self.batch_size:
+                yield columns
+                columns = [[] for _ in EXECUTION_COLUMNS]
+                (ids, prompt_ids, cats, industries, roles, sizes, regions, urgencies,
+                 confidentialities, times, scores, prompts, responses, feedbacks) = columns
+                rows = 0
+
+        if rows:
+            yield columns
+
+    def export(self, executions: Iterable[PromptExecution], path: str,
+               start_date: Optional[datetime] = None,
+               end_date: Optional[datetime] = None,
+               categories: Optional[Collection[PromptCategory]] = None,
+               file_format: str = "auto") -> Dict[str, Any]:
+        """
+        Stream executions to a Parquet or CSV file, one row group per batch.
+
+        ``file_format`` is "parquet", "csv" or "auto" (Parquet when pyarrow is
+        installed, otherwise CSV with the path suffix switched to ``.csv``).
+        """
+        if file_format == "auto":
+            file_format = "parquet" if self.parquet_available() else "csv"
+            if file_format == "csv" and path.endswith('.parquet'):
+                path = os.path.splitext(path)[0] + '.csv'
+        if file_format == "parquet" and not self.parquet_available():
+            raise ImportError("pyarrow is required for Parquet export; use file_format='csv'")
+        if file_format not in ("parquet", "csv"):
+            raise ValueError(f"Unsupported export format: {file_format}")
+
+        batches = self.iter_column_batches(executions, start_date, end_date, categories)
+        if file_format == "parquet":
+            rows, row_groups = self._write_parquet(batches, path)
+        else:
+            rows, row_groups = self._write_csv(batches, path)
+
+        return {
+            'path': path,
+            'format': file_format,
+            'rows_written': rows,
+            'row_groups': row_groups,
+            'exported_at': datetime.now().isoformat()
+        }
+
+    def read_parquet(self, path: str, start_date: Optional[datetime] = None,
+                     end_date: Optional[datetime] = None,
+                     categories: Optional[Collection[PromptCategory]] = None,
+                     columns: Optional[List[str]] = None) -> Any:
+        """Read an exported Parquet file, pushing date/category predicates down to row groups."""
+        if not self.parquet_available():
+            raise ImportError("pyarrow is required to read Parquet exports")
+
+        filters = []
+        if start_date:
+            filters.append(('execution_time', '>=', start_date))
+        if end_date:
+            filters.append(('execution_time', '<=', end_date))
+        if categories:
+            filters.append(('category', 'in', [c.value for c in categories]))
+
+        return pq.read_table(path, columns=columns, filters=filters or None)
+
+    def _write_parquet(self, batches: Iterator[List[List[Any]]], path: str) -> Tuple[int, int]:
+        """Write each column batch as its own Parquet row group."""
+        schema = self._arrow_schema()
+        rows = row_groups = 0
+        with pq.ParquetWriter(path, schema) as writer:
+            for columns in batches:
+                arrays = [pa.array(values, type=schema.field(i).type) for i, values in enumerate(columns)]
+                writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+                rows += len(columns[0])
+                row_groups += 1
+        return rows, row_groups
+
+    def _write_csv(self, batches: Iterator[List[List[Any]]], path: str) -> Tuple[int, int]:
+        """CSV fallback: same columns, rows flushed batch by batch."""
+        time_index = EXECUTION_COLUMNS.index('execution_time')
+        rows = row_groups = 0
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(EXECUTION_COLUMNS)
+            for columns in batches:
+                columns[time_index] = [t.isoformat() for t in columns[time_index]]
+                writer.writerows(zip(*columns))
+                rows += len(columns[0])
+                row_groups += 1
+        return rows, row_groups
+
+    @staticmethod
+    def _arrow_schema() -> Any:
+        """Arrow schema matching EXECUTION_COLUMNS."""
+        typed_columns = {'execution_time': pa.timestamp('us'), 'quality_score': pa.float64()}
+        return pa.schema([(name, typed_columns.get(name, pa.string())) for name in EXECUTION_COLUMNS])
+
+
+# Global execution exporter instance
+execution_exporter = ExecutionExporter()
@@ -4,9 +4,11 @@ Simple working implementation for portfolio demonstration
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Sequence, Tuple, Union
 import json
+import math
 from datetime import datetime
+import numpy as np
 
 
 @dataclass
@@ -20,6 +22,177 @@ class FinancialMetrics:
     free_cash_flow_margin: float = 0.0
 
 
+FINANCIAL_COMPONENTS = ('revenue_growth', 'profitability', 'liquidity', 'leverage',
+                        'efficiency', 'cash_generation')
+
+DEFAULT_STRATEGIC_FACTORS = {
+    'market_expansion': 5.0,
+    'product_synergies': 5.0,
+    'cost_synergies': 5.0,
+    'technology_capabilities': 5.0,
+    'customer_base_overlap': 5.0,
+    'cultural_alignment': 5.0
+}
+
+DEFAULT_RISK_FACTORS = {
+    'integration_complexity': 5.0,
+    'regulatory_hurdles': 5.0,
+    'customer_retention': 5.0,
+    'key_person_dependency': 5.0,
+    'technology_obsolescence': 5.0,
+    'market_competition': 5.0
+}
+
+
+@dataclass
+class DCFAssumptions:
+    """
+    Discounted cash flow assumptions for a target.
+    
+    Means left as None are derived from the target: growth from the 3-year
+    revenue CAGR and margin from EBITDA / revenue. Standard deviations drive
+    the Monte Carlo; the point estimate uses the means only.
+    """
+    years: int = 5
+    revenue_growth: Optional[float] = None
+    revenue_growth_std: float = 0.03
+    ebitda_margin: Optional[float] = None
+    ebitda_margin_std: float = 0.03
+    wacc: float = 0.10
+    wacc_std: float = 0.015
+    exit_multiple: float = 10.0  # EV / terminal-year EBITDA
+    exit_multiple_std: float = 1.5
+
+
+REVENUE_SYNERGY_FACTORS = ('market_expansion', 'product_synergies', 'customer_base_overlap')
+
+
+@dataclass
+class SynergyAssumptions:
+    """
+    Synergy realization scenario.
+    
+    Run-rate synergies are fractions of target revenue at full realization and
+    ramp linearly over ``ramp_years``; revenue synergies earn the target's
+    EBITDA margin. Integration costs are a multiple of run-rate synergies,
+    spread over the ramp. ``weight`` is the scenario's probability.
+    """
+    weight: float = 1.0
+    cost_synergy_rate: float = 0.05
+    revenue_synergy_rate: float = 0.08
+    cost_realization: float = 0.85
+    cost_realization_std: float = 0.15
+    revenue_realization: float = 0.60
+    revenue_realization_std: float = 0.25
+    integration_cost_multiple: float = 1.0
+    integration_cost_overrun_std: float = 0.30
+    ramp_years: int = 3
+    years: int = 5
+    discount_rate: float = 0.10
+    challenge_penalty: float = 0.08  # Realization lost per integration challenge
+
+
+DEFAULT_SYNERGY_SCENARIOS = {
+    'downside': SynergyAssumptions(weight=0.25, cost_realization=0.65, revenue_realization=0.35,
+                                   integration_cost_multiple=1.4, ramp_years=4),
+    'base': SynergyAssumptions(weight=0.50),
+    'upside': SynergyAssumptions(weight=0.25, cost_realization=0.95, revenue_realization=0.80,
+                                 integration_cost_multiple=0.8, ramp_years=2)
+}
+
+
+@dataclass
+class AcquisitionTarget:
+    """Inputs for one acquisition target."""
+    name: str
+    deal_value: float
+    financial_metrics: FinancialMetrics
+    strategic_factors: Dict[str, float] = field(default_factory=dict)
+    risk_factors: Dict[str, float] = field(default_factory=dict)
+    revenue: float = 100.0
+    ebitda: float = 20.0
+
+
+@dataclass
+class TargetTable:
+    """
+    Column-oriented acquisition pipeline: one row per target.
+    
+    Factor columns are the default factors followed by any custom factors
+    seen in the batch; a target without a custom factor holds NaN there, so
+    row means match the single-target scores.
+    """
+    names: List[str]
+    deal_value: np.ndarray
+    revenue: np.ndarray
+    ebitda: np.ndarray
+    financial: np.ndarray  # (targets x 6) FinancialMetrics fields in declaration order
+    strategic: np.ndarray  # (targets x len(strategic_keys))
+    risk: np.ndarray  # (targets x len(risk_keys))
+    strategic_keys: List[str] = field(default_factory=lambda: list(DEFAULT_STRATEGIC_FACTORS))
+    risk_keys: List[str] = field(default_factory=lambda: list(DEFAULT_RISK_FACTORS))
+    
+    @classmethod
+    def from_targets(cls, targets: Sequence[AcquisitionTarget]) -> 'TargetTable':
+        """Build the table, filling missing default factors with the defaults."""
+        strategic_keys, strategic = _factor_columns([t.strategic_factors for t in targets],
+                                                    DEFAULT_STRATEGIC_FACTORS)
+        risk_keys, risk = _factor_columns([t.risk_factors for t in targets], DEFAULT_RISK_FACTORS)
+        return cls(
+            names=[t.name for t in targets],
+            deal_value=np.array([t.deal_value for t in targets], dtype=float),
+            revenue=np.array([t.revenue for t in targets], dtype=float),
+            ebitda=np.array([t.ebitda for t in targets], dtype=float),
+            financial=np.array([[m.revenue_3yr_cagr, m.ebitda_margin, m.debt_to_equity, m.current_ratio,
+                                 m.roe, m.free_cash_flow_margin]
+                                for m in (t.financial_metrics for t in targets)], dtype=float).reshape(-1, 6),
+            strategic=strategic,
+            risk=risk,
+            strategic_keys=strategic_keys,
+            risk_keys=risk_keys
+        )
+    
+    def __len__(self) -> int:
+        return len(self.names)
+    
+    def strategic_factors(self, i: int) -> Dict[str, float]:
+        """Strategic factors of row ``i``, without custom factors it does not set."""
+        return _row_factors(self.strategic_keys, self.strategic[i])
+    
+    def risk_factors(self, i: int) -> Dict[str, float]:
+        """Risk factors of row ``i``, without custom factors it does not set."""
+        return _row_factors(self.risk_keys, self.risk[i])
+    
+    def target(self, i: int) -> AcquisitionTarget:
+        """Rebuild row ``i`` as an AcquisitionTarget."""
+        return AcquisitionTarget(
+            name=self.names[i],
+            deal_value=float(self.deal_value[i]),
+            financial_metrics=FinancialMetrics(*self.financial[i].tolist()),
+            strategic_factors=self.strategic_factors(i),
+            risk_factors=self.risk_factors(i),
+            revenue=float(self.revenue[i]),
+            ebitda=float(self.ebitda[i])
+        )
+
+
+def _factor_columns(rows: List[Dict[str, float]],
+                    defaults: Dict[str, float]) -> Tuple[List[str], np.ndarray]:
+    """Union of factor keys (defaults first) and the (rows x keys) matrix; NaN where unset."""
+    keys = list(defaults)
+    for row in rows:
+        keys.extend(k for k in row if k not in defaults and k not in keys)
+    fill = [defaults.get(k, np.nan) for k in keys]
+    matrix = np.array([[row.get(k, f) for k, f in zip(keys, fill)] for row in rows],
+                      dtype=float).reshape(-1, len(keys))
+    return keys, matrix
+
+
+def _row_factors(keys: List[str], values: np.ndarray) -> Dict[str, float]:
+    """Factor dict for one table row, skipping NaN (unset custom) entries."""
+    return {k: v for k, v in zip(keys, values.tolist()) if not math.isnan(v)}
+
+
 @dataclass
 class DueDiligenceReport:
     """Due diligence analysis report."""
@@ -34,6 +207,14 @@ class DueDiligenceReport:
     synergies: List[str] = field(default_factory=list)
 
 
+@dataclass
+class ScreeningResult:
+    """Ranked shortlist from batch screening."""
+    shortlist: List[DueDiligenceReport]
+    overall_scores: Dict[str, float]
+    rejected: List[str]
+
+
 class AcquisitionDueDiligenceAnalyzer:
     """Analyze acquisition targets with financial and strategic assessment."""
     
@@ -64,17 +245,8 @@ class AcquisitionDueDiligenceAnalyzer:
     
     def assess_strategic_fit(self, strategic_factors: Dict[str, float]) -> Dict[str, Any]:
         """Assess strategic alignment and synergy potential."""
-        default_factors = {
-            'market_expansion': 5.0,
-            'product_synergies': 5.0,
-            'cost_synergies': 5.0,
-            'technology_capabilities': 5.0,
-            'customer_base_overlap': 5.0,
-            'cultural_alignment': 5.0
-        }
-        
         # Use provided factors or defaults
-        factors = {**default_factors, **strategic_factors}
+        factors = {**DEFAULT_STRATEGIC_FACTORS, **strategic_factors}
         strategic_score = sum(factors.values()) / len(factors)
         
         return {
@@ -85,16 +257,7 @@ class AcquisitionDueDiligenceAnalyzer:
     
     def evaluate_risks(self, risk_factors: Dict[str, float]) -> Dict[str, Any]:
         """Evaluate acquisition risks and red flags."""
-        default_risks = {
-            'integration_complexity': 5.0,
-            'regulatory_hurdles': 5.0,
-            'customer_retention': 5.0,
-            'key_person_dependency': 5.0,
-            'technology_obsolescence': 5.0,
-            'market_competition': 5.0
-        }
-        
-        risks = {**default_risks, **risk_factors}
+        risks = {**DEFAULT_RISK_FACTORS, **risk_factors}
         # Higher risk scores are worse, so invert for overall scoring
         risk_score = 10 - (sum(risks.values()) / len(risks))
         
@@ -114,8 +277,11 @@ class AcquisitionDueDiligenceAnalyzer:
         ebitda_multiple_low = 8.0
         ebitda_multiple_high = 12.0
         
-        # DCF approximation based on cash flow
-        dcf_value = ebitda * metrics.free_cash_flow_margin * 8  # 8x FCF multiple
+        # Multi-year DCF with exit-multiple terminal value
+        dcf_value = float(self._dcf_value(*self._dcf_inputs(
+            np.array([revenue]), np.array([ebitda]), np.array([metrics.revenue_3yr_cagr]),
+            np.array([metrics.ebitda_margin]), np.array([metrics.free_cash_flow_margin]),
+            DCFAssumptions()))[0])
         
         return {
             'revenue_based_low': revenue * revenue_multiple_low,
@@ -127,6 +293,73 @@ class AcquisitionDueDiligenceAnalyzer:
             'recommended_range_high': max(ebitda * ebitda_multiple_high, dcf_value * 1.1)
         }
     
+    @staticmethod
+    def _dcf_inputs(revenue: np.ndarray, ebitda: np.ndarray, cagr_pct: np.ndarray,
+                    ebitda_margin_pct: np.ndarray, fcf_margin_pct: np.ndarray,
+                    assumptions: DCFAssumptions) -> tuple:
+        """Mean DCF drivers per target: revenue, growth, margin, cash conversion, WACC, multiple, years."""
+        growth = (np.full(len(revenue), assumptions.revenue_growth) if assumptions.revenue_growth is not None
+                  else cagr_pct / 100)
+        if assumptions.ebitda_margin is not None:
+            margin = np.full(len(revenue), assumptions.ebitda_margin)
+        else:
+            margin = np.where(revenue > 0, ebitda / np.where(revenue > 0, revenue, 1.0), ebitda_margin_pct / 100)
+        # Share of EBITDA that becomes free cash flow
+        conversion = np.where(ebitda_margin_pct > 0,
+                              np.clip(fcf_margin_pct / np.where(ebitda_margin_pct > 0, ebitda_margin_pct, 1.0), 0, 1),
+                              0.5)
+        return (revenue, growth, margin, conversion, np.full(len(revenue), assumptions.wacc),
+                np.full(len(revenue), assumptions.exit_multiple), assumptions.years)
+    
+    @staticmethod
+    def _dcf_value(revenue: np.ndarray, growth: np.ndarray, margin: np.ndarray, conversion: np.ndarray,
+                   wacc: np.ndarray, exit_multiple: np.ndarray, years: int) -> np.ndarray:
+        """Enterprise value: discounted free cash flow plus discounted exit value, element-wise."""
+        t = np.arange(1, years + 1)
+        discount = (1 + wacc[..., None]) ** -t
+        ebitda = revenue[..., None] * (1 + growth[..., None]) ** t * margin[..., None]
+        cash_flow_value = (ebitda * conversion[..., None] * discount).sum(axis=-1)
+        terminal_value = ebitda[..., -1] * exit_multiple * discount[..., -1]
+        return cash_flow_value + terminal_value
+    
+    def simulate_dcf(self, metrics: FinancialMetrics, revenue: float, ebitda: float,
+                     deal_value: float, assumptions: Optional[DCFAssumptions] = None,
+                     n_paths: int = 50_000, seed: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Monte Carlo DCF valuation distribution.
+        
+        Growth, margin, WACC and exit multiple are drawn per path from normal
+        distributions around the assumption means (WACC floored at 1%, margin
+        and multiple at 0) and every path is valued in one array operation.
+        """
+        assumptions = assumptions or DCFAssumptions()
+        rng = np.random.default_rng(seed)
+        revenue_0, growth, margin, conversion, wacc, multiple, years = self._dcf_inputs(
+            np.array([revenue]), np.array([ebitda]), np.array([metrics.revenue_3yr_cagr]),
+            np.array([metrics.ebitda_margin]), np.array([metrics.free_cash_flow_margin]), assumptions)
+        
+        values = self._dcf_value(
+            np.full(n_paths, revenue_0[0]),
+            growth[0] + assumptions.revenue_growth_std * rng.standard_normal(n_paths),
+            np.maximum(margin[0] + assumptions.ebitda_margin_std * rng.standard_normal(n_paths), 0.0),
+            np.full(n_paths, conversion[0]),
+            np.maximum(wacc[0] + assumptions.wacc_std * rng.standard_normal(n_paths), 0.01),
+            np.maximum(multiple[0] + assumptions.exit_multiple_std * rng.standard_normal(n_paths), 0.0),
+            years
+        )
+        
+        percentiles = np.quantile(values, [0.05, 0.10, 0.50, 0.90, 0.95])
+        return {
+            'paths': n_paths,
+            'seed': seed,
+            'base_case': float(self._dcf_value(revenue_0, growth, margin, conversion, wacc, multiple, years)[0]),
+            'mean': float(values.mean()),
+            'std': float(values.std()),
+            'percentiles': dict(zip(('p5', 'p10', 'p50', 'p90', 'p95'), percentiles.tolist())),
+            'deal_value': deal_value,
+            'probability_overpay': float((values < deal_value).mean())
+        }
+    
     def generate_comprehensive_report(self, 
                                     target_company: str,
                                     deal_value: float,
@@ -134,8 +367,15 @@ class AcquisitionDueDiligenceAnalyzer:
                                     strategic_factors: Dict[str, float] = None,
                                     risk_factors: Dict[str, float] = None,
                                     revenue: float = 100.0,
-                                    ebitda: float = 20.0) -> DueDiligenceReport:
-        """Generate comprehensive due diligence report."""
+                                    ebitda: float = 20.0,
+                                    simulate_synergies: bool = False,
+                                    seed: Optional[int] = None) -> DueDiligenceReport:
+        """
+        Generate comprehensive due diligence report.
+        
+        With ``simulate_synergies`` the NPV-of-synergies distribution is added
+        to the findings and its median extends the price the deal can justify.
+        """
         
         # Analyze each component
         financial_analysis = self.analyze_financial_metrics(financial_metrics)
@@ -150,15 +390,104 @@ class AcquisitionDueDiligenceAnalyzer:
             risk_analysis['overall_score'] * self.weight_risk
         )
         
-        # Generate recommendation
-        if overall_score >= 8.0 and deal_value <= valuation['recommended_range_high']:
-            recommendation = "STRONG BUY - Excellent strategic fit with attractive valuation"
-        elif overall_score >= 6.5 and deal_value <= valuation['recommended_range_high']:
-            recommendation = "BUY - Good opportunity with manageable risks"
+        synergy = (self.simulate_synergies(strategic_analysis, revenue, ebitda, seed=seed)
+                   if simulate_synergies else None)
+        
+        return self._compile_report(target_company, deal_value, overall_score, financial_analysis,
+                                    strategic_analysis, risk_analysis, valuation, synergy)
+    
+    def simulate_synergies(self, strategic_analysis: Dict[str, Any], revenue: float, ebitda: float,
+                           scenarios: Optional[Dict[str, SynergyAssumptions]] = None,
+                           n_paths: int = 10_000, seed: Optional[int] = None) -> Dict[str, Any]:
+        """
+        NPV-of-synergies distribution per scenario and probability-weighted overall.
+        
+        Cost synergies run at full rate when cost synergies are a strength of the
+        deal and half rate otherwise; revenue synergies scale with the share of
+        revenue synergy factors in ``synergy_potential``. Every entry in
+        ``integration_challenges`` lowers expected realization and raises
+        integration cost. All scenarios are simulated as one (scenarios x paths
+        x years) array.
+        """
+        scenarios = scenarios or DEFAULT_SYNERGY_SCENARIOS
+        names = list(scenarios)
+        specs = [scenarios[name] for name in names]
+        rng = np.random.default_rng(seed)
+        
+        def column(attribute: str) -> np.ndarray:
+            return np.array([getattr(spec, attribute) for spec in specs], dtype=float)[:, None]
+        
+        potential = set(strategic_analysis['synergy_potential'])
+        challenges = len(strategic_analysis['integration_challenges'])
+        cost_scale = 1.0 if 'cost_synergies' in potential else 0.5
+        revenue_scale = sum(factor in potential for factor in REVENUE_SYNERGY_FACTORS) / len(REVENUE_SYNERGY_FACTORS)
+        margin = ebitda / revenue if revenue > 0 else 0.0
+        shape = (len(specs), n_paths)
+        
+        penalty = column('challenge_penalty') * challenges
+        cost_realization = np.clip(column('cost_realization') - penalty
+                                   + column('cost_realization_std') * rng.standard_normal(shape), 0.0, 1.2)
+        revenue_realization = np.clip(column('revenue_realization') - penalty
+                                      + column('revenue_realization_std') * rng.standard_normal(shape), 0.0, 1.5)
+        cost_run_rate = revenue * column('cost_synergy_rate') * cost_scale
+        revenue_run_rate = revenue * column('revenue_synergy_rate') * revenue_scale * margin
+        overrun = np.exp(column('integration_cost_overrun_std') * rng.standard_normal(shape))
+        integration_cost = (column('integration_cost_multiple') * (1 + 0.25 * challenges)
+                            * (cost_run_rate + revenue_run_rate) * overrun)
+        
+        horizon = max(spec.years for spec in specs)
+        t = np.arange(1, horizon + 1)
+        ramp_years = column('ramp_years')
+        ramp = np.minimum(t / ramp_years, 1.0) * (t <= column('years'))
+        cost_spread = (t <= ramp_years) / ramp_years
+        discount = (1 + column('discount_rate')) ** -t
+        
+        yearly = ((cost_run_rate * cost_realization)[..., None] * ramp[:, None, :]
+                  + (revenue_run_rate * revenue_realization)[..., None] * ramp[:, None, :]
+                  - integration_cost[..., None] * cost_spread[:, None, :])
+        npv = (yearly * discount[:, None, :]).sum(axis=-1)
+        
+        def summarize(values: np.ndarray, weights: Optional[np.ndarray] = None) -> Dict[str, Any]:
+            order = np.argsort(values)
+            cumulative = np.cumsum(weights[order]) if weights is not None else np.arange(1, len(values) + 1)
+            cumulative = cumulative / cumulative[-1]
+            percentiles = values[order][np.searchsorted(cumulative, [0.10, 0.50, 0.90])]
+            return {
+                'mean': float(np.average(values, weights=weights)),
+                'npv_percentiles': dict(zip(('p10', 'p50', 'p90'), percentiles.tolist())),
+                'probability_negative': float(np.average(values < 0, weights=weights))
+            }
+        
+        weights = column('weight')[:, 0]
+        path_weights = np.repeat(weights / weights.sum() / n_paths, n_paths)
+        return {
+            'paths': n_paths,
+            'seed': seed,
+            'scenarios': {name: summarize(npv[i]) for i, name in enumerate(names)},
+            'overall': summarize(npv.ravel(), path_weights)
+        }
+    
+    def _recommendation(self, overall_score: float, deal_value: float, range_high: float) -> str:
+        """Map overall score and price against valuation to a recommendation."""
+        if overall_score >= 8.0 and deal_value <= range_high:
+            return "STRONG BUY - Excellent strategic fit with attractive valuation"
+        elif overall_score >= 6.5 and deal_value <= range_high:
+            return "BUY - Good opportunity with manageable risks"
         elif overall_score >= 5.0:
-            recommendation = "CONDITIONAL - Proceed with caution, negotiate better terms"
+            return "CONDITIONAL - Proceed with caution, negotiate better terms"
         else:
-            recommendation = "PASS - Too many risks and concerns"
+            return "PASS - Too many risks and concerns"
+    
+    def _compile_report(self, target_company: str, deal_value: float, overall_score: float,
+                        financial_analysis: Dict[str, Any], strategic_analysis: Dict[str, Any],
+                        risk_analysis: Dict[str, Any], valuation: Dict[str, float],
+                        synergy: Optional[Dict[str, Any]] = None) -> DueDiligenceReport:
+        """Assemble findings, red flags and the recommendation into a report."""
+        range_high = valuation['recommended_range_high']
+        if synergy:
+            # Median synergy value is the premium over standalone value the deal can carry
+            range_high += max(0.0, synergy['overall']['npv_percentiles']['p50'])
+        recommendation = self._recommendation(overall_score, deal_value, range_high)
         
         # Compile findings
         key_findings = []
@@ -166,12 +495,21 @@ class AcquisitionDueDiligenceAnalyzer:
             key_findings.append(f"Financial strengths: {', '.join(financial_analysis['strengths'])}")
         if strategic_analysis['synergy_potential']:
             key_findings.append(f"Synergy opportunities: {', '.join(strategic_analysis['synergy_potential'])}")
+        if synergy:
+            overall = synergy['overall']
+            key_findings.append(
+                f"Synergy NPV P10/P50/P90: {overall['npv_percentiles']['p10']:.1f} / "
+                f"{overall['npv_percentiles']['p50']:.1f} / {overall['npv_percentiles']['p90']:.1f}"
+            )
         
         red_flags = []
         if financial_analysis['concerns']:
             red_flags.extend([f"Financial concern: {concern}" for concern in financial_analysis['concerns']])
         if risk_analysis['high_risks']:
             red_flags.extend([f"High risk: {risk}" for risk in risk_analysis['high_risks']])
+        if synergy and synergy['overall']['probability_negative'] > 0.5:
+            red_flags.append(f"Synergies more likely than not to destroy value "
+                             f"({synergy['overall']['probability_negative']:.0%} chance of negative NPV)")
         
         synergies = strategic_analysis['synergy_potential']
         
@@ -187,6 +525,95 @@ class AcquisitionDueDiligenceAnalyzer:
             synergies=synergies
         )
     
+    def score_targets(self, table: TargetTable) -> Dict[str, np.ndarray]:
+        """Component, pillar and overall scores for every target in one vectorized pass."""
+        growth, margin, leverage, current_ratio, roe, fcf_margin = table.financial.T
+        components = np.clip(np.column_stack([
+            growth * 2, margin * 0.5, current_ratio * 5, 10 - leverage * 2, roe * 0.5, fcf_margin * 0.4
+        ]), 0, 10)
+        financial_score = components.mean(axis=1)
+        # NaN marks custom factors a target does not set; default columns are always filled
+        strategic_score = np.nanmean(table.strategic, axis=1)
+        risk_score = 10 - np.nanmean(table.risk, axis=1)
+        
+        return {
+            'financial_components': components,
+            'financial_score': financial_score,
+            'strategic_score': strategic_score,
+            'risk_score': risk_score,
+            'overall_score': (financial_score * self.weight_financial +
+                              strategic_score * self.weight_strategic +
+                              risk_score * self.weight_risk)
+        }
+    
+    def valuation_ranges(self, table: TargetTable) -> Dict[str, np.ndarray]:
+        """Bulk version of ``calculate_valuation_range``."""
+        revenue, ebitda = table.revenue, table.ebitda
+        dcf_value = self._dcf_value(*self._dcf_inputs(
+            revenue, ebitda, table.financial[:, 0], table.financial[:, 1], table.financial[:, 5],
+            DCFAssumptions()))
+        return {
+            'revenue_based_low': revenue * 2.0,
+            'revenue_based_high': revenue * 4.0,
+            'ebitda_based_low': ebitda * 8.0,
+            'ebitda_based_high': ebitda * 12.0,
+            'dcf_estimate': dcf_value,
+            'recommended_range_low': np.minimum(ebitda * 8.0, dcf_value * 0.9),
+            'recommended_range_high': np.maximum(ebitda * 12.0, dcf_value * 1.1)
+        }
+    
+    def screen_targets(self, targets: Union[TargetTable, Sequence[AcquisitionTarget]],
+                       shortlist_size: Optional[int] = None) -> ScreeningResult:
+        """
+        Score a whole pipeline and report on the best targets only.
+        
+        Targets whose recommendation would be PASS are rejected from the
+        scores alone; the rest are ranked by overall score and full reports
+        are compiled only for the ``shortlist_size`` best.
+        """
+        table = targets if isinstance(targets, TargetTable) else TargetTable.from_targets(targets)
+        scores = self.score_targets(table)
+        valuation = self.valuation_ranges(table)
+        overall = scores['overall_score']
+        
+        passed = overall >= 5.0
+        ranked = np.flatnonzero(passed)[np.argsort(-overall[passed], kind='stable')]
+        if shortlist_size is not None:
+            ranked = ranked[:shortlist_size]
+        
+        shortlist = []
+        for i in ranked.tolist():
+            components = dict(zip(FINANCIAL_COMPONENTS, scores['financial_components'][i].tolist()))
+            strategic = table.strategic_factors(i)
+            risks = table.risk_factors(i)
+            financial_analysis = {
+                'overall_score': float(scores['financial_score'][i]),
+                'component_scores': components,
+                'strengths': [k for k, v in components.items() if v >= 7],
+                'concerns': [k for k, v in components.items() if v < 5]
+            }
+            strategic_analysis = {
+                'overall_score': float(scores['strategic_score'][i]),
+                'synergy_potential': [k for k, v in strategic.items() if v >= 7],
+                'integration_challenges': [k for k, v in strategic.items() if v < 5]
+            }
+            risk_analysis = {
+                'overall_score': float(scores['risk_score'][i]),
+                'high_risks': [k for k, v in risks.items() if v >= 8],
+                'moderate_risks': [k for k, v in risks.items() if v >= 6 and v < 8],
+                'manageable_risks': [k for k, v in risks.items() if v < 6]
+            }
+            shortlist.append(self._compile_report(
+                table.names[i], float(table.deal_value[i]), float(overall[i]), financial_analysis,
+                strategic_analysis, risk_analysis, {k: float(v[i]) for k, v in valuation.items()}
+            ))
+        
+        return ScreeningResult(
+            shortlist=shortlist,
+            overall_scores=dict(zip(table.names, overall.tolist())),
+            rejected=[name for name, keep in zip(table.names, passed.tolist()) if not keep]
+        )
+    
     def export_report(self, report: DueDiligenceReport, filename: str = None) -> str:
         """Export report to JSON format."""
         if not filename:
@@ -261,7 +688,9 @@ def demo_usage():
         strategic_factors=strategic_factors,
         risk_factors=risk_factors,
         revenue=100.0,     # $100M revenue
-        ebitda=22.5        # $22.5M EBITDA
+        ebitda=22.5,       # $22.5M EBITDA
+        simulate_synergies=True,
+        seed=42
     )
     
     # Display results
@@ -289,6 +718,14 @@ def demo_usage():
         for synergy in report.synergies:
             print(f"  • {synergy}")
     
+    # Stochastic DCF
+    dcf = analyzer.simulate_dcf(target_metrics, revenue=100.0, ebitda=22.5, deal_value=250.0, seed=42)
+    print(f"\n💹 DCF Valuation ({dcf['paths']:,} paths):")
+    print(f"  Base case: ${dcf['base_case']:.1f}M")
+    print(f"  P10 / P50 / P90: ${dcf['percentiles']['p10']:.1f}M / ${dcf['percentiles']['p50']:.1f}M / "
+          f"${dcf['percentiles']['p90']:.1f}M")
+    print(f"  P(deal value > intrinsic value): {dcf['probability_overpay']:.1%}")
+    
     # Export report
     filename = analyzer.export_report(report)
     print(f"\n📄 Report exported to: {filename}")
@@ -4,10 +4,96 @@ Simple working implementation for portfolio demonstration
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple, Sequence, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from collections import Counter
+import bisect
+import heapq
 import json
+import math
+import os
+import subprocess
+import sys
 from datetime import datetime
-import pandas as pd
+
+
+@dataclass
+class ResponseCurve:
+    """
+    Concave spend-to-return curve for a budget category (both in dollars).
+    
+    Either piecewise-linear through ``points`` (spend, return), or parametric
+    ``max_return * (1 - exp(-spend / saturation))`` when no points are given.
+    """
+    points: List[Tuple[float, float]] = field(default_factory=list)
+    max_return: float = 0.0
+    saturation: float = 1.0
+    
+    def __post_init__(self):
+        if not self.points and (self.max_return <= 0 or self.saturation <= 0):
+            raise ValueError("Parametric response curves need positive max_return and saturation")
+    
+    @classmethod
+    def from_history(cls, spend: Sequence[float], returns: Sequence[float]) -> 'ResponseCurve':
+        """Fit the upper concave hull of historical (spend, return) observations."""
+        observed = sorted(zip(spend, returns))
+        if not observed or observed[0][0] > 0:
+            observed.insert(0, (0.0, 0.0))
+        
+        hull: List[Tuple[float, float]] = []
+        for x, y in observed:
+            if hull and x == hull[-1][0]:
+                if y <= hull[-1][1]:
+                    continue
+                hull.pop()
+            # Pop points that would make the curve convex
+            while len(hull) >= 2:
+                (x1, y1), (x2, y2) = hull[-2], hull[-1]
+                if (y2 - y1) * (x - x1) > (y - y1) * (x2 - x1):
+                    break
+                hull.pop()
+            hull.append((x, y))
+        
+        # Returns never fall with more spend: stop at the peak
+        peak = max(range(len(hull)), key=lambda i: hull[i][1])
+        return cls(points=hull[:peak + 1])
+    
+    def value(self, spend: float) -> float:
+        """Return generated by ``spend``."""
+        if not self.points:
+            return self.max_return * -math.expm1(-spend / self.saturation)
+        points = self.points
+        if spend <= points[0][0]:
+            return points[0][1]
+        for (x1, y1), (x2, y2) in zip(points, points[1:]):
+            if spend <= x2:
+                return y1 + (y2 - y1) * (spend - x1) / (x2 - x1)
+        return points[-1][1]
+    
+    def segments(self, lower: float, upper: float, resolution: int = 16) -> List[Tuple[float, float]]:
+        """
+        (slope, length) chords covering [lower, upper] in decreasing slope order.
+        
+        Piecewise curves are split exactly at their breakpoints; parametric
+        curves into ``resolution`` chords of equal return.
+        """
+        if upper <= lower:
+            return []
+        if self.points:
+            breaks = [lower] + [x for x, _ in self.points if lower < x < upper] + [upper]
+        else:
+            low, high = self.value(lower), self.value(upper)
+            breaks = [lower]
+            for k in range(1, resolution):
+                level = low + (high - low) * k / resolution
+                breaks.append(-self.saturation * math.log1p(-level / self.max_return))
+            breaks.append(upper)
+        
+        segments = []
+        for x1, x2 in zip(breaks, breaks[1:]):
+            if x2 > x1:
+                segments.append(((self.value(x2) - self.value(x1)) / (x2 - x1), x2 - x1))
+        return segments
 
 
 @dataclass
@@ -19,6 +105,10 @@ class BudgetCategory:
     roi: float = 0.0
     priority_score: float = 5.0
     cost_type: str = "variable"  # "fixed", "variable", "discretionary"
+    min_allocation: Optional[float] = None  # Hard floor as share of total budget
+    max_allocation: Optional[float] = None  # Hard ceiling as share of total budget
+    locked: bool = False  # Keep current allocation unchanged
+    response_curve: Optional[ResponseCurve] = None  # Diminishing returns; overrides roi when set
 
 
 @dataclass
@@ -32,12 +122,97 @@ class OptimizationResult:
     recommendations: List[str] = field(default_factory=list)
 
 
+@dataclass
+class BudgetNode:
+    """
+    Node in a budget hierarchy (company, division, department, ...).
+    
+    Leaf nodes hold cost-center categories whose allocations are shares of the
+    leaf's ``current_budget``; inner nodes hold children. ``min_budget`` and
+    ``max_budget`` constrain the dollars the parent may assign to the node.
+    """
+    name: str
+    children: List['BudgetNode'] = field(default_factory=list)
+    categories: List[BudgetCategory] = field(default_factory=list)
+    current_budget: float = 0.0
+    min_budget: Optional[float] = None
+    max_budget: Optional[float] = None
+    proposed_budget: float = 0.0
+    # Cached optimizer state: (base floor, floor) or None when stale, the
+    # (-slope, length, owner) chords merged from children or cost centers in
+    # fill order, the chords exposed to the parent (None: all merged chords),
+    # and the last assigned budget
+    _summary: Optional[Tuple[float, float]] = field(default=None, repr=False, compare=False)
+    _exposed: Optional[List[Tuple[float, float]]] = field(default=None, repr=False, compare=False)
+    _merged: Optional[List[Tuple[float, float, int]]] = field(default=None, repr=False, compare=False)
+    _merged_length: float = field(default=0.0, repr=False, compare=False)
+    _merged_children: int = field(default=-1, repr=False, compare=False)
+    _leaf_chords: Optional[Tuple[float, List[Tuple[float, float, int]]]] = field(
+        default=None, repr=False, compare=False)
+    _assigned: Optional[float] = field(default=None, repr=False, compare=False)
+    _returns: Tuple[float, float] = field(default=(0.0, 0.0), repr=False, compare=False)
+    
+    def iter_leaves(self) -> Iterator['BudgetNode']:
+        if not self.children:
+            yield self
+        for child in self.children:
+            yield from child.iter_leaves()
+    
+    def find(self, path: Sequence[str]) -> List['BudgetNode']:
+        """Nodes from this one down to ``path`` (names below this node)."""
+        nodes = [self]
+        for name in path:
+            nodes.append(next(child for child in nodes[-1].children if child.name == name))
+        return nodes
+
+
+@dataclass
+class HierarchicalOptimizationResult:
+    """Budget hierarchy optimization result."""
+    total_budget: float
+    allocated_budget: float
+    node_budgets: Dict[str, float]
+    reoptimized: List[str]
+    efficiency_gain: float
+
+
+class DashboardTable:
+    """Column-oriented table for dashboard output; pandas is only imported on request."""
+    
+    def __init__(self, columns: Dict[str, List[Any]]):
+        self.columns = columns
+    
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()), []))
+    
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Rows as a list of dicts."""
+        names = list(self.columns)
+        return [dict(zip(names, row)) for row in zip(*self.columns.values())]
+    
+    def to_dataframe(self) -> Any:
+        """Build a pandas DataFrame (imports pandas lazily)."""
+        import pandas as pd
+        return pd.DataFrame(self.columns)
+    
+    def to_string(self, index: bool = False, float_format: str = '%.1f') -> str:
+        """Plain-text rendering with right-aligned columns."""
+        cells = [[name] + [float_format % v if isinstance(v, float) else str(v) for v in values]
+                 for name, values in self.columns.items()]
+        if index:
+            cells.insert(0, [''] + [str(i) for i in range(len(self))])
+        widths = [max(len(cell) for cell in column) for column in cells]
+        return '\n'.join(' '.join(column[row].rjust(width) for column, width in zip(cells, widths))
+                         for row in range(len(self) + 1))
+
+
 class BudgetOptimizationAdvisor:
     """Optimize budget allocation across categories for maximum ROI."""
     
     def __init__(self):
         self.min_allocation_threshold = 0.01  # Minimum 1% allocation
         self.max_reallocation = 0.15  # Maximum 15% reallocation from any category
+        self.max_increase = 0.50  # Maximum 50% increase for any category (optimizer methods)
     
     def calculate_efficiency_score(self, category: BudgetCategory) -> float:
         """Calculate efficiency score for a budget category."""
@@ -81,14 +256,413 @@ class BudgetOptimizationAdvisor:
         
         return opportunities
     
+    def allocation_bounds(self, categories: List[BudgetCategory]) -> Tuple[List[float], List[float]]:
+        """
+        Lower and upper allocation share per category.
+        
+        Fixed-cost and locked categories keep their current share. Others may
+        lose at most ``max_reallocation`` and gain at most ``max_increase`` of
+        their current share, never fall below ``min_allocation_threshold``, and
+        respect their own min/max; an explicit ``max_allocation`` replaces the
+        increase cap.
+        """
+        lower, upper = [], []
+        for category in categories:
+            current = category.current_allocation
+            if category.locked or category.cost_type == "fixed":
+                low = high = current
+            else:
+                low = max(current * (1 - self.max_reallocation), min(current, self.min_allocation_threshold))
+                high = min(1.0, current * (1 + self.max_increase))
+                if category.min_allocation is not None:
+                    low = max(low, category.min_allocation)
+                if category.max_allocation is not None:
+                    high = category.max_allocation
+            if low > high + 1e-12:
+                raise ValueError(f"Allocation bounds for {category.name} are infeasible")
+            lower.append(low)
+            upper.append(max(low, high))
+        return lower, upper
+    
+    @staticmethod
+    def solve_allocation(weights: Sequence[float], lower: Sequence[float], upper: Sequence[float],
+                         budget: float = 1.0, solver: str = "greedy") -> List[float]:
+        """
+        Maximize ``sum(w * x)`` subject to ``sum(x) <= budget`` and ``lower <= x <= upper``.
+        
+        With a single budget row and box bounds the LP is a continuous knapsack,
+        so the default greedy solver (fill the highest weights first) is exact
+        and runs in O(n log n). ``solver="scipy"`` solves the same LP with
+        scipy's HiGHS backend when scipy is installed.
+        """
+        if sum(lower) > budget + 1e-9:
+            raise ValueError("Minimum allocations exceed the total budget")
+        
+        if solver == "scipy":
+            try:
+                from scipy.optimize import linprog
+            except ImportError as e:
+                raise ImportError("scipy is required for solver='scipy'; use solver='greedy'") from e
+            solution = linprog([-w for w in weights], A_ub=[[1.0] * len(weights)], b_ub=[budget],
+                               bounds=list(zip(lower, upper)), method="highs")
+            if not solution.success:
+                raise ValueError(f"Budget optimization failed: {solution.message}")
+            return solution.x.tolist()
+        if solver != "greedy":
+            raise ValueError(f"Unknown solver: {solver}")
+        
+        allocation = list(lower)
+        remaining = budget - sum(lower)
+        for i in sorted(range(len(weights)), key=weights.__getitem__, reverse=True):
+            if remaining <= 0 or weights[i] <= 0:
+                break
+            increase = min(upper[i] - lower[i], remaining)
+            allocation[i] += increase
+            remaining -= increase
+        return allocation
+    
     def optimize_allocation(self, categories: List[BudgetCategory], 
-                          total_budget: float) -> OptimizationResult:
-        """Optimize budget allocation across categories."""
+                          total_budget: float, method: str = "heuristic",
+                          solver: str = "greedy") -> OptimizationResult:
+        """
+        Optimize budget allocation across categories.
+        
+        ``method="heuristic"`` (default) keeps the original efficiency-score
+        rebalancing. ``method="lp"`` maximizes priority-weighted ROI under the
+        total budget, category bounds, fixed-cost locks and the reallocation and
+        increase caps; ``method="marginal"`` does the same with each category's
+        response curve by equalizing marginal ROI.
+        """
         
         # Calculate current efficiency scores
         for category in categories:
             category.efficiency_score = self.calculate_efficiency_score(category)
         
+        if method == "heuristic":
+            return self._heuristic_allocation(categories, total_budget)
+        if method == "lp":
+            lower, upper = self.allocation_bounds(categories)
+            proposed = self.solve_allocation([self.weighted_roi(c) for c in categories], lower, upper,
+                                             budget=1.0, solver=solver)
+        elif method == "marginal":
+            proposed = self.allocate_by_marginal_roi(categories, total_budget)
+        else:
+            raise ValueError(f"Unknown optimization method: {method}")
+        
+        reallocated = 0.0
+        for category, allocation in zip(categories, proposed):
+            category.proposed_allocation = allocation
+            reallocated += max(0.0, category.current_allocation - allocation)
+        unallocated = max(0.0, sum(c.current_allocation for c in categories) - sum(proposed))
+        
+        return OptimizationResult(
+            total_budget=total_budget,
+            categories=categories,
+            savings_identified=unallocated * total_budget,
+            reallocation_amount=reallocated * total_budget,
+            efficiency_gain=self._calculate_efficiency_gain(categories, total_budget),
+            recommendations=self._generate_recommendations(categories, total_budget, method)
+        )
+    
+    @staticmethod
+    def weighted_roi(category: BudgetCategory) -> float:
+        """ROI scaled by priority (0-10), the objective weight of ``method="lp"``."""
+        return category.roi * category.priority_score / 10
+    
+    def allocate_by_marginal_roi(self, categories: List[BudgetCategory], total_budget: float,
+                                 algorithm: str = "water", increment: Optional[float] = None,
+                                 resolution: int = 16) -> List[float]:
+        """
+        Allocation shares that equalize marginal ROI across categories.
+        
+        Every category starts at its lower bound. ``algorithm="water"`` splits
+        each curve into decreasing-slope chords and fills the remaining budget
+        from the steepest chord down (exact for piecewise curves, O(n log n)).
+        ``algorithm="heap"`` hands out fixed ``increment`` dollars (default
+        0.1% of the budget) to the category with the best marginal return.
+        Categories without a curve have a constant marginal ROI of ``roi``.
+        """
+        lower, upper = self.allocation_bounds(categories)
+        spend = [share * total_budget for share in lower]
+        limit = [share * total_budget for share in upper]
+        remaining = total_budget - sum(spend)
+        if remaining < -1e-9 * total_budget:
+            raise ValueError("Minimum allocations exceed the total budget")
+        
+        if algorithm == "water":
+            chords = []
+            for i, category in enumerate(categories):
+                curve = category.response_curve
+                if curve is None:
+                    pieces = [(category.roi, limit[i] - spend[i])] if limit[i] > spend[i] else []
+                else:
+                    pieces = curve.segments(spend[i], limit[i], resolution)
+                chords.extend((slope, length, i) for slope, length in pieces)
+            chords.sort(key=lambda chord: chord[0], reverse=True)
+            
+            for slope, length, i in chords:
+                if remaining <= 0 or slope <= 0:
+                    break
+                step = min(length, remaining)
+                spend[i] += step
+                remaining -= step
+        
+        elif algorithm == "heap":
+            increment = increment or total_budget * 0.001
+            
+            def gain(i: int) -> Tuple[float, float]:
+                step = min(increment, limit[i] - spend[i])
+                curve = categories[i].response_curve
+                if curve is None:
+                    return categories[i].roi, step
+                return (curve.value(spend[i] + step) - curve.value(spend[i])) / step, step
+            
+            heap = []
+            for i in range(len(categories)):
+                if limit[i] > spend[i]:
+                    rate, step = gain(i)
+                    heap.append((-rate, i, step))
+            heapq.heapify(heap)
+            
+            while heap and remaining > 0:
+                rate, i, step = heapq.heappop(heap)
+                if rate >= 0:
+                    break
+                step = min(step, remaining)
+                spend[i] += step
+                remaining -= step
+                if limit[i] - spend[i] > 1e-9:
+                    rate, step = gain(i)
+                    heapq.heappush(heap, (-rate, i, step))
+        
+        else:
+            raise ValueError(f"Unknown marginal allocation algorithm: {algorithm}")
+        
+        return [amount / total_budget for amount in spend]
+    
+    def optimize_hierarchy(self, root: BudgetNode, total_budget: float,
+                           max_workers: Optional[int] = 1) -> HierarchicalOptimizationResult:
+        """
+        Allocate ``total_budget`` down a budget tree by equalizing marginal ROI.
+        
+        Bottom-up, every subtree is summarized as its mandatory floor plus a
+        decreasing-slope list of (marginal ROI, capacity) chords, merged from
+        its children and trimmed by the node's own min/max budget. Leaf
+        summaries are built in a process pool when ``max_workers`` is not 1.
+        Top-down, each node fills its chords with the budget passed from its
+        parent, which fixes every child's budget, so totals reconcile exactly.
+        
+        Summaries and assignments are cached on the nodes: after
+        ``mark_changed`` only the changed leaves are re-summarized, each
+        ancestor swaps just the changed chords in its merged list, and only
+        subtrees whose assigned budget moved are re-allocated.
+        """
+        stale = [leaf for leaf in root.iter_leaves() if leaf._summary is None]
+        if max_workers == 1 or len(stale) <= 1:
+            for leaf, summary in zip(stale, map(_leaf_summary, [self] * len(stale), stale)):
+                leaf._leaf_chords = summary
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                chunksize = max(1, len(stale) // ((max_workers or 4) * 4))
+                for leaf, summary in zip(stale, executor.map(_leaf_summary, [self] * len(stale),
+                                                             stale, chunksize=chunksize)):
+                    leaf._leaf_chords = summary
+        self._summarize(root)
+        
+        _, floor = root._summary
+        if floor > total_budget + 1e-9:
+            raise ValueError("Minimum budgets exceed the total budget")
+        budget, remaining = floor, total_budget - floor
+        chords = root._exposed if root._exposed is not None else (
+            (-negative_slope, length) for negative_slope, length, _ in root._merged)
+        for slope, length in chords:
+            if remaining <= 0 or slope <= 0:
+                break
+            step = min(length, remaining)
+            budget += step
+            remaining -= step
+        
+        node_budgets: Dict[str, float] = {}
+        reoptimized: List[str] = []
+        self._allocate(root, budget, root.name, node_budgets, reoptimized)
+        
+        current_return = proposed_return = 0.0
+        for leaf in root.iter_leaves():
+            current_return += leaf._returns[0]
+            proposed_return += leaf._returns[1]
+        
+        return HierarchicalOptimizationResult(
+            total_budget=total_budget,
+            allocated_budget=budget,
+            node_budgets=node_budgets,
+            reoptimized=reoptimized,
+            efficiency_gain=(proposed_return - current_return) / current_return * 100 if current_return > 0 else 0.0
+        )
+    
+    def mark_changed(self, root: BudgetNode, path: Sequence[str]) -> None:
+        """Invalidate cached summaries on the path to a node whose inputs changed."""
+        for node in root.find(path):
+            node._summary = None
+    
+    def _summarize(self, node: BudgetNode) -> Optional[Tuple[List[Tuple[float, float]], List[Tuple[float, float]]]]:
+        """
+        Refresh a stale node's summary; return its (removed, added) exposed chords.
+        
+        Each node keeps its children's exposed chords merged in fill order, so a
+        re-summarized child only has its own changed chords removed from and
+        inserted into its parent's list (O(changed * log n)). Nodes whose
+        min/max budget trims the list re-derive their exposed chords, and a
+        change in the number of children rebuilds the node. Returns None when
+        the cached summary was still valid.
+        """
+        if node._summary is not None:
+            return None
+        
+        if not node.children:
+            old = self._exposed_chords(node) if node._merged is not None else []
+            base_floor, chords = node._leaf_chords
+            node._leaf_chords = None
+            node._merged = sorted((-slope, length, i) for slope, length, i in chords)
+            node._merged_length = math.fsum(length for _, length, _ in chords)
+            self._trim(node, base_floor)
+            return _chord_diff(old, self._exposed_chords(node))
+        
+        child_diffs = [(i, self._summarize(child)) for i, child in enumerate(node.children)]
+        base_floor = sum(child._summary[1] for child in node.children)
+        rebuild = node._merged is None or node._merged_children != len(node.children)
+        
+        if rebuild:
+            old = self._exposed_chords(node) if node._merged is not None else []
+            node._merged = sorted((-slope, length, i) for i, child in enumerate(node.children)
+                                  for slope, length in self._exposed_chords(child))
+            node._merged_length = math.fsum(length for _, length, _ in node._merged)
+            node._merged_children = len(node.children)
+            self._trim(node, base_floor)
+            return _chord_diff(old, self._exposed_chords(node))
+        
+        changes = [(i, diff) for i, diff in child_diffs if diff and (diff[0] or diff[1])]
+        new_length = node._merged_length + sum(math.fsum(length for _, length in added) -
+                                               math.fsum(length for _, length in removed)
+                                               for _, (removed, added) in changes)
+        trimmed = node._exposed is not None or self._is_trimmed(node, base_floor, new_length)
+        old = self._exposed_chords(node) if trimmed else None
+        
+        merged = node._merged
+        for i, (removed, added) in changes:
+            for slope, length in removed:
+                del merged[bisect.bisect_left(merged, (-slope, length, i))]
+                node._merged_length -= length
+            for slope, length in added:
+                bisect.insort(merged, (-slope, length, i))
+                node._merged_length += length
+        self._trim(node, base_floor)
+        
+        if old is not None:
+            return _chord_diff(old, self._exposed_chords(node))
+        return ([chord for _, (removed, _) in changes for chord in removed],
+                [chord for _, (_, added) in changes for chord in added])
+    def _is_trimmed(self, node: BudgetNode, base_floor: float, length: float) -> bool:
+        """Whether the node's own min/max budget cuts into its merged chords."""
+        floor = max(base_floor, node.min_budget or 0.0)
+        return floor > base_floor or (node.max_budget is not None and node.max_budget - floor < length)
+    
+    def _trim(self, node: BudgetNode, base_floor: float) -> None:
+        """Apply the node's min/max budget to its merged chords and cache the summary."""
+        floor = max(base_floor, node.min_budget or 0.0)
+        capacity = node._merged_length - (floor - base_floor)
+        if node.max_budget is not None:
+            if node.max_budget < floor - 1e-9:
+                raise ValueError(f"Budget bounds for {node.name} are infeasible")
+            capacity = min(capacity, node.max_budget - floor)
+        
+        node._summary = (base_floor, floor)
+        node._assigned = None
+        if not self._is_trimmed(node, base_floor, node._merged_length):
+            node._exposed = None
+            return
+        
+        exposed = []
+        skip = floor - base_floor
+        for negative_slope, length, _ in node._merged:
+            if skip >= length:
+                skip -= length
+                continue
+            length -= skip
+            skip = 0.0
+            if capacity <= 0:
+                break
+            exposed.append((-negative_slope, min(length, capacity)))
+            capacity -= length
+        node._exposed = exposed
+    
+    @staticmethod
+    def _exposed_chords(node: BudgetNode) -> List[Tuple[float, float]]:
+        """(slope, length) chords the node offers its parent, in fill order."""
+        if node._exposed is not None:
+            return node._exposed
+        return [(-negative_slope, length) for negative_slope, length, _ in node._merged]
+    
+    def _allocate(self, node: BudgetNode, budget: float, path: str,
+                  node_budgets: Dict[str, float], reoptimized: List[str]) -> None:
+        """Split ``budget`` across the node's children (or cost centers) by filling its chords."""
+        node_budgets[path] = budget
+        if node._assigned is not None and abs(node._assigned - budget) <= 1e-9 * max(1.0, budget):
+            # Unchanged inputs and budget: cached allocations below are still optimal
+            for leaf_path, leaf_node in self._iter_paths(node, path):
+                node_budgets[leaf_path] = leaf_node.proposed_budget
+            return
+        node._assigned = budget
+        node.proposed_budget = budget
+        
+        base_floor = node._summary[0]
+        if node.children:
+            shares = [child._summary[1] for child in node.children]
+        else:
+            shares = self._leaf_bounds(node)[0]
+        remaining = budget - base_floor
+        for _, length, i in node._merged:
+            if remaining <= 0:
+                break
+            step = min(length, remaining)
+            shares[i] += step
+            remaining -= step
+        
+        if node.children:
+            for child, child_budget in zip(node.children, shares):
+                self._allocate(child, child_budget, f"{path}/{child.name}", node_budgets, reoptimized)
+        else:
+            current_return = proposed_return = 0.0
+            for category, spend in zip(node.categories, shares):
+                category.proposed_allocation = spend / node.current_budget if node.current_budget else 0.0
+                current_return += self.category_return(category, category.current_allocation, node.current_budget)
+                proposed_return += self.category_return(category, category.proposed_allocation, node.current_budget)
+            node._returns = (current_return, proposed_return)
+            reoptimized.append(path)
+    
+    def _iter_paths(self, node: BudgetNode, path: str) -> Iterator[Tuple[str, BudgetNode]]:
+        for child in node.children:
+            child_path = f"{path}/{child.name}"
+            yield child_path, child
+            yield from self._iter_paths(child, child_path)
+    
+    def _leaf_bounds(self, leaf: BudgetNode) -> Tuple[List[float], List[float]]:
+        """Cost-center bounds of a leaf in dollars."""
+        lower, upper = self.allocation_bounds(leaf.categories)
+        return ([share * leaf.current_budget for share in lower],
+                [share * leaf.current_budget for share in upper])
+    
+    @staticmethod
+    def category_return(category: BudgetCategory, share: float, total_budget: float) -> float:
+        """Dollar return of a category at the given budget share."""
+        spend = share * total_budget
+        if category.response_curve is not None:
+            return category.response_curve.value(spend)
+        return category.roi * spend
+    
+    def _heuristic_allocation(self, categories: List[BudgetCategory],
+                              total_budget: float) -> OptimizationResult:
+        """Trim low-efficiency categories and spread the pool over high-efficiency ones."""
+        
         # Sort by efficiency score (descending)
         sorted_categories = sorted(categories, 
                                  key=lambda x: x.efficiency_score, reverse=True)
@@ -131,7 +705,7 @@ class BudgetOptimizationAdvisor:
         recommendations = self._generate_recommendations(categories, total_budget)
         
         # Calculate metrics
-        efficiency_gain = self._calculate_efficiency_gain(categories)
+        efficiency_gain = self._calculate_efficiency_gain(categories, total_budget)
         
         return OptimizationResult(
             total_budget=total_budget,
@@ -143,7 +717,7 @@ class BudgetOptimizationAdvisor:
         )
     
     def _generate_recommendations(self, categories: List[BudgetCategory], 
-                                total_budget: float) -> List[str]:
+                                total_budget: float, method: str = "heuristic") -> List[str]:
         """Generate specific optimization recommendations."""
         recommendations = []
         
@@ -153,15 +727,23 @@ class BudgetOptimizationAdvisor:
             change = proposed_amount - current_amount
             
             if abs(change) > total_budget * 0.01:  # Only report changes > 1%
+                if method == "lp":
+                    reason = (f"{'high' if change > 0 else 'low'} priority-weighted ROI "
+                              f"of {self.weighted_roi(category):.1f}x")
+                elif method == "marginal":
+                    reason = f"{'higher' if change > 0 else 'lower'} marginal ROI than other categories"
+                else:
+                    reason = f"high ROI of {category.roi:.1f}x" if change > 0 else "low efficiency score"
+                
                 if change > 0:
                     recommendations.append(
                         f"Increase {category.name} budget by ${change:,.0f} "
-                        f"({change/current_amount*100:+.1f}%) due to high ROI of {category.roi:.1f}x"
+                        f"({change/current_amount*100:+.1f}%) due to {reason}"
                     )
                 else:
                     recommendations.append(
                         f"Reduce {category.name} budget by ${-change:,.0f} "
-                        f"({change/current_amount*100:.1f}%) due to low efficiency score"
+                        f"({change/current_amount*100:.1f}%) due to {reason}"
                     )
         
         # Add strategic recommendations
@@ -181,39 +763,56 @@ class BudgetOptimizationAdvisor:
         
         return recommendations
     
-    def _calculate_efficiency_gain(self, categories: List[BudgetCategory]) -> float:
+    def _calculate_efficiency_gain(self, categories: List[BudgetCategory],
+                                   total_budget: float = 1.0) -> float:
         """Calculate overall efficiency gain from optimization."""
-        current_weighted_roi = sum(c.current_allocation * c.roi for c in categories)
-        proposed_weighted_roi = sum(c.proposed_allocation * c.roi for c in categories)
+        current_weighted_roi = sum(self.category_return(c, c.current_allocation, total_budget)
+                                   for c in categories)
+        proposed_weighted_roi = sum(self.category_return(c, c.proposed_allocation, total_budget)
+                                    for c in categories)
         
         if current_weighted_roi > 0:
             return (proposed_weighted_roi - current_weighted_roi) / current_weighted_roi * 100
         return 0.0
     
-    def create_budget_dashboard(self, result: OptimizationResult) -> pd.DataFrame:
-        """Create budget comparison dashboard."""
-        data = []
+    def create_budget_dashboard(self, result: OptimizationResult, output: str = "table") -> Any:
+        """
+        Create budget comparison dashboard.
+        
+        ``output`` selects the container: "table" (DashboardTable, default),
+        "records" (list of dicts) or "pandas" (DataFrame, imports pandas).
+        """
+        columns: Dict[str, List[Any]] = {name: [] for name in (
+            'Category', 'Current_Allocation_$', 'Current_Allocation_%', 'Proposed_Allocation_$',
+            'Proposed_Allocation_%', 'Change_$', 'Change_%', 'ROI', 'Priority_Score',
+            'Efficiency_Score', 'Cost_Type'
+        )}
         
         for category in result.categories:
             current_amount = category.current_allocation * result.total_budget
             proposed_amount = category.proposed_allocation * result.total_budget
             change = proposed_amount - current_amount
             
-            data.append({
-                'Category': category.name,
-                'Current_Allocation_$': current_amount,
-                'Current_Allocation_%': category.current_allocation * 100,
-                'Proposed_Allocation_$': proposed_amount,
-                'Proposed_Allocation_%': category.proposed_allocation * 100,
-                'Change_$': change,
-                'Change_%': (change / current_amount * 100) if current_amount > 0 else 0,
-                'ROI': category.roi,
-                'Priority_Score': category.priority_score,
-                'Efficiency_Score': getattr(category, 'efficiency_score', 0),
-                'Cost_Type': category.cost_type
-            })
-        
-        return pd.DataFrame(data)
+            columns['Category'].append(category.name)
+            columns['Current_Allocation_$'].append(current_amount)
+            columns['Current_Allocation_%'].append(category.current_allocation * 100)
+            columns['Proposed_Allocation_$'].append(proposed_amount)
+            columns['Proposed_Allocation_%'].append(category.proposed_allocation * 100)
+            columns['Change_$'].append(change)
+            columns['Change_%'].append((change / current_amount * 100) if current_amount > 0 else 0)
+            columns['ROI'].append(category.roi)
+            columns['Priority_Score'].append(category.priority_score)
+            columns['Efficiency_Score'].append(getattr(category, 'efficiency_score', 0))
+            columns['Cost_Type'].append(category.cost_type)
+        
+        table = DashboardTable(columns)
+        if output == "table":
+            return table
+        if output == "records":
+            return table.to_records()
+        if output == "pandas":
+            return table.to_dataframe()
+        raise ValueError(f"Unknown dashboard output: {output}")
     
     def export_analysis(self, result: OptimizationResult, filename: str = None) -> str:
         """Export optimization analysis to JSON."""
@@ -252,6 +851,62 @@ class BudgetOptimizationAdvisor:
         return filename
 
 
+def _leaf_summary(advisor: BudgetOptimizationAdvisor, leaf: BudgetNode,
+                  resolution: int = 16) -> Tuple[float, List[Tuple[float, float, int]]]:
+    """Process-pool worker: floor and sorted (slope, length, category) chords of a leaf."""
+    lower, upper = advisor._leaf_bounds(leaf)
+    chords = []
+    for i, category in enumerate(leaf.categories):
+        if category.response_curve is None:
+            if upper[i] > lower[i]:
+                chords.append((category.roi, upper[i] - lower[i], i))
+        else:
+            chords.extend((slope, length, i) for slope, length
+                          in category.response_curve.segments(lower[i], upper[i], resolution))
+    chords.sort(key=lambda chord: -chord[0])
+    return sum(lower), chords
+
+
+def _chord_diff(old: List[Tuple[float, float]],
+                new: List[Tuple[float, float]]) -> Tuple[List[Tuple[float, float]], List[Tuple[float, float]]]:
+    """(removed, added) chords turning multiset ``old`` into ``new``."""
+    old_counts, new_counts = Counter(old), Counter(new)
+    return list((old_counts - new_counts).elements()), list((new_counts - old_counts).elements())
+
+
+def benchmark_import_time(runs: int = 5) -> Dict[str, Any]:
+    """
+    Cold-import cost of this module versus pandas, each in fresh interpreters.
+    
+    Also checks that importing the module does not pull pandas in.
+    """
+    module_dir = os.path.dirname(os.path.abspath(__file__))
+    probe = ("import sys, time; start = time.perf_counter(); import {module}; "
+             "print(time.perf_counter() - start, 'pandas' in sys.modules)")
+    
+    def cold_import(module: str) -> Tuple[float, bool]:
+        timings, loaded = [], False
+        for _ in range(runs):
+            completed = subprocess.run([sys.executable, "-c", probe.format(module=module)],
+                                       cwd=module_dir, capture_output=True, text=True, check=True)
+            seconds, pandas_loaded = completed.stdout.split()
+            timings.append(float(seconds))
+            loaded = pandas_loaded == "True"
+        return min(timings), loaded
+    
+    module_seconds, pandas_loaded = cold_import("budget_optimization_advisor")
+    try:
+        pandas_seconds, _ = cold_import("pandas")
+    except subprocess.CalledProcessError:
+        pandas_seconds = None
+    
+    return {
+        'module_import_seconds': module_seconds,
+        'pandas_import_seconds': pandas_seconds,
+        'pandas_loaded_on_import': pandas_loaded
+    }
+
+
 def demo_usage():
     """Demonstrate the budget optimization advisor."""
     print("💰 Budget Optimization Advisor Demo")
@@ -342,12 +997,9 @@ def demo_usage():
             print(f"  {i}. {rec}")
     
     # Create and display dashboard
-    try:
-        dashboard = advisor.create_budget_dashboard(result)
-        print(f"\n📋 Budget Dashboard:")
-        print(dashboard.to_string(index=False, float_format='%.1f'))
-    except ImportError:
-        print(f"\n📋 Budget Dashboard: (pandas not available for display)")
+    dashboard = advisor.create_budget_dashboard(result)
+    print(f"\n📋 Budget Dashboard:")
+    print(dashboard.to_string(index=False, float_format='%.1f'))
     
     # Export analysis
     filename = advisor.export_analysis(result)
@@ -355,4 +1007,7 @@ def demo_usage():
 
 
 if __name__ == "__main__":
-    demo_usage()
\ No newline at end of file
+    if "--benchmark" in sys.argv:
+        print(json.dumps(benchmark_import_time(), indent=2))
+    else:
+        demo_usage()
\ No newline at end of file
@@ -4,10 +4,14 @@ Simple working implementation for portfolio demonstration
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Callable, Iterator
 import json
 from datetime import datetime
 import math
+import sys
+import time
+import numpy as np
+from numpy.polynomial import polynomial as P
 
 
 @dataclass
@@ -29,6 +33,8 @@ class BenefitItem:
     category: str = "revenue"  # revenue, cost_savings, productivity
     recurring: bool = True
     confidence: float = 0.8  # 0-1 confidence level
+    amount_volatility: float = 0.0  # Std dev of amount as a fraction of amount (simulation only)
+    timing_std_months: float = 0.0  # Std dev of start month (simulation only)
 
 
 @dataclass
@@ -56,6 +62,8 @@ class CostBenefitAssessor:
         self.discount_rate = discount_rate
         self.analysis_period_months = analysis_period_years * 12
         self.monthly_discount_rate = discount_rate / 12
+        self._discount_cache: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._discount_cache_key: Optional[Tuple[float, int]] = None
     
     def calculate_present_value(self, future_value: float, months: int) -> float:
         """Calculate present value of future cash flow."""
@@ -63,82 +71,106 @@ class CostBenefitAssessor:
             return future_value
         return future_value / (1 + self.monthly_discount_rate) ** months
     
+    def discount_vectors(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Discount factors for months 0..N-1 and annuity factors for start months 0..N.
+        
+        ``annuity[t]`` is the PV of 1 per month from month t to the end of the
+        analysis period, in closed form. Both vectors are cached per rate/horizon.
+        """
+        key = (self.monthly_discount_rate, self.analysis_period_months)
+        if self._discount_cache_key != key:
+            months = np.arange(self.analysis_period_months + 1)
+            rate = self.monthly_discount_rate
+            if rate:
+                v = 1 / (1 + rate)
+                discount = v ** months
+                annuity = (discount - discount[-1]) / (1 - v)
+            else:
+                discount = np.ones(len(months))
+                annuity = (self.analysis_period_months - months).astype(float)
+            self._discount_cache = (discount[:-1], annuity)
+            self._discount_cache_key = key
+        return self._discount_cache
+    
+    def _line_item_pv(self, amounts: np.ndarray, timings: np.ndarray,
+                      recurring: np.ndarray) -> np.ndarray:
+        """Present value per line item; recurring items use closed-form annuity factors."""
+        months = self.analysis_period_months
+        discount, annuity = self.discount_vectors()
+        
+        # One-time items: discount factor lookup (undiscounted at or before month 0)
+        in_horizon = (timings > 0) & (timings < months)
+        one_time_factor = np.ones(len(amounts))
+        one_time_factor[in_horizon] = discount[timings[in_horizon]]
+        beyond = timings >= months
+        one_time_factor[beyond] = (1 + self.monthly_discount_rate) ** -timings[beyond].astype(float)
+        
+        # Recurring items: annuity from start month (months before 0 are undiscounted)
+        recurring_factor = annuity[np.clip(timings, 0, months)] + np.maximum(-timings, 0)
+        
+        return amounts * np.where(recurring, recurring_factor, one_time_factor)
+    
+    def _line_item_cash_flow(self, amounts: np.ndarray, timings: np.ndarray,
+                             recurring: np.ndarray) -> np.ndarray:
+        """
+        Combined monthly cash flow of the line items.
+        
+        Recurring items are added as step starts in a difference array that is
+        cumulated once, so cost is O(items + months).
+        """
+        months = self.analysis_period_months
+        cash_flow = np.zeros(months + 1)
+        starts = recurring & (timings < months)
+        np.add.at(cash_flow, np.clip(timings[starts], 0, months), amounts[starts])
+        cash_flow = np.cumsum(cash_flow[:months])
+        points = ~recurring & (timings >= 0) & (timings < months)
+        np.add.at(cash_flow, timings[points], amounts[points])
+        return cash_flow
+    
+    def _line_item_arrays(self, items: List[Any]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Amount, timing and recurring arrays for cost or benefit items."""
+        return (np.array([i.amount for i in items], dtype=float),
+                np.array([i.timing_months for i in items], dtype=int),
+                np.array([i.recurring for i in items], dtype=bool))
+    
     def analyze_costs(self, costs: List[CostItem]) -> Dict[str, Any]:
         """Analyze and categorize all costs."""
-        cost_analysis = {
-            'total_pv': 0.0,
-            'by_category': {},
-            'by_timing': {},
-            'cash_flow': [0.0] * self.analysis_period_months
-        }
+        amounts, timings, recurring = self._line_item_arrays(costs)
+        pv = self._line_item_pv(amounts, timings, recurring)
+        cash_flow = self._line_item_cash_flow(amounts, timings, recurring)
         
-        for cost in costs:
-            # Calculate present value
-            if cost.recurring:
-                # For recurring costs, calculate NPV of annuity
-                pv = 0.0
-                for month in range(cost.timing_months, self.analysis_period_months, 1):
-                    pv += self.calculate_present_value(cost.amount, month)
-            else:
-                pv = self.calculate_present_value(cost.amount, cost.timing_months)
-            
-            cost_analysis['total_pv'] += pv
-            
-            # Categorize costs
-            if cost.category not in cost_analysis['by_category']:
-                cost_analysis['by_category'][cost.category] = 0.0
-            cost_analysis['by_category'][cost.category] += pv
-            
-            # Track cash flow timing
-            if cost.timing_months < len(cost_analysis['cash_flow']):
-                if cost.recurring:
-                    for month in range(cost.timing_months, self.analysis_period_months, 1):
-                        if month < len(cost_analysis['cash_flow']):
-                            cost_analysis['cash_flow'][month] -= cost.amount
-                else:
-                    cost_analysis['cash_flow'][cost.timing_months] -= cost.amount
+        # Categorize costs
+        by_category: Dict[str, float] = {}
+        for cost, item_pv in zip(costs, pv.tolist()):
+            by_category[cost.category] = by_category.get(cost.category, 0.0) + item_pv
         
-        return cost_analysis
+        return {
+            'total_pv': float(pv.sum()),
+            'by_category': by_category,
+            'by_timing': {},
+            'cash_flow': (-cash_flow).tolist()
+        }
     
     def analyze_benefits(self, benefits: List[BenefitItem]) -> Dict[str, Any]:
         """Analyze and categorize all benefits."""
-        benefit_analysis = {
-            'total_pv': 0.0,
-            'risk_adjusted_pv': 0.0,
-            'by_category': {},
-            'by_timing': {},
-            'cash_flow': [0.0] * self.analysis_period_months
-        }
+        amounts, timings, recurring = self._line_item_arrays(benefits)
+        pv = self._line_item_pv(amounts, timings, recurring)
+        cash_flow = self._line_item_cash_flow(amounts, timings, recurring)
+        confidence = np.array([b.confidence for b in benefits], dtype=float)
         
-        for benefit in benefits:
-            # Calculate present value
-            if benefit.recurring:
-                pv = 0.0
-                for month in range(benefit.timing_months, self.analysis_period_months, 1):
-                    pv += self.calculate_present_value(benefit.amount, month)
-            else:
-                pv = self.calculate_present_value(benefit.amount, benefit.timing_months)
-            
-            risk_adjusted_pv = pv * benefit.confidence
-            
-            benefit_analysis['total_pv'] += pv
-            benefit_analysis['risk_adjusted_pv'] += risk_adjusted_pv
-            
-            # Categorize benefits
-            if benefit.category not in benefit_analysis['by_category']:
-                benefit_analysis['by_category'][benefit.category] = 0.0
-            benefit_analysis['by_category'][benefit.category] += pv
-            
-            # Track cash flow timing
-            if benefit.timing_months < len(benefit_analysis['cash_flow']):
-                if benefit.recurring:
-                    for month in range(benefit.timing_months, self.analysis_period_months, 1):
-                        if month < len(benefit_analysis['cash_flow']):
-                            benefit_analysis['cash_flow'][month] += benefit.amount
-                else:
-                    benefit_analysis['cash_flow'][benefit.timing_months] += benefit.amount
+        # Categorize benefits
+        by_category: Dict[str, float] = {}
+        for benefit, item_pv in zip(benefits, pv.tolist()):
+            by_category[benefit.category] = by_category.get(benefit.category, 0.0) + item_pv
         
-        return benefit_analysis
+        return {
+            'total_pv': float(pv.sum()),
+            'risk_adjusted_pv': float((pv * confidence).sum()),
+            'by_category': by_category,
+            'by_timing': {},
+            'cash_flow': cash_flow.tolist()
+        }
     
     def calculate_payback_period(self, cost_cash_flow: List[float], 
                                benefit_cash_flow: List[float]) -> int:
@@ -156,56 +188,171 @@ class CostBenefitAssessor:
     
     def calculate_irr(self, cost_cash_flow: List[float], 
                      benefit_cash_flow: List[float]) -> float:
-        """Calculate Internal Rate of Return (simplified)."""
-        # Combine cash flows
-        net_cash_flows = []
-        for i in range(len(cost_cash_flow)):
-            net_cash_flows.append(cost_cash_flow[i] + benefit_cash_flow[i])
+        """
+        Calculate Internal Rate of Return as an annualized percentage.
+        
+        Solves NPV(r) = 0 on the monthly net cash flows and annualizes the
+        monthly rate the same way discount_rate is converted (x 12). Returns
+        NaN when the cash flows never change sign and no IRR exists, so callers
+        can tell "no IRR" apart from a genuine 0% return.
+        """
+        net_cash_flows = np.asarray(cost_cash_flow, dtype=float) + np.asarray(benefit_cash_flow, dtype=float)
+        if net_cash_flows.size == 0:
+            return float('nan')
+        return float(self.calculate_irr_batch(net_cash_flows[None, :])[0])
+    
+    def calculate_irr_batch(self, net_cash_flows: np.ndarray, max_iterations: int = 50,
+                            tolerance: float = 1e-12) -> np.ndarray:
+        """
+        Annualized IRR percentages for a (projects x months) net cash-flow array.
+        
+        With x = 1 / (1 + r), NPV is the polynomial sum(cf_t * x^t). Newton's
+        method runs on all projects at once using NumPy polynomial evaluation of
+        the NPV and its derivative; projects that fail to converge fall back to
+        Brent's method on a bracketed monthly rate. Projects whose cash flows
+        never change sign get NaN.
+        """
+        cash_flows = np.atleast_2d(np.asarray(net_cash_flows, dtype=float))
+        coefficients = cash_flows.T  # (months x projects), lowest power first
+        derivative = P.polyder(coefficients, axis=0)
+        n_projects = cash_flows.shape[0]
+        
+        has_root = (cash_flows > 0).any(axis=1) & (cash_flows < 0).any(axis=1)
+        x = np.full(n_projects, 1 / (1 + 0.01))
+        converged = ~has_root
+        
+        for _ in range(max_iterations):
+            active = ~converged
+            if not active.any():
+                break
+            value = P.polyval(x[active], coefficients[:, active], tensor=False)
+            slope = P.polyval(x[active], derivative[:, active], tensor=False) if len(derivative) else np.zeros(active.sum())
+            with np.errstate(divide='ignore', invalid='ignore'):
+                step = np.where(slope != 0, value / slope, np.nan)
+            new_x = x[active] - step
+            x[active] = new_x
+            done = np.abs(step) <= tolerance * np.maximum(1.0, np.abs(new_x))
+            converged[np.flatnonzero(active)[done]] = True
+            # Diverged or left the searched domain (monthly r <= -99%): leave to Brent
+            invalid = ~np.isfinite(new_x) | (new_x <= 0) | (new_x >= 100)
+            converged[np.flatnonzero(active)[invalid]] = True
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            monthly_rate = 1 / x - 1
+        monthly_rate[~has_root] = np.nan
         
+        # Brent fallback for anything Newton did not settle
+        needs_fallback = has_root & (~np.isfinite(monthly_rate) | (x <= 0) | (x >= 100) |
+                                     (np.abs(P.polyval(x, coefficients, tensor=False)) >
+                                      1e-6 * np.maximum(np.abs(cash_flows).sum(axis=1), 1.0)))
+        for row in np.flatnonzero(needs_fallback):
+            monthly_rate[row] = self._bracketed_irr(coefficients[:, row])
+        
+        return monthly_rate * 12 * 100
+    
+    def _bracketed_irr(self, coefficients: np.ndarray) -> float:
+        """Monthly IRR by Brent's method on the sign change of NPV(r) nearest 0%; NaN if none."""
+        def npv(rate: float) -> float:
+            return float(P.polyval(1 / (1 + rate), coefficients))
+        
+        # Scan evenly in log(1 + r) so deeply negative rates (down to -99.9%) are as well covered as large ones
+        grid = np.unique(np.append(np.expm1(np.linspace(np.log(0.001), np.log(11.0), 240)), 0.0))
+        with np.errstate(over='ignore', invalid='ignore'):
+            values = P.polyval(1 / (1 + grid), coefficients)
+        crossings = np.flatnonzero((values[:-1] == 0) | (values[:-1] * values[1:] < 0))
+        if not len(crossings):
+            return float('nan')
+        i = crossings[np.argmin(np.minimum(np.abs(grid[crossings]), np.abs(grid[crossings + 1])))]
+        if values[i] == 0:
+            return float(grid[i])
+        return _brentq(npv, float(grid[i]), float(grid[i + 1]))
+    
+    def approximate_irr(self, cost_cash_flow: List[float],
+                        benefit_cash_flow: List[float]) -> float:
+        """Previous average-return IRR heuristic, kept for benchmarking against the exact solver."""
+        net_cash_flows = [c + b for c, b in zip(cost_cash_flow, benefit_cash_flow)]
         if not net_cash_flows or net_cash_flows[0] >= 0:
-            return 0.0  # No initial investment
+            return 0.0
         
-        # Simple IRR approximation using Newton's method
-        # For demo purposes, using simplified calculation
         total_costs = abs(sum(cf for cf in net_cash_flows if cf < 0))
         total_benefits = sum(cf for cf in net_cash_flows if cf > 0)
-        
         if total_costs == 0:
             return 0.0
         
-        # Approximate IRR based on average return
-        average_monthly_return = total_benefits / len([cf for cf in net_cash_flows if cf > 0]) if any(cf > 0 for cf in net_cash_flows) else 0
+        positive = [cf for cf in net_cash_flows if cf > 0]
+        average_monthly_return = total_benefits / len(positive) if positive else 0
         approximate_irr = (average_monthly_return / total_costs) * 12 * 100
-        
-        return min(100.0, max(-50.0, approximate_irr))  # Cap at reasonable range
+        return min(100.0, max(-50.0, approximate_irr))
     
     def perform_sensitivity_analysis(self, costs: List[CostItem], 
-                                   benefits: List[BenefitItem]) -> Dict[str, float]:
-        """Perform sensitivity analysis on key variables."""
-        base_result = self.assess_project(costs, benefits)
-        base_npv = base_result.npv
+                                   benefits: List[BenefitItem],
+                                   cost_analysis: Optional[Dict[str, Any]] = None,
+                                   benefit_analysis: Optional[Dict[str, Any]] = None) -> Dict[str, float]:
+        """
+        Perform sensitivity analysis on key variables.
+        
+        NPV changes are derived from the cost and benefit PV components (passed
+        in by assess_project, or computed once here) rather than by re-running
+        the full assessment for each case.
+        """
+        cost_analysis = cost_analysis or self.analyze_costs(costs)
+        benefit_analysis = benefit_analysis or self.analyze_benefits(benefits)
+        total_costs = cost_analysis['total_pv']
+        total_benefits = benefit_analysis['total_pv']
+        base_npv = total_benefits - total_costs
+        
+        def impact(npv_change: float) -> float:
+            return npv_change / base_npv * 100 if base_npv != 0 else 0
         
-        sensitivity = {}
+        # Delayed benefits: re-price benefit items three months later in one batch
+        amounts, timings, recurring = self._line_item_arrays(benefits)
+        delayed_benefits = float(self._line_item_pv(amounts, timings + 3, recurring).sum())
         
-        # Test cost increase
-        costs_high = [CostItem(c.description, c.amount * 1.2, c.timing_months, 
-                              c.category, c.recurring) for c in costs]
-        result_costs_high = self.assess_project(costs_high, benefits)
-        sensitivity['costs_+20%'] = (result_costs_high.npv - base_npv) / base_npv * 100 if base_npv != 0 else 0
+        return {
+            'costs_+20%': impact(-0.2 * total_costs),
+            'benefits_-20%': impact(-0.2 * total_benefits),
+            'benefits_delayed_3mo': impact(delayed_benefits - total_benefits)
+        }
+    
+    def tornado_analysis(self, costs: List[CostItem], benefits: List[BenefitItem],
+                         amount_flex: float = 0.20, timing_shift_months: int = 3) -> List[Dict[str, Any]]:
+        """
+        NPV range from flexing each line item's amount and timing on its own.
+        
+        Amount swings are linear in each item's PV; timing swings re-price every
+        item at earlier and later start months in two vectorized passes. Rows are
+        sorted by swing, largest first, ready for a tornado chart.
+        """
+        items = [('cost', c) for c in costs] + [('benefit', b) for b in benefits]
+        if not items:
+            return []
         
-        # Test benefit decrease
-        benefits_low = [BenefitItem(b.description, b.amount * 0.8, b.timing_months,
-                                   b.category, b.recurring, b.confidence) for b in benefits]
-        result_benefits_low = self.assess_project(costs, benefits_low)
-        sensitivity['benefits_-20%'] = (result_benefits_low.npv - base_npv) / base_npv * 100 if base_npv != 0 else 0
+        amounts, timings, recurring = self._line_item_arrays([item for _, item in items])
+        sign = np.array([-1.0 if kind == 'cost' else 1.0 for kind, _ in items])
+        pv = self._line_item_pv(amounts, timings, recurring)
+        base_npv = float((sign * pv).sum())
         
-        # Test delayed benefits
-        benefits_delayed = [BenefitItem(b.description, b.amount, b.timing_months + 3,
-                                       b.category, b.recurring, b.confidence) for b in benefits]
-        result_delayed = self.assess_project(costs, benefits_delayed)
-        sensitivity['benefits_delayed_3mo'] = (result_delayed.npv - base_npv) / base_npv * 100 if base_npv != 0 else 0
+        amount_delta = sign * pv * amount_flex
+        earlier = self._line_item_pv(amounts, np.maximum(timings - timing_shift_months, 0), recurring)
+        later = self._line_item_pv(amounts, timings + timing_shift_months, recurring)
+        timing_low = sign * (np.minimum(earlier, later) - pv)
+        timing_high = sign * (np.maximum(earlier, later) - pv)
         
-        return sensitivity
+        rows = []
+        for driver, low, high in (('amount', -np.abs(amount_delta), np.abs(amount_delta)),
+                                  ('timing', np.minimum(timing_low, timing_high),
+                                   np.maximum(timing_low, timing_high))):
+            for (kind, item), lo, hi in zip(items, (base_npv + low).tolist(), (base_npv + high).tolist()):
+                rows.append({
+                    'item': item.description,
+                    'type': kind,
+                    'driver': driver,
+                    'npv_low': lo,
+                    'npv_high': hi,
+                    'swing': hi - lo
+                })
+        
+        return sorted(rows, key=lambda row: row['swing'], reverse=True)
     
     def assess_project(self, costs: List[CostItem], benefits: List[BenefitItem]) -> CostBenefitResult:
         """Perform comprehensive cost-benefit analysis."""
@@ -238,8 +385,8 @@ class CostBenefitAssessor:
             benefit_analysis['cash_flow']
         )
         
-        # Perform sensitivity analysis
-        sensitivity = self.perform_sensitivity_analysis(costs, benefits)
+        # Perform sensitivity analysis from the components computed above
+        sensitivity = self.perform_sensitivity_analysis(costs, benefits, cost_analysis, benefit_analysis)
         
         # Generate recommendation
         recommendation = self._generate_recommendation(
@@ -262,6 +409,169 @@ class CostBenefitAssessor:
             sensitivity_analysis=sensitivity
         )
     
+    def screen_portfolio(self, project_ids: Any, amounts: Any, timing_months: Any,
+                         recurring: Any, is_benefit: Any, confidence: Any = None,
+                         chunk_size: int = 1000) -> Iterator[Dict[str, np.ndarray]]:
+        """
+        Screen many projects from columnar line-item arrays.
+        
+        Each input is a 1-D array with one entry per line item; ``is_benefit``
+        separates benefits from costs and ``confidence`` applies to benefits
+        (default 1.0). Line items are priced in one vectorized pass and reduced
+        per project with bincount, and results are yielded in chunks of
+        ``chunk_size`` projects as arrays: project_id, total_costs,
+        total_benefits, npv, benefit_cost_ratio, roi_percentage,
+        risk_adjusted_npv, payback_months, irr and recommendation. ``irr`` is
+        NaN for projects without one; use ``rank_by_irr`` to order them last.
+        """
+        project_ids = np.asarray(project_ids)
+        amounts = np.asarray(amounts, dtype=float)
+        timings = np.asarray(timing_months, dtype=int)
+        recurring = np.asarray(recurring, dtype=bool)
+        is_benefit = np.asarray(is_benefit, dtype=bool)
+        confidence = np.ones(len(amounts)) if confidence is None else np.asarray(confidence, dtype=float)
+        
+        # Group line items by project so each chunk is a contiguous slice
+        unique_ids, codes = np.unique(project_ids, return_inverse=True)
+        order = np.argsort(codes, kind='stable')
+        codes = codes[order]
+        amounts, timings, recurring = amounts[order], timings[order], recurring[order]
+        is_benefit, confidence = is_benefit[order], confidence[order]
+        
+        pv = self._line_item_pv(amounts, timings, recurring)
+        signed = np.where(is_benefit, amounts, -amounts)
+        months = self.analysis_period_months
+        
+        for first in range(0, len(unique_ids), chunk_size):
+            last = min(first + chunk_size, len(unique_ids))
+            lo, hi = np.searchsorted(codes, [first, last])
+            local = codes[lo:hi] - first
+            n = last - first
+            
+            benefit = is_benefit[lo:hi]
+            item_pv = pv[lo:hi]
+            total_costs = np.bincount(local, weights=np.where(benefit, 0.0, item_pv), minlength=n)
+            total_benefits = np.bincount(local, weights=np.where(benefit, item_pv, 0.0), minlength=n)
+            risk_adjusted_benefits = np.bincount(
+                local, weights=np.where(benefit, item_pv * confidence[lo:hi], 0.0), minlength=n)
+            
+            net_cash_flows = self._project_cash_flows(local, n, signed[lo:hi], timings[lo:hi],
+                                                      recurring[lo:hi], months)
+            cumulative = np.cumsum(net_cash_flows, axis=1)
+            paid_back = cumulative > 0
+            payback = np.where(paid_back.any(axis=1), paid_back.argmax(axis=1) + 1, -1)
+            
+            npv = total_benefits - total_costs
+            risk_adjusted_npv = risk_adjusted_benefits - total_costs
+            has_costs = total_costs > 0
+            safe_costs = np.where(has_costs, total_costs, 1.0)
+            bcr = np.where(has_costs, total_benefits / safe_costs, np.inf)
+            roi = np.where(has_costs, npv / safe_costs * 100, 0.0)
+            irr = self.calculate_irr_batch(net_cash_flows)
+            
+            yield {
+                'project_id': unique_ids[first:last],
+                'total_costs': total_costs,
+                'total_benefits': total_benefits,
+                'npv': npv,
+                'benefit_cost_ratio': bcr,
+                'roi_percentage': roi,
+                'risk_adjusted_npv': risk_adjusted_npv,
+                'payback_months': payback,
+                'irr': irr,
+                'recommendation': np.array([
+                    self._generate_recommendation(b, r, p, ra)
+                    for b, r, p, ra in zip(bcr.tolist(), roi.tolist(), payback.tolist(), risk_adjusted_npv.tolist())
+                ])
+            }
+    
+    @staticmethod
+    def rank_by_irr(irr: Any) -> np.ndarray:
+        """Indices ordering projects by descending IRR, projects without an IRR (NaN) last."""
+        irr = np.asarray(irr, dtype=float)
+        return np.lexsort((-np.nan_to_num(irr, nan=0.0), np.isnan(irr)))
+    
+    def _project_cash_flows(self, codes: np.ndarray, n_projects: int, signed_amounts: np.ndarray,
+                            timings: np.ndarray, recurring: np.ndarray, months: int) -> np.ndarray:
+        """(projects x months) net cash flows via a 2-D difference array."""
+        cash_flow = np.zeros((n_projects, months + 1))
+        starts = recurring & (timings < months)
+        np.add.at(cash_flow, (codes[starts], np.clip(timings[starts], 0, months)), signed_amounts[starts])
+        cash_flow = np.cumsum(cash_flow[:, :months], axis=1)
+        points = ~recurring & (timings >= 0) & (timings < months)
+        np.add.at(cash_flow, (codes[points], timings[points]), signed_amounts[points])
+        return cash_flow
+    
+    def simulate_risk(self, costs: List[CostItem], benefits: List[BenefitItem],
+                      n_draws: int = 100_000, seed: Optional[int] = None,
+                      shortfall_level: float = 0.05, chunk_size: int = 20_000) -> Dict[str, Any]:
+        """
+        Monte Carlo distribution of NPV and payback.
+        
+        Each benefit is realized with probability ``confidence``; its amount is
+        scaled by ``1 + amount_volatility * Z`` (floored at zero) and its start
+        month shifted by ``timing_std_months * Z``. Costs are deterministic.
+        Draws are processed in vectorized chunks of ``chunk_size``.
+        """
+        rng = np.random.default_rng(seed)
+        months = self.analysis_period_months
+        
+        cost_amounts, cost_timings, cost_recurring = self._line_item_arrays(costs)
+        cost_pv = float(self._line_item_pv(cost_amounts, cost_timings, cost_recurring).sum())
+        cost_cash_flow = self._line_item_cash_flow(cost_amounts, cost_timings, cost_recurring)
+        
+        amounts, timings, recurring = self._line_item_arrays(benefits)
+        confidence = np.array([b.confidence for b in benefits], dtype=float)
+        volatility = np.array([b.amount_volatility for b in benefits], dtype=float)
+        timing_std = np.array([b.timing_std_months for b in benefits], dtype=float)
+        
+        npv = np.empty(n_draws)
+        payback = np.empty(n_draws, dtype=int)
+        for first in range(0, n_draws, chunk_size):
+            draws = min(chunk_size, n_draws - first)
+            shape = (draws, len(benefits))
+            
+            realized = rng.random(shape) < confidence
+            drawn_amounts = amounts * realized
+            if volatility.any():
+                drawn_amounts *= np.maximum(1 + volatility * rng.standard_normal(shape), 0.0)
+            drawn_timings = np.broadcast_to(timings, shape)
+            if timing_std.any():
+                shift = np.rint(timing_std * rng.standard_normal(shape)).astype(int)
+                drawn_timings = np.maximum(drawn_timings + shift, 0)
+            
+            flat_amounts = drawn_amounts.ravel()
+            flat_timings = np.ascontiguousarray(drawn_timings).ravel()
+            flat_recurring = np.broadcast_to(recurring, shape).ravel()
+            draw_index = np.repeat(np.arange(draws), len(benefits))
+            
+            benefit_pv = self._line_item_pv(flat_amounts, flat_timings, flat_recurring).reshape(shape)
+            npv[first:first + draws] = benefit_pv.sum(axis=1) - cost_pv
+            
+            net_cash_flows = self._project_cash_flows(draw_index, draws, flat_amounts, flat_timings,
+                                                      flat_recurring, months) - cost_cash_flow
+            paid_back = np.cumsum(net_cash_flows, axis=1) > 0
+            payback[first:first + draws] = np.where(paid_back.any(axis=1), paid_back.argmax(axis=1) + 1, -1)
+        
+        p10, p50, p90 = np.quantile(npv, [0.10, 0.50, 0.90])
+        tail = np.sort(npv)[:max(1, int(n_draws * shortfall_level))]
+        paid = payback[payback > 0]
+        
+        return {
+            'simulations': n_draws,
+            'seed': seed,
+            'mean_npv': float(npv.mean()),
+            'std_npv': float(npv.std()),
+            'probability_negative_npv': float((npv < 0).mean()),
+            'npv_percentiles': {'p10': float(p10), 'p50': float(p50), 'p90': float(p90)},
+            'expected_shortfall': float(tail.mean()),
+            'shortfall_level': shortfall_level,
+            'probability_of_payback': float(len(paid) / n_draws),
+            'payback_percentiles': {
+                key: float(value) for key, value in zip(('p10', 'p50', 'p90'), np.quantile(paid, [0.10, 0.50, 0.90]))
+            } if len(paid) else {}
+        }
+    
     def _generate_recommendation(self, bcr: float, roi: float, 
                                payback: int, risk_adj_npv: float) -> str:
         """Generate investment recommendation based on metrics."""
@@ -299,7 +609,7 @@ class CostBenefitAssessor:
                 'roi_percentage': result.roi_percentage,
                 'payback_months': result.payback_months,
                 'npv': result.npv,
-                'irr': result.irr,
+                'irr': None if np.isnan(result.irr) else result.irr,
                 'risk_adjusted_npv': result.risk_adjusted_npv
             },
             'breakdown': {
@@ -316,6 +626,87 @@ class CostBenefitAssessor:
         return filename
 
 
+def _brentq(f: Callable[[float], float], a: float, b: float,
+            xtol: float = 1e-12, max_iterations: int = 100) -> float:
+    """Brent's root finder on a bracket [a, b] where f changes sign."""
+    fa, fb = f(a), f(b)
+    if abs(fa) < abs(fb):
+        a, b, fa, fb = b, a, fb, fa
+    c, fc, d = a, fa, a
+    bisected = True
+    
+    for _ in range(max_iterations):
+        if fb == 0 or abs(b - a) < xtol:
+            break
+        if fa != fc and fb != fc:
+            # Inverse quadratic interpolation
+            s = (a * fb * fc / ((fa - fb) * (fa - fc)) +
+                 b * fa * fc / ((fb - fa) * (fb - fc)) +
+                 c * fa * fb / ((fc - fa) * (fc - fb)))
+        else:
+            # Secant step
+            s = b - fb * (b - a) / (fb - fa)
+        
+        lo, hi = sorted(((3 * a + b) / 4, b))
+        if (not lo < s < hi or
+                (bisected and abs(s - b) >= abs(b - c) / 2) or
+                (not bisected and abs(s - b) >= abs(c - d) / 2) or
+                (bisected and abs(b - c) < xtol) or
+                (not bisected and abs(c - d) < xtol)):
+            s = (a + b) / 2
+            bisected = True
+        else:
+            bisected = False
+        
+        fs = f(s)
+        d, c, fc = c, b, fb
+        if fa * fs < 0:
+            b, fb = s, fs
+        else:
+            a, fa = s, fs
+        if abs(fa) < abs(fb):
+            a, b, fa, fb = b, a, fb, fa
+    
+    return b
+
+
+def benchmark_irr(n_projects: int = 5000, seed: int = 0) -> Dict[str, float]:
+    """Time the exact batch/scalar IRR solvers against the old approximation on random projects."""
+    assessor = CostBenefitAssessor()
+    rng = np.random.default_rng(seed)
+    months = assessor.analysis_period_months
+    
+    # Upfront investment followed by noisy monthly returns
+    investment = rng.uniform(50_000, 500_000, n_projects)
+    returns = rng.normal(investment[:, None] / rng.uniform(12, 48, (n_projects, 1)),
+                         investment[:, None] * 0.01, (n_projects, months))
+    cash_flows = returns.copy()
+    cash_flows[:, 0] -= investment
+    zeros = [0.0] * months
+    rows = cash_flows.tolist()
+    
+    start = time.perf_counter()
+    approximate = [assessor.approximate_irr(row, zeros) for row in rows]
+    approximate_seconds = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    exact = assessor.calculate_irr_batch(cash_flows)
+    batch_seconds = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    for row in rows[:500]:
+        assessor.calculate_irr(row, zeros)
+    scalar_seconds = (time.perf_counter() - start) * n_projects / min(n_projects, 500)
+    
+    return {
+        'projects': n_projects,
+        'approximation_seconds': approximate_seconds,
+        'exact_batch_seconds': batch_seconds,
+        'exact_scalar_seconds_estimated': scalar_seconds,
+        'approximation_mean_abs_error_pts': float(np.nanmean(np.abs(np.array(approximate) - exact)))
+    }
+
+
 def demo_usage():
     """Demonstrate the cost-benefit assessor."""
     print("📊 Cost-Benefit Assessment Tool Demo")
@@ -355,11 +746,19 @@ def demo_usage():
     print(f"\n📈 Key Metrics")
     print(f"Benefit-Cost Ratio:    {result.benefit_cost_ratio:.2f}")
     print(f"ROI:                   {result.roi_percentage:.1f}%")
-    print(f"IRR:                   {result.irr:.1f}%")
+    print(f"IRR:                   {'n/a' if np.isnan(result.irr) else f'{result.irr:.1f}%'}")
     print(f"Payback Period:        {result.payback_months} months" if result.payback_months > 0 else "Payback Period:        Beyond analysis period")
     
     print(f"\n🎯 Recommendation: {result.recommendation}")
     
+    # Monte Carlo risk profile
+    risk = assessor.simulate_risk(costs, benefits, seed=42)
+    print(f"\n🎲 Risk Simulation ({risk['simulations']:,} draws)")
+    print(f"P(NPV < 0):            {risk['probability_negative_npv']:.1%}")
+    print(f"NPV P10/P50/P90:       ${risk['npv_percentiles']['p10']:,.0f} / "
+          f"${risk['npv_percentiles']['p50']:,.0f} / ${risk['npv_percentiles']['p90']:,.0f}")
+    print(f"Expected Shortfall:    ${risk['expected_shortfall']:,.0f} (worst {risk['shortfall_level']:.0%})")
+    
     # Cost breakdown
     if result.cost_breakdown:
         print(f"\n💸 Cost Breakdown:")
@@ -386,4 +785,7 @@ def demo_usage():
 
 
 if __name__ == "__main__":
-    demo_usage()
\ No newline at end of file
+    if "--benchmark" in sys.argv:
+        print(json.dumps(benchmark_irr(), indent=2))
+    else:
+        demo_usage()
\ No newline at end of file
@@ -3,12 +3,13 @@ Financial Forecast Analyzer
 Simple working implementation for portfolio demonstration
 """
 
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Tuple
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Optional, Any, Sequence, Tuple, Iterator, Union
 import json
 from datetime import datetime, timedelta
 import math
-import random
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 
 
 @dataclass
@@ -21,6 +22,224 @@ class HistoricalData:
     cash_flow: float
 
 
+@dataclass
+class HistoricalSeries:
+    """
+    Array-backed history for one or many entities sharing the same periods.
+    
+    Metric arrays have shape (entities x periods); period labels are parsed
+    once into ``years`` and ``quarters`` shared by every entity.
+    """
+    years: np.ndarray
+    quarters: np.ndarray
+    revenue: np.ndarray
+    expenses: np.ndarray
+    ebitda: np.ndarray
+    cash_flow: np.ndarray
+    periods_per_year: int = 4
+    
+    @classmethod
+    def from_arrays(cls, periods: List[str], revenue: Any, expenses: Any,
+                    ebitda: Any, cash_flow: Any) -> 'HistoricalSeries':
+        """Build from period labels and (entities x periods) or (periods,) metric arrays."""
+        years, quarters, periods_per_year = parse_periods(periods)
+        metrics = [np.atleast_2d(np.asarray(m, dtype=float)) for m in (revenue, expenses, ebitda, cash_flow)]
+        return cls(years, quarters, *metrics, periods_per_year=periods_per_year)
+    
+    @classmethod
+    def from_records(cls, historical_data: List[HistoricalData]) -> 'HistoricalSeries':
+        """Build a single-entity series from HistoricalData records."""
+        return cls.from_arrays(
+            [d.period for d in historical_data],
+            [d.revenue for d in historical_data],
+            [d.expenses for d in historical_data],
+            [d.ebitda for d in historical_data],
+            [d.cash_flow for d in historical_data]
+        )
+
+
+def parse_periods(periods: List[str]) -> Tuple[np.ndarray, np.ndarray, int]:
+    """
+    Parse "2023-Q1" / "2023-12" / "2023" labels into year and quarter arrays
+    plus periods per year (12, 4 or 1, the finest frequency present).
+    
+    Annual labels have no quarter and get quarter 0.
+    """
+    years = np.empty(len(periods), dtype=np.int32)
+    quarters = np.empty(len(periods), dtype=np.int8)
+    periods_per_year = 1 if periods else 4
+    for i, period in enumerate(periods):
+        if '-' not in period:
+            years[i] = int(period)
+            quarters[i] = 0
+            continue
+        year, suffix = period.rsplit('-', 1)
+        years[i] = int(year)
+        if suffix.upper().startswith('Q'):
+            quarters[i] = int(suffix[1:])
+            periods_per_year = max(periods_per_year, 4)
+        else:
+            quarters[i] = (int(suffix) - 1) // 3 + 1
+            periods_per_year = 12
+    return years, quarters, periods_per_year
+
+
+def next_period(period: str) -> str:
+    """Label of the period following a "2023-Q4", "2023-12" or "2023" label, at the same frequency."""
+    years, quarters, periods_per_year = parse_periods([period])
+    year = int(years[0])
+    if periods_per_year == 1:
+        return str(year + 1)
+    if periods_per_year == 12:
+        month = int(period.rsplit('-', 1)[1])
+        return f"{year + 1}-01" if month == 12 else f"{year}-{month + 1:02d}"
+    quarter = int(quarters[0])
+    return f"{year + 1}-Q1" if quarter == 4 else f"{year}-Q{quarter + 1}"
+
+
+@dataclass
+class TrendState:
+    """Incrementally updatable equivalent of analyze_historical_trends."""
+    periods: int = 0
+    last_revenue: Optional[float] = None
+    growth_count: int = 0
+    growth_mean: float = 0.0
+    growth_m2: float = 0.0
+    revenue_sum: float = 0.0
+    margin_sum: float = 0.0
+    season_revenue: List[float] = field(default_factory=lambda: [0.0] * 4)
+    season_counts: List[int] = field(default_factory=lambda: [0] * 4)
+    
+    def add(self, data: HistoricalData) -> None:
+        """Fold one actual period into the running statistics in O(1)."""
+        if self.last_revenue is not None and self.last_revenue > 0:
+            growth = (data.revenue - self.last_revenue) / self.last_revenue
+            self.growth_count += 1
+            delta = growth - self.growth_mean
+            self.growth_mean += delta / self.growth_count
+            self.growth_m2 += delta * (growth - self.growth_mean)
+        
+        quarter = int(parse_periods([data.period])[1][0])
+        if quarter:  # Annual periods carry no seasonality
+            self.season_revenue[quarter - 1] += data.revenue
+            self.season_counts[quarter - 1] += 1
+        self.revenue_sum += data.revenue
+        if data.revenue > 0:
+            self.margin_sum += data.ebitda / data.revenue
+        self.periods += 1
+        self.last_revenue = data.revenue
+    
+    def to_trends(self) -> Dict[str, Any]:
+        """Current trends in the same shape as analyze_historical_trends."""
+        if not self.periods:
+            return {'growth_rate': 0.0, 'seasonality': {}, 'volatility': 0.0}
+        
+        avg_revenue = self.revenue_sum / self.periods
+        seasonality = {}
+        if self.periods >= 4 and avg_revenue:
+            seasonality = {q + 1: self.season_revenue[q] / self.season_counts[q] / avg_revenue
+                           for q in range(4) if self.season_counts[q]}
+        
+        return {
+            'growth_rate': self.growth_mean,
+            'seasonality': seasonality,
+            'volatility': math.sqrt(self.growth_m2 / (self.growth_count - 1)) if self.growth_count > 1 else 0.0,
+            'avg_revenue': avg_revenue,
+            'avg_margin': self.margin_sum / self.periods
+        }
+
+
+class HistogramSketch:
+    """
+    Mergeable streaming quantile sketch: a fixed-bin histogram per column.
+    
+    Each column keeps ``bins`` equal-width counts. When new values fall outside
+    the covered range, adjacent bins are merged pairwise and the range doubles,
+    so memory stays O(columns x bins) however many rows are added. Quantiles
+    interpolate within a bin, so their error is below one bin width.
+    """
+    
+    def __init__(self, bins: int = 2048):
+        if bins < 2 or bins % 2:
+            raise ValueError("bins must be an even number >= 2")
+        self.bins = bins
+        self.total = 0
+        self.lower: Optional[np.ndarray] = None
+        self.width: Optional[np.ndarray] = None
+        self.counts: Optional[np.ndarray] = None  # (columns x bins)
+    
+    def add(self, values: np.ndarray) -> None:
+        """Fold a (rows x columns) array into the sketch."""
+        values = np.asarray(values, dtype=float)
+        if not len(values):
+            return
+        low, high = values.min(axis=0), values.max(axis=0)
+        if self.counts is None:
+            # Pad the first range by 10% each side so later chunks rarely rescale it
+            span = high - low
+            pad = np.where(span > 0, span * 0.1, np.maximum(np.abs(low), 1.0) * 1e-6)
+            self.lower = low - pad
+            self.width = (span + 2 * pad) / self.bins
+            self.counts = np.zeros((values.shape[1], self.bins))
+        for column in np.flatnonzero((low < self.lower) | (high >= self._upper())).tolist():
+            self._extend(column, low[column], high[column])
+        
+        index = np.clip(((values - self.lower) / self.width).astype(np.int64), 0, self.bins - 1)
+        flat = (index + np.arange(values.shape[1]) * self.bins).ravel()
+        self.counts += np.bincount(flat, minlength=self.counts.size).reshape(self.counts.shape)
+        self.total += len(values)
+    
+    def merge(self, other: 'HistogramSketch') -> 'HistogramSketch':
+        """Fold another sketch's counts in, re-binning them at their bin centres."""
+        if other.counts is None:
+            return self
+        centres = other.lower[:, None] + other.width[:, None] * (np.arange(other.bins) + 0.5)
+        if self.counts is None:
+            self.lower, self.width = other.lower.copy(), other.width.copy()
+            self.counts = np.zeros_like(other.counts)
+        for column in range(len(self.counts)):
+            occupied = other.counts[column] > 0
+            if not occupied.any():
+                continue
+            self._extend(column, centres[column][occupied].min(), centres[column][occupied].max())
+            index = np.clip(((centres[column] - self.lower[column]) / self.width[column]).astype(np.int64),
+                            0, self.bins - 1)
+            self.counts[column] += np.bincount(index, weights=other.counts[column], minlength=self.bins)
+        self.total += other.total
+        return self
+    
+    def quantiles(self, q: Sequence[float]) -> np.ndarray:
+        """(len(q) x columns) quantiles, linearly interpolated within bins."""
+        cumulative = np.cumsum(self.counts, axis=1)
+        result = np.empty((len(q), len(self.counts)))
+        for i, level in enumerate(q):
+            target = level * self.total
+            for column in range(len(self.counts)):
+                b = min(int(np.searchsorted(cumulative[column], target)), self.bins - 1)
+                count = self.counts[column, b]
+                below = cumulative[column, b] - count
+                fraction = (target - below) / count if count else 0.5
+                result[i, column] = self.lower[column] + self.width[column] * (b + min(max(fraction, 0.0), 1.0))
+        return result
+    
+    def _upper(self) -> np.ndarray:
+        return self.lower + self.width * self.bins
+    
+    def _extend(self, column: int, low: float, high: float) -> None:
+        """Double one column's range (merging bin pairs) until it covers [low, high]."""
+        half = self.bins // 2
+        while low < self.lower[column] or high >= self.lower[column] + self.width[column] * self.bins:
+            merged = self.counts[column].reshape(half, 2).sum(axis=1)
+            if high >= self.lower[column] + self.width[column] * self.bins:
+                # Grow upwards, keeping the lower edge
+                self.counts[column] = np.concatenate([merged, np.zeros(half)])
+            else:
+                # Grow downwards, keeping the upper edge
+                self.counts[column] = np.concatenate([np.zeros(half), merged])
+                self.lower[column] -= self.width[column] * self.bins
+            self.width[column] *= 2
+
+
 @dataclass
 class ForecastAssumptions:
     """Key assumptions for financial forecasting."""
@@ -31,6 +250,40 @@ class ForecastAssumptions:
     confidence_interval: float = 0.80  # 80% confidence
 
 
+@dataclass
+class DriverDynamics:
+    """Stochastic dynamics of forecast drivers for path-dependent simulation."""
+    growth_volatility: float = 0.03  # Quarterly std dev of growth shocks
+    expense_ratio_volatility: float = 0.01
+    cash_conversion_mean: float = 0.85
+    cash_conversion_volatility: float = 0.03
+    mean_reversion: float = 0.3  # Fraction of gap to long-run mean closed each quarter
+    # Shock correlation: growth, expense ratio, cash conversion
+    correlation: List[List[float]] = field(default_factory=lambda: [
+        [1.0, -0.4, 0.2],
+        [-0.4, 1.0, -0.3],
+        [0.2, -0.3, 1.0]
+    ])
+
+
+@dataclass
+class ScenarioDefinition:
+    """What-if scenario as multipliers on the base forecast (scalar or per-quarter)."""
+    name: str
+    revenue_multiplier: Union[float, List[float]] = 1.0
+    expense_multiplier: Union[float, List[float]] = 1.0
+    cash_conversion: Union[float, List[float]] = 0.85  # Share of EBITDA converted to cash
+
+
+DEFAULT_SCENARIOS = [
+    ScenarioDefinition("optimistic", 1.15, 0.92, 0.90),  # Higher growth, better cost control and conversion
+    ScenarioDefinition("pessimistic", 0.85, 1.05, 0.75),  # Lower growth, cost inflation
+    ScenarioDefinition("conservative", 0.95, 1.0, 0.82),  # Modest growth
+]
+
+SCENARIO_METRICS = ('revenue', 'expenses', 'ebitda', 'cash_flow')
+
+
 @dataclass
 class ForecastResult:
     """Financial forecast analysis result."""
@@ -45,57 +298,117 @@ class ForecastResult:
     risks_opportunities: List[str]
 
 
+@dataclass
+class RollingForecastState:
+    """State kept between period-close updates of a rolling forecast."""
+    historical_data: List[HistoricalData]
+    assumptions: ForecastAssumptions
+    trend_state: TrendState
+    periods: List[str]
+    periods_per_year: int
+    simulation_mode: str
+    # (quarters x metrics x 2) bands per unit of base revenue, reused across
+    # updates; None in path-dependent mode, where bands compound from each actual
+    normalized_bands: Optional[np.ndarray]
+    rng: np.random.Generator
+    result: Optional[ForecastResult] = None
+
+
+@dataclass
+class BusinessUnit:
+    """Business unit input for portfolio forecasting."""
+    name: str
+    historical_data: List[HistoricalData]
+    assumptions: ForecastAssumptions = field(default_factory=ForecastAssumptions)
+
+
+@dataclass
+class PortfolioForecast:
+    """Consolidated forecast across business units."""
+    forecast_periods: List[str]
+    unit_results: Dict[str, ForecastResult]
+    consolidated_forecast: Dict[str, List[float]]
+    consolidated_bands: Dict[str, List[Tuple[float, float]]]
+    key_metrics: Dict[str, float]
+
+
 class FinancialForecastAnalyzer:
     """Advanced financial forecasting with scenario analysis."""
     
     def __init__(self):
         self.forecast_horizon_quarters = 8  # 2 years quarterly forecast
         self.monte_carlo_simulations = 1000
+        self.random_seed: Optional[int] = None  # Set for reproducible simulations
+        self.simulation_mode = "independent"  # "independent" or "path_dependent"
+        self.simulation_chunk_size = 100_000  # Paths held in memory at once
+        self.driver_dynamics = DriverDynamics()
+        self.scenario_definitions: List[ScenarioDefinition] = list(DEFAULT_SCENARIOS)
+        self.rolling_state: Optional[RollingForecastState] = None
     
     def analyze_historical_trends(self, historical_data: List[HistoricalData]) -> Dict[str, Any]:
         """Analyze historical data to identify trends and patterns."""
         if not historical_data:
             return {'growth_rate': 0.0, 'seasonality': {}, 'volatility': 0.0}
         
-        # Calculate growth rates
-        revenues = [d.revenue for d in historical_data]
-        growth_rates = []
+        trends = self.analyze_trends_batch(HistoricalSeries.from_records(historical_data))
+        seasonality = {}
+        if len(historical_data) >= 4:
+            seasonality = {quarter: float(trends['seasonality'][0, quarter - 1])
+                           for quarter in range(1, 5) if trends['season_counts'][quarter - 1]}
         
-        for i in range(1, len(revenues)):
-            if revenues[i-1] > 0:
-                growth_rate = (revenues[i] - revenues[i-1]) / revenues[i-1]
-                growth_rates.append(growth_rate)
+        return {
+            'growth_rate': float(trends['growth_rate'][0]),
+            'seasonality': seasonality,
+            'volatility': float(trends['volatility'][0]),
+            'avg_revenue': float(trends['avg_revenue'][0]),
+            'avg_margin': float(trends['avg_margin'][0])
+        }
+    
+    def analyze_trends_batch(self, series: HistoricalSeries) -> Dict[str, np.ndarray]:
+        """
+        Vectorized trend analysis across every entity in an array-backed series.
         
-        avg_growth_rate = sum(growth_rates) / len(growth_rates) if growth_rates else 0.0
+        Growth, volatility, seasonal indices (by parsed quarter) and margins are
+        computed in one pass over the (entities x periods) arrays.
+        """
+        revenue = series.revenue
+        n_periods = revenue.shape[1]
         
-        # Calculate volatility (standard deviation of growth rates)
-        if len(growth_rates) > 1:
-            mean_growth = avg_growth_rate
-            variance = sum((g - mean_growth) ** 2 for g in growth_rates) / (len(growth_rates) - 1)
-            volatility = math.sqrt(variance)
-        else:
-            volatility = 0.0
+        # Period-over-period growth, ignoring non-positive prior revenue
+        previous = revenue[:, :-1]
+        valid = previous > 0
+        growth = np.where(valid, (revenue[:, 1:] - previous) / np.where(valid, previous, 1.0), 0.0)
+        growth_counts = valid.sum(axis=1)
+        growth_rate = np.divide(growth.sum(axis=1), growth_counts,
+                                out=np.zeros(len(revenue)), where=growth_counts > 0)
         
-        # Identify seasonality patterns (simplified)
-        seasonality = {}
-        if len(historical_data) >= 4:
-            avg_revenue = sum(revenues) / len(revenues)
-            for i, data in enumerate(historical_data):
-                quarter = (i % 4) + 1
-                if quarter not in seasonality:
-                    seasonality[quarter] = []
-                seasonality[quarter].append(data.revenue / avg_revenue)
-            
-            # Average seasonal factors
-            for quarter in seasonality:
-                seasonality[quarter] = sum(seasonality[quarter]) / len(seasonality[quarter])
+        # Sample standard deviation of growth rates
+        squared = np.where(valid, (growth - growth_rate[:, None]) ** 2, 0.0).sum(axis=1)
+        volatility = np.sqrt(np.divide(squared, growth_counts - 1,
+                                       out=np.zeros(len(revenue)), where=growth_counts > 1))
+        
+        # Seasonal indices: mean revenue/average ratio per parsed quarter
+        avg_revenue = revenue.mean(axis=1) if n_periods else np.zeros(len(revenue))
+        ratio = np.divide(revenue, avg_revenue[:, None], out=np.zeros_like(revenue),
+                          where=avg_revenue[:, None] != 0)
+        quarter_onehot = (series.quarters[:, None] == np.arange(1, 5)).astype(float)
+        season_counts = quarter_onehot.sum(axis=0)
+        seasonality = np.divide(ratio @ quarter_onehot, season_counts,
+                                out=np.zeros((len(revenue), 4)), where=season_counts > 0)
+        
+        # Average EBITDA margin over periods with positive revenue
+        positive = revenue > 0
+        margins = np.where(positive, series.ebitda / np.where(positive, revenue, 1.0), 0.0)
+        avg_margin = margins.sum(axis=1) / max(n_periods, 1)
         
         return {
-            'growth_rate': avg_growth_rate,
-            'seasonality': seasonality,
+            'growth_rate': growth_rate,
             'volatility': volatility,
-            'avg_revenue': sum(revenues) / len(revenues),
-            'avg_margin': sum(d.ebitda / d.revenue for d in historical_data if d.revenue > 0) / len(historical_data)
+            'seasonality': seasonality,
+            'season_counts': season_counts,
+            'avg_revenue': avg_revenue,
+            'avg_margin': avg_margin,
+            'periods_per_year': series.periods_per_year
         }
     
     def generate_base_forecast(self, historical_data: List[HistoricalData],
@@ -105,48 +418,41 @@ class FinancialForecastAnalyzer:
         if not historical_data:
             # Default baseline if no historical data
             last_revenue = 1000000  # $1M baseline
-            last_ebitda_margin = 0.20
         else:
             last_revenue = historical_data[-1].revenue
-            last_ebitda_margin = historical_data[-1].ebitda / historical_data[-1].revenue if historical_data[-1].revenue > 0 else 0.20
         
-        trends = self.analyze_historical_trends(historical_data)
+        # Quarterly periods following today
+        base_date = datetime.now()
+        periods = []
+        for quarter in range(1, self.forecast_horizon_quarters + 1):
+            forecast_date = base_date + timedelta(days=90 * quarter)
+            periods.append(f"{forecast_date.year}-Q{((forecast_date.month - 1) // 3) + 1}")
         
-        # Generate quarterly forecasts
+        return self._project_base_forecast(last_revenue, periods, assumptions)
+    
+    def _project_base_forecast(self, last_revenue: float, periods: List[str],
+                               assumptions: ForecastAssumptions) -> Dict[str, List[float]]:
+        """Project revenue, expenses, EBITDA and cash flow over the given periods at their label frequency."""
         forecast = {
             'revenue': [],
             'expenses': [],
             'ebitda': [],
             'cash_flow': [],
-            'periods': []
+            'periods': list(periods)
         }
         
-        base_date = datetime.now()
         current_revenue = last_revenue
+        market_multiplier = self._market_multiplier(assumptions)
+        periods_per_year = parse_periods(periods)[2]
         
-        for quarter in range(1, self.forecast_horizon_quarters + 1):
-            # Calculate forecast date
-            forecast_date = base_date + timedelta(days=90 * quarter)
-            period = f"{forecast_date.year}-Q{((forecast_date.month - 1) // 3) + 1}"
-            forecast['periods'].append(period)
+        for period in periods:
+            # Apply growth rate (per period)
+            period_growth = assumptions.revenue_growth_rate / periods_per_year
+            current_revenue *= (1 + period_growth)
             
-            # Apply growth rate (quarterly)
-            quarterly_growth = assumptions.revenue_growth_rate / 4
-            current_revenue *= (1 + quarterly_growth)
-            
-            # Apply seasonality
-            season_quarter = ((forecast_date.month - 1) // 3) + 1
-            seasonal_multiplier = assumptions.seasonal_factor.get(season_quarter, 1.0)
-            seasonal_revenue = current_revenue * seasonal_multiplier
-            
-            # Apply market conditions adjustment
-            market_multiplier = {
-                'growth': 1.05,
-                'stable': 1.0,
-                'decline': 0.95
-            }.get(assumptions.market_conditions, 1.0)
-            
-            final_revenue = seasonal_revenue * market_multiplier
+            # Apply seasonality and market conditions adjustment
+            seasonal_multiplier = assumptions.seasonal_factor.get(self._season_quarter(period), 1.0)
+            final_revenue = current_revenue * seasonal_multiplier * market_multiplier
             
             # Calculate expenses and other metrics
             expenses = final_revenue * assumptions.expense_ratio
@@ -163,106 +469,247 @@ class FinancialForecastAnalyzer:
         return forecast
     
     def generate_scenario_analysis(self, base_forecast: Dict[str, List[float]],
-                                 assumptions: ForecastAssumptions) -> Dict[str, Dict[str, List[float]]]:
-        """Generate optimistic and pessimistic scenarios."""
+                                 assumptions: ForecastAssumptions,
+                                 scenarios: Optional[List[ScenarioDefinition]] = None) -> Dict[str, Dict[str, List[float]]]:
+        """Generate what-if scenarios (optimistic, pessimistic and conservative by default)."""
+        scenarios = self.scenario_definitions if scenarios is None else scenarios
+        results = self.evaluate_scenarios(base_forecast, scenarios)
         
-        scenarios = {}
-        
-        # Optimistic scenario (20% higher growth, better margins)
-        optimistic = {
-            'revenue': [r * 1.15 for r in base_forecast['revenue']],
-            'expenses': [e * 0.92 for e in base_forecast['expenses']],  # Better cost control
-            'ebitda': [],
-            'cash_flow': []
+        return {
+            scenario.name: {metric: results[i, :, m].tolist() for m, metric in enumerate(SCENARIO_METRICS)}
+            for i, scenario in enumerate(scenarios)
         }
+    
+    def evaluate_scenarios(self, base_forecast: Dict[str, List[float]],
+                           scenarios: List[ScenarioDefinition]) -> np.ndarray:
+        """
+        Evaluate every scenario in one broadcasted operation.
         
-        for i in range(len(optimistic['revenue'])):
-            ebitda = optimistic['revenue'][i] - optimistic['expenses'][i]
-            optimistic['ebitda'].append(ebitda)
-            optimistic['cash_flow'].append(ebitda * 0.90)  # Better cash conversion
+        Returns a (scenarios x quarters x metrics) array with metrics ordered as
+        SCENARIO_METRICS: revenue, expenses, ebitda, cash_flow.
+        """
+        revenue = np.asarray(base_forecast['revenue'], dtype=float)
+        expenses = np.asarray(base_forecast['expenses'], dtype=float)
+        quarters = len(revenue)
         
-        scenarios['optimistic'] = optimistic
+        # (scenarios x quarters x 3) multipliers: revenue, expenses, cash conversion
+        multipliers = np.empty((len(scenarios), quarters, 3))
+        for i, scenario in enumerate(scenarios):
+            multipliers[i] = np.column_stack([
+                np.broadcast_to(np.asarray(scenario.revenue_multiplier, dtype=float), quarters),
+                np.broadcast_to(np.asarray(scenario.expense_multiplier, dtype=float), quarters),
+                np.broadcast_to(np.asarray(scenario.cash_conversion, dtype=float), quarters)
+            ])
         
-        # Pessimistic scenario (lower growth, margin pressure)
-        pessimistic = {
-            'revenue': [r * 0.85 for r in base_forecast['revenue']],
-            'expenses': [e * 1.05 for e in base_forecast['expenses']],  # Cost inflation
-            'ebitda': [],
-            'cash_flow': []
-        }
+        results = np.empty((len(scenarios), quarters, len(SCENARIO_METRICS)))
+        results[..., :2] = multipliers[..., :2] * np.stack([revenue, expenses], axis=-1)
+        results[..., 2] = results[..., 0] - results[..., 1]
+        results[..., 3] = results[..., 2] * multipliers[..., 2]
+        return results
+    
+    def calculate_confidence_bands(self, base_forecast: Dict[str, List[float]],
+                                 assumptions: ForecastAssumptions,
+                                 simulations: Optional[int] = None,
+                                 seed: Optional[int] = None) -> Dict[str, List[Tuple[float, float]]]:
+        """Calculate confidence bands using vectorized Monte Carlo simulation."""
+        paths = self._simulate_independent_paths(base_forecast, simulations, seed)
+        return self._quantile_bands(paths, assumptions.confidence_interval)
+    
+    def _simulate_independent_paths(self, base_forecast: Dict[str, List[float]],
+                                    simulations: Optional[int] = None,
+                                    seed: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """Perturb each base-forecast quarter independently; returns (paths x quarters) arrays."""
+        n_paths = simulations or self.monte_carlo_simulations
+        rng = np.random.default_rng(self.random_seed if seed is None else seed)
+        return self._draw_independent_paths(base_forecast, n_paths, rng)
+    
+    def _draw_independent_paths(self, base_forecast: Dict[str, List[float]], n_paths: int,
+                                rng: np.random.Generator) -> Dict[str, np.ndarray]:
+        """Draw ``n_paths`` independently perturbed (paths x quarters) arrays from ``rng``."""
+        revenue = np.asarray(base_forecast['revenue'], dtype=float)
+        expenses = np.asarray(base_forecast['expenses'], dtype=float)
+        shape = (n_paths, len(revenue))
         
-        for i in range(len(pessimistic['revenue'])):
-            ebitda = pessimistic['revenue'][i] - pessimistic['expenses'][i]
-            pessimistic['ebitda'].append(ebitda)
-            pessimistic['cash_flow'].append(ebitda * 0.75)  # Worse cash conversion
+        # All shocks drawn at once as (paths x quarters) arrays
+        growth_variance = rng.uniform(-0.05, 0.05, shape)  # ±5% variance
+        expense_variance = rng.uniform(-0.03, 0.03, shape)  # ±3% variance
+        cash_conversion = rng.uniform(0.75, 0.95, shape)
         
-        scenarios['pessimistic'] = pessimistic
+        sim_revenue = revenue * (1 + growth_variance)
+        sim_ebitda = sim_revenue - expenses * (1 + expense_variance)
+        sim_cash_flow = sim_ebitda * cash_conversion
         
-        # Conservative scenario (modest growth)
-        conservative = {
-            'revenue': [r * 0.95 for r in base_forecast['revenue']],
-            'expenses': [e for e in base_forecast['expenses']],
-            'ebitda': [],
-            'cash_flow': []
+        return {
+            'revenue': sim_revenue,
+            'ebitda': sim_ebitda,
+            'cash_flow': sim_cash_flow
         }
+    
+    def simulate_forecast_paths(self, historical_data: List[HistoricalData],
+                                base_forecast: Dict[str, List[float]],
+                                assumptions: ForecastAssumptions,
+                                seed: Optional[int] = None,
+                                chunk_size: Optional[int] = None) -> Iterator[Dict[str, np.ndarray]]:
+        """
+        Stream (paths x quarters) chunks for the configured simulation mode.
         
-        for i in range(len(conservative['revenue'])):
-            ebitda = conservative['revenue'][i] - conservative['expenses'][i]
-            conservative['ebitda'].append(ebitda)
-            conservative['cash_flow'].append(ebitda * 0.82)
+        At most ``chunk_size`` (default ``simulation_chunk_size``) paths are held
+        at once. Chunk ``i`` draws from its own generator seeded by ``(seed, i)``,
+        so any chunk can be simulated on its own, e.g. in another process.
+        """
+        for index, size in self._chunk_sizes(self.monte_carlo_simulations, chunk_size):
+            yield self._simulate_chunk(historical_data, base_forecast, assumptions,
+                                       self._chunk_rng(seed, index), size)
+    
+    def _simulate_chunk(self, historical_data: List[HistoricalData],
+                        base_forecast: Dict[str, List[float]],
+                        assumptions: ForecastAssumptions,
+                        rng: np.random.Generator, size: int) -> Dict[str, np.ndarray]:
+        """One (size x quarters) chunk of paths for the configured simulation mode."""
+        if self.simulation_mode == "path_dependent":
+            starting_revenue = historical_data[-1].revenue if historical_data else 1000000
+            return self._draw_driver_paths(starting_revenue, base_forecast['periods'], assumptions,
+                                           self.driver_dynamics, size, rng)
+        return self._draw_independent_paths(base_forecast, size, rng)
+    
+    def _chunk_sizes(self, n_paths: int, chunk_size: Optional[int] = None) -> Iterator[Tuple[int, int]]:
+        """(index, size) of each chunk covering ``n_paths`` paths."""
+        chunk_size = chunk_size or self.simulation_chunk_size
+        for index, start in enumerate(range(0, n_paths, chunk_size)):
+            yield index, min(chunk_size, n_paths - start)
+    
+    def _chunk_rng(self, seed: Optional[int], index: int) -> np.random.Generator:
+        """Independent generator for chunk ``index`` of a seeded run."""
+        seed = self.random_seed if seed is None else seed
+        return np.random.default_rng(None if seed is None else [seed, index])
+    
+    def simulate_driver_paths(self, starting_revenue: float, periods: List[str],
+                              assumptions: ForecastAssumptions,
+                              dynamics: Optional[DriverDynamics] = None,
+                              simulations: Optional[int] = None,
+                              seed: Optional[int] = None,
+                              chunk_size: Optional[int] = None) -> Iterator[Dict[str, np.ndarray]]:
+        """
+        Simulate path-dependent forecasts in chunks of (paths x quarters) arrays.
+        
+        Growth, expense ratio and cash conversion follow mean-reverting processes
+        driven by Cholesky-correlated shocks, so shocks compound through the
+        revenue level. Only ``chunk_size`` (default ``simulation_chunk_size``)
+        paths are held at once; chunks are seeded as in ``simulate_forecast_paths``.
+        """
+        dynamics = dynamics or self.driver_dynamics
+        n_paths = simulations or self.monte_carlo_simulations
+        for index, size in self._chunk_sizes(n_paths, chunk_size):
+            yield self._draw_driver_paths(starting_revenue, periods, assumptions, dynamics,
+                                          size, self._chunk_rng(seed, index))
+    
+    def _draw_driver_paths(self, starting_revenue: float, periods: List[str],
+                           assumptions: ForecastAssumptions, dynamics: DriverDynamics,
+                           size: int, rng: np.random.Generator) -> Dict[str, np.ndarray]:
+        """Draw ``size`` path-dependent (paths x quarters) arrays from ``rng``."""
+        cholesky = np.linalg.cholesky(np.asarray(dynamics.correlation, dtype=float))
+        volatility = np.array([dynamics.growth_volatility, dynamics.expense_ratio_volatility,
+                               dynamics.cash_conversion_volatility])
+        long_run = np.array([assumptions.revenue_growth_rate / parse_periods(periods)[2], assumptions.expense_ratio,
+                             dynamics.cash_conversion_mean])
+        seasonal = np.array([assumptions.seasonal_factor.get(self._season_quarter(p), 1.0) for p in periods])
+        seasonal *= self._market_multiplier(assumptions)
+        k = dynamics.mean_reversion
+        quarters = len(periods)
+        
+        shocks = rng.standard_normal((size, quarters, 3)) @ cholesky.T * volatility
+        drivers = np.empty((size, quarters, 3))
+        state = np.broadcast_to(long_run, (size, 3))
+        for q in range(quarters):
+            state = state + k * (long_run - state) + shocks[:, q, :]
+            drivers[:, q, :] = state
         
-        scenarios['conservative'] = conservative
+        growth = drivers[:, :, 0]
+        expense_ratio = np.clip(drivers[:, :, 1], 0.0, None)
+        cash_conversion = np.clip(drivers[:, :, 2], 0.0, 1.0)
         
-        return scenarios
+        revenue = starting_revenue * np.cumprod(1 + growth, axis=1) * seasonal
+        ebitda = revenue * (1 - expense_ratio)
+        return {
+            'revenue': revenue,
+            'ebitda': ebitda,
+            'cash_flow': ebitda * cash_conversion
+        }
     
-    def calculate_confidence_bands(self, base_forecast: Dict[str, List[float]],
-                                 assumptions: ForecastAssumptions) -> Dict[str, List[Tuple[float, float]]]:
-        """Calculate confidence bands using Monte Carlo simulation."""
+    def calculate_path_dependent_bands(self, starting_revenue: float, periods: List[str],
+                                       assumptions: ForecastAssumptions,
+                                       dynamics: Optional[DriverDynamics] = None,
+                                       simulations: Optional[int] = None,
+                                       seed: Optional[int] = None) -> Dict[str, List[Tuple[float, float]]]:
+        """
+        Confidence bands from path-dependent simulation with bounded memory.
         
-        confidence_bands = {
-            'revenue': [],
-            'ebitda': [],
-            'cash_flow': []
+        A single chunk gets exact quantiles; several chunks are pooled through
+        a ``HistogramSketch`` per metric, so the bands do not depend on the
+        chunk size beyond one bin width.
+        """
+        chunks = self.simulate_driver_paths(starting_revenue, periods, assumptions,
+                                            dynamics, simulations, seed)
+        return self._chunked_bands(chunks, assumptions.confidence_interval)
+    
+    def _chunked_bands(self, chunks: Iterator[Dict[str, np.ndarray]],
+                       confidence_level: float) -> Dict[str, List[Tuple[float, float]]]:
+        """Pool simulated chunks into bands: exact for one chunk, sketched beyond that."""
+        first: Optional[Dict[str, np.ndarray]] = None
+        sketches: Optional[Dict[str, HistogramSketch]] = None
+        
+        for chunk in chunks:
+            if first is None:
+                first = chunk
+                continue
+            if sketches is None:
+                sketches = {metric: HistogramSketch() for metric in first}
+                for metric, values in first.items():
+                    sketches[metric].add(values)
+            for metric, values in chunk.items():
+                sketches[metric].add(values)
+        
+        if first is None:
+            return {}
+        if sketches is None:
+            return self._quantile_bands(first, confidence_level)
+        return self._sketch_bands(sketches, confidence_level)
+    
+    def _sketch_bands(self, sketches: Dict[str, HistogramSketch],
+                      confidence_level: float) -> Dict[str, List[Tuple[float, float]]]:
+        """Per-quarter (lower, upper) bands from per-metric quantile sketches."""
+        lower_percentile = (1 - confidence_level) / 2
+        return {
+            metric: [(float(lo), float(hi))
+                     for lo, hi in sketch.quantiles([lower_percentile, 1 - lower_percentile]).T]
+            for metric, sketch in sketches.items()
         }
+    
+    def _market_multiplier(self, assumptions: ForecastAssumptions) -> float:
+        """Revenue adjustment for the assumed market conditions."""
+        return {
+            'growth': 1.05,
+            'stable': 1.0,
+            'decline': 0.95
+        }.get(assumptions.market_conditions, 1.0)
+    
+    def _season_quarter(self, period: str) -> int:
+        """Quarter of year (1-4) from a "2023-Q1" or "2023-12" period label; 0 for annual labels."""
+        return int(parse_periods([period])[1][0])
+    
+    def _quantile_bands(self, paths: Dict[str, np.ndarray],
+                        confidence_level: float) -> Dict[str, List[Tuple[float, float]]]:
+        """Per-quarter (lower, upper) bands from simulated (paths x quarters) arrays."""
+        lower_percentile = (1 - confidence_level) / 2
+        upper_percentile = 1 - lower_percentile
         
-        # Simplified Monte Carlo - vary key assumptions
-        for quarter in range(len(base_forecast['revenue'])):
-            simulations = {
-                'revenue': [],
-                'ebitda': [],
-                'cash_flow': []
-            }
-            
-            # Run simulations
-            for _ in range(100):  # Reduced for demo
-                # Vary growth rate and expense ratio
-                growth_variance = random.uniform(-0.05, 0.05)  # ±5% variance
-                expense_variance = random.uniform(-0.03, 0.03)  # ±3% variance
-                
-                # Apply variance to base forecast
-                sim_revenue = base_forecast['revenue'][quarter] * (1 + growth_variance)
-                sim_expenses = base_forecast['expenses'][quarter] * (1 + expense_variance)
-                sim_ebitda = sim_revenue - sim_expenses
-                sim_cash_flow = sim_ebitda * random.uniform(0.75, 0.95)
-                
-                simulations['revenue'].append(sim_revenue)
-                simulations['ebitda'].append(sim_ebitda)
-                simulations['cash_flow'].append(sim_cash_flow)
-            
-            # Calculate confidence intervals
-            confidence_level = assumptions.confidence_interval
-            lower_percentile = (1 - confidence_level) / 2
-            upper_percentile = 1 - lower_percentile
-            
-            for metric in ['revenue', 'ebitda', 'cash_flow']:
-                values = sorted(simulations[metric])
-                lower_idx = int(len(values) * lower_percentile)
-                upper_idx = int(len(values) * upper_percentile)
-                
-                lower_bound = values[lower_idx] if lower_idx < len(values) else values[0]
-                upper_bound = values[upper_idx] if upper_idx < len(values) else values[-1]
-                
-                confidence_bands[metric].append((lower_bound, upper_bound))
+        confidence_bands = {}
+        for metric, values in paths.items():
+            if values.size == 0:
+                confidence_bands[metric] = []
+                continue
+            lower, upper = np.quantile(values, [lower_percentile, upper_percentile], axis=0)
+            confidence_bands[metric] = [(float(lo), float(hi)) for lo, hi in zip(lower, upper)]
         
         return confidence_bands
     
@@ -272,7 +719,8 @@ class FinancialForecastAnalyzer:
         risks_opps = []
         
         # Revenue growth analysis
-        revenue_growth = [(forecast_data['base']['revenue'][i] / forecast_data['base']['revenue'][i-1] - 1) * 4 
+        periods_per_year = parse_periods(forecast_data['base'].get('periods', []))[2]
+        revenue_growth = [(forecast_data['base']['revenue'][i] / forecast_data['base']['revenue'][i-1] - 1) * periods_per_year 
                          for i in range(1, len(forecast_data['base']['revenue']))]
         avg_growth = sum(revenue_growth) / len(revenue_growth) if revenue_growth else 0
         
@@ -306,7 +754,8 @@ class FinancialForecastAnalyzer:
         return risks_opps
     
     def generate_forecast(self, historical_data: List[HistoricalData],
-                         assumptions: ForecastAssumptions) -> ForecastResult:
+                         assumptions: ForecastAssumptions,
+                         seed: Optional[int] = None) -> ForecastResult:
         """Generate comprehensive financial forecast."""
         
         # Generate base forecast
@@ -317,7 +766,110 @@ class FinancialForecastAnalyzer:
         scenarios['base'] = base_forecast
         
         # Calculate confidence bands
-        confidence_bands = self.calculate_confidence_bands(base_forecast, assumptions)
+        if self.simulation_mode == "path_dependent":
+            starting_revenue = historical_data[-1].revenue if historical_data else 1000000
+            confidence_bands = self.calculate_path_dependent_bands(
+                starting_revenue, base_forecast['periods'], assumptions, seed=seed)
+        else:
+            confidence_bands = self.calculate_confidence_bands(base_forecast, assumptions, seed=seed)
+        
+        return self._assemble_result(base_forecast, scenarios, confidence_bands, assumptions)
+    
+    def forecast_portfolio(self, units: List[BusinessUnit], seed: Optional[int] = None,
+                           max_workers: Optional[int] = None) -> PortfolioForecast:
+        """
+        Forecast many business units in a process pool and consolidate them.
+        
+        Each unit gets a deterministic seed spawned from ``seed`` by position, so
+        results do not depend on scheduling. Group bands come from summing the
+        simulated paths across units before taking quantiles, rather than adding
+        per-unit percentiles. The summed paths are regenerated from the unit
+        seeds one ``simulation_chunk_size`` chunk per task in the same pool,
+        and each task returns quantile sketches that are merged here.
+        """
+        unit_seeds = [int(child.generate_state(1)[0])
+                      for child in np.random.SeedSequence(seed).spawn(len(units))]
+        
+        if max_workers == 1 or len(units) <= 1:
+            outcomes = map(_forecast_unit, [self] * len(units), units, unit_seeds)
+            return self._consolidate_portfolio(units, outcomes, unit_seeds)
+        
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            chunksize = max(1, len(units) // ((max_workers or 4) * 4))
+            outcomes = executor.map(_forecast_unit, [self] * len(units), units, unit_seeds,
+                                    chunksize=chunksize)
+            return self._consolidate_portfolio(units, outcomes, unit_seeds, executor)
+    
+    def _consolidate_portfolio(self, units: List[BusinessUnit], outcomes: Iterator[ForecastResult],
+                               unit_seeds: List[int],
+                               executor: Optional[ProcessPoolExecutor] = None) -> PortfolioForecast:
+        """Sum unit forecasts as results arrive, then band the summed simulated paths."""
+        unit_results = {}
+        results: List[ForecastResult] = []
+        consolidated = {}
+        periods: List[str] = []
+        confidence_level = 0.80
+        
+        for unit, result in zip(units, outcomes):
+            unit_results[unit.name] = result
+            results.append(result)
+            periods = result.forecast_periods
+            confidence_level = unit.assumptions.confidence_interval
+            for metric, values in (('revenue', result.revenue_forecast), ('expenses', result.expense_forecast),
+                                   ('ebitda', result.ebitda_forecast), ('cash_flow', result.cash_flow_forecast)):
+                consolidated[metric] = consolidated.get(metric, 0.0) + np.asarray(values)
+        
+        consolidated_forecast = {metric: values.tolist() for metric, values in consolidated.items()}
+        total_revenue = sum(consolidated_forecast.get('revenue', []))
+        total_ebitda = sum(consolidated_forecast.get('ebitda', []))
+        
+        return PortfolioForecast(
+            forecast_periods=periods,
+            unit_results=unit_results,
+            consolidated_forecast=consolidated_forecast,
+            consolidated_bands=self._portfolio_bands(units, results, unit_seeds, confidence_level, executor),
+            key_metrics={
+                'business_units': len(unit_results),
+                'total_revenue_forecast': total_revenue,
+                'total_ebitda_forecast': total_ebitda,
+                'avg_margin_percent': (total_ebitda / total_revenue) * 100 if total_revenue > 0 else 0,
+                'cash_flow_total': sum(consolidated_forecast.get('cash_flow', []))
+            }
+        )
+    
+    def _portfolio_bands(self, units: List[BusinessUnit], results: List[ForecastResult],
+                         unit_seeds: List[int], confidence_level: float,
+                         executor: Optional[ProcessPoolExecutor] = None) -> Dict[str, List[Tuple[float, float]]]:
+        """
+        Bands of path sums across units, one chunk of summed paths per task.
+        
+        A single chunk is banded exactly; otherwise each task reduces its chunk
+        to per-metric ``HistogramSketch`` objects and the sketches are merged.
+        """
+        if not units:
+            return {}
+        bases = [result.scenario_analysis['base'] for result in results]
+        chunks = list(self._chunk_sizes(self.monte_carlo_simulations))
+        if len(chunks) == 1:
+            index, size = chunks[0]
+            return self._quantile_bands(_sum_unit_chunk(self, units, bases, unit_seeds, index, size),
+                                        confidence_level)
+        
+        indices, sizes = zip(*chunks)
+        repeat = len(chunks)
+        sketch_map = executor.map if executor is not None else map
+        merged: Dict[str, HistogramSketch] = {}
+        for sketches in sketch_map(_sketch_unit_chunk, [self] * repeat, [units] * repeat, [bases] * repeat,
+                                   [unit_seeds] * repeat, indices, sizes):
+            for metric, sketch in sketches.items():
+                merged[metric] = merged[metric].merge(sketch) if metric in merged else sketch
+        return self._sketch_bands(merged, confidence_level)
+    
+    def _assemble_result(self, base_forecast: Dict[str, List[float]],
+                         scenarios: Dict[str, Dict[str, List[float]]],
+                         confidence_bands: Dict[str, List[Tuple[float, float]]],
+                         assumptions: ForecastAssumptions) -> ForecastResult:
+        """Compute key metrics and risks and package the forecast result."""
         
         # Calculate key metrics
         total_revenue = sum(base_forecast['revenue'])
@@ -352,6 +904,128 @@ class FinancialForecastAnalyzer:
             risks_opportunities=risks_opportunities
         )
     
+    def start_rolling_forecast(self, historical_data: List[HistoricalData],
+                               assumptions: ForecastAssumptions,
+                               seed: Optional[int] = None) -> ForecastResult:
+        """
+        Build a forecast whose horizon follows the last actual period and keep
+        the state needed to roll it forward with ``update``.
+        
+        The actuals may be monthly, quarterly or annual; the horizon covers the
+        same span as ``forecast_horizon_quarters`` at that frequency. Growth and
+        seasonality are re-estimated from the actuals seen so far and override
+        ``assumptions`` once there is enough history; the simulation mode in
+        effect here is kept for the life of the rolling forecast.
+        """
+        if not historical_data:
+            raise ValueError("Rolling forecasts require at least one actual period")
+        
+        trend_state = TrendState()
+        for data in historical_data:
+            trend_state.add(data)
+        
+        periods_per_year = parse_periods([d.period for d in historical_data])[2]
+        periods = []
+        period = historical_data[-1].period
+        for _ in range(max(1, self.forecast_horizon_quarters * periods_per_year // 4)):
+            period = next_period(period)
+            periods.append(period)
+        
+        rng = np.random.default_rng(self.random_seed if seed is None else seed)
+        path_dependent = self.simulation_mode == "path_dependent"
+        self.rolling_state = RollingForecastState(
+            historical_data=list(historical_data),
+            assumptions=assumptions,
+            trend_state=trend_state,
+            periods=periods,
+            periods_per_year=periods_per_year,
+            simulation_mode=self.simulation_mode,
+            normalized_bands=None if path_dependent else self._normalized_band_columns(
+                rng, len(periods), assumptions),
+            rng=rng
+        )
+        return self._refresh_rolling_forecast()
+    
+    def update(self, actual: HistoricalData) -> ForecastResult:
+        """
+        Roll the forecast forward by one actual period.
+        
+        The actual must be for the first forecast period. Trend statistics
+        update in O(1); in independent mode simulated bands for periods still in
+        the horizon are reused and only the newly exposed final period is
+        simulated. Base, scenario and metric figures are re-projected from the
+        new actual and trends, which costs O(horizon). Path-dependent bands
+        compound from the latest actual, so they are re-simulated in full.
+        """
+        state = self.rolling_state
+        if state is None:
+            raise ValueError("Call start_rolling_forecast before update")
+        if actual.period != state.periods[0]:
+            raise ValueError(f"Expected the actual for {state.periods[0]}, got {actual.period}")
+        
+        state.historical_data.append(actual)
+        state.trend_state.add(actual)
+        state.periods = state.periods[1:] + [next_period(state.periods[-1])]
+        if state.normalized_bands is not None:
+            new_period = self._normalized_band_columns(state.rng, 1, state.assumptions)
+            state.normalized_bands = np.concatenate([state.normalized_bands[1:], new_period])
+        
+        return self._refresh_rolling_forecast()
+    
+    def _refresh_rolling_forecast(self) -> ForecastResult:
+        """Re-project the rolling forecast from the latest actual, trends and bands."""
+        state = self.rolling_state
+        assumptions = self._trend_assumptions(state.trend_state, state.assumptions, state.periods_per_year)
+        last_revenue = state.historical_data[-1].revenue
+        base_forecast = self._project_base_forecast(last_revenue, state.periods, assumptions)
+        scenarios = self.generate_scenario_analysis(base_forecast, assumptions)
+        scenarios['base'] = base_forecast
+        
+        if state.normalized_bands is None:
+            confidence_bands = self.calculate_path_dependent_bands(
+                last_revenue, state.periods, assumptions, seed=int(state.rng.integers(2 ** 32)))
+        else:
+            # Bands scale linearly with base revenue; sort keeps (lower, upper) if it is negative
+            scaled = np.sort(state.normalized_bands * np.asarray(base_forecast['revenue'])[:, None, None],
+                             axis=-1)
+            confidence_bands = {
+                metric: [(float(lo), float(hi)) for lo, hi in scaled[:, m, :]]
+                for m, metric in enumerate(('revenue', 'ebitda', 'cash_flow'))
+            }
+        
+        state.result = self._assemble_result(base_forecast, scenarios, confidence_bands, assumptions)
+        return state.result
+    
+    def _trend_assumptions(self, trend_state: TrendState, assumptions: ForecastAssumptions,
+                           periods_per_year: int = 4) -> ForecastAssumptions:
+        """Assumptions with growth and seasonality re-estimated from the actuals."""
+        trends = trend_state.to_trends()
+        overrides: Dict[str, Any] = {}
+        if trend_state.growth_count:
+            overrides['revenue_growth_rate'] = trends['growth_rate'] * periods_per_year  # Per period to annual
+        if len(trends['seasonality']) == 4:
+            overrides['seasonal_factor'] = trends['seasonality']
+        return replace(assumptions, **overrides)
+    
+    def _normalized_band_columns(self, rng: np.random.Generator, quarters: int,
+                                 assumptions: ForecastAssumptions) -> np.ndarray:
+        """
+        Simulate independent-quarter bands per unit of base revenue.
+        
+        With expenses a fixed share of revenue, simulated revenue, EBITDA and cash
+        flow are all base revenue times a random factor, so bands can be cached
+        in normalized form and rescaled when the base forecast moves.
+        """
+        shape = (self.monte_carlo_simulations, quarters)
+        revenue = 1 + rng.uniform(-0.05, 0.05, shape)
+        ebitda = revenue - assumptions.expense_ratio * (1 + rng.uniform(-0.03, 0.03, shape))
+        cash_flow = ebitda * rng.uniform(0.75, 0.95, shape)
+        
+        lower_percentile = (1 - assumptions.confidence_interval) / 2
+        bands = np.quantile(np.stack([revenue, ebitda, cash_flow], axis=-1),
+                            [lower_percentile, 1 - lower_percentile], axis=0)
+        return np.moveaxis(bands, 0, -1)  # (quarters x metrics x 2)
+    
     def export_forecast(self, result: ForecastResult, company_name: str = "Company") -> str:
         """Export forecast analysis to JSON."""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -384,6 +1058,39 @@ class FinancialForecastAnalyzer:
         return filename
 
 
+def _forecast_unit(analyzer: FinancialForecastAnalyzer, unit: BusinessUnit,
+                   seed: int) -> ForecastResult:
+    """Process-pool worker: forecast one unit."""
+    return analyzer.generate_forecast(unit.historical_data, unit.assumptions, seed)
+
+
+def _sum_unit_chunk(analyzer: FinancialForecastAnalyzer, units: List[BusinessUnit],
+                    bases: List[Dict[str, List[float]]], unit_seeds: List[int],
+                    index: int, size: int) -> Dict[str, np.ndarray]:
+    """Chunk ``index`` of every unit's paths, summed across units one unit at a time."""
+    summed: Dict[str, np.ndarray] = {}
+    for unit, base, seed in zip(units, bases, unit_seeds):
+        chunk = analyzer._simulate_chunk(unit.historical_data, base, unit.assumptions,
+                                         analyzer._chunk_rng(seed, index), size)
+        for metric, values in chunk.items():
+            if metric in summed:
+                summed[metric] += values
+            else:
+                summed[metric] = values
+    return summed
+
+
+def _sketch_unit_chunk(analyzer: FinancialForecastAnalyzer, units: List[BusinessUnit],
+                       bases: List[Dict[str, List[float]]], unit_seeds: List[int],
+                       index: int, size: int) -> Dict[str, HistogramSketch]:
+    """Process-pool worker: quantile sketches of one chunk of summed portfolio paths."""
+    sketches = {}
+    for metric, values in _sum_unit_chunk(analyzer, units, bases, unit_seeds, index, size).items():
+        sketches[metric] = HistogramSketch()
+        sketches[metric].add(values)
+    return sketches
+
+
 def demo_usage():
     """Demonstrate the financial forecast analyzer."""
     print("📈 Financial Forecast Analyzer Demo")
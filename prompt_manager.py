@@ -5,13 +5,16 @@ This module provides the core infrastructure for managing executive-level AI pro
 including dynamic customization, template variables, and quality validation.
 """
 
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Union, TYPE_CHECKING
 from dataclasses import dataclass, field
 from enum import Enum
 import json
 import uuid
 from datetime import datetime
 
+if TYPE_CHECKING:
+    from analytics_store import SQLiteExecutionStore
+
 
 class IndustryType(Enum):
     FINANCIAL_SERVICES = "financial_services"
@@ -86,10 +89,12 @@ class PromptExecution:
 class PromptManager:
     """Central management system for executive AI prompts."""
     
-    def __init__(self):
+    def __init__(self, store: Optional['SQLiteExecutionStore'] = None):
         self.templates: Dict[str, PromptTemplate] = {}
         self.executions: List[PromptExecution] = []
         self.context_adapters: Dict[str, callable] = {}
+        # Optional SQLite backend; when set, executions are persisted there instead of in memory
+        self.store = store
         
     def register_template(self, template: PromptTemplate) -> str:
         """Register a new prompt template."""
@@ -160,12 +165,18 @@ class PromptManager:
             generated_prompt=generated_prompt
         )
         
-        self.executions.append(execution)
+        if self.store:
+            self.store.add(execution, category=self.templates[template_id].category)
+        else:
+            self.executions.append(execution)
         return execution
     
     def update_execution_response(self, execution_id: str, response: str, 
                                  quality_score: Optional[float] = None) -> bool:
         """Update execution with response and quality score."""
+        if self.store:
+            return self.store.update_response(execution_id, response, quality_score)
+        
         for execution in self.executions:
             if execution.id == execution_id:
                 execution.response = response
@@ -177,6 +188,20 @@ class PromptManager:
                           industry: Optional[IndustryType] = None,
                           role: Optional[ExecutiveRole] = None) -> Dict[str, Any]:
         """Generate usage analytics for prompts."""
+        if self.store:
+            filters = {
+                'category': category.value if category else None,
+                'industry': industry.value if industry else None,
+                'role': role.value if role else None
+            }
+            total_executions, avg_quality = self.store.average_quality(**filters)
+            return {
+                'total_executions': total_executions,
+                'average_quality_score': avg_quality,
+                'popular_templates': self.store.top_counts('template_id', limit=10, **filters),
+                'execution_count_by_day': self.store.executions_by_day(**filters)
+            }
+        
         filtered_executions = self.executions
         
         if category or industry or role:
@@ -4,10 +4,13 @@ Simple working implementation for portfolio demonstration
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Sequence, Union
+from collections import deque
+import heapq
 import json
 from datetime import datetime
 import math
+import numpy as np
 
 
 @dataclass
@@ -24,6 +27,149 @@ class Competitor:
     strategic_moves: List[str] = field(default_factory=list)
 
 
+@dataclass
+class CompetitorTable:
+    """Column-oriented view of a competitor list for large, fragmented markets."""
+    competitors: List[Competitor]
+    market_share: np.ndarray
+    revenue: np.ndarray
+    growth_rate: np.ndarray
+    strength_score: np.ndarray
+    high_threat: np.ndarray  # threat_level is "high" or "critical"
+    innovative: np.ndarray  # "innovation" listed among key strengths
+    
+    @classmethod
+    def from_competitors(cls, competitors: Sequence[Competitor]) -> 'CompetitorTable':
+        competitors = list(competitors)
+        return cls(
+            competitors=competitors,
+            market_share=np.array([c.market_share for c in competitors], dtype=float),
+            revenue=np.array([c.revenue for c in competitors], dtype=float),
+            growth_rate=np.array([c.growth_rate for c in competitors], dtype=float),
+            strength_score=np.array([c.strength_score for c in competitors], dtype=float),
+            high_threat=np.array([c.threat_level in ("high", "critical") for c in competitors], dtype=bool),
+            innovative=np.array(["innovation" in [s.lower() for s in c.key_strengths] for c in competitors],
+                                dtype=bool)
+        )
+    
+    def __len__(self) -> int:
+        return len(self.competitors)
+    
+    def names(self, mask: np.ndarray) -> List[str]:
+        """Names of the competitors selected by ``mask``, in table order."""
+        return [self.competitors[i].name for i in np.flatnonzero(mask).tolist()]
+    
+    def leaders(self, n: int) -> List[Competitor]:
+        """Top ``n`` competitors by market share (ties keep table order)."""
+        shares = self.market_share.tolist()
+        return [self.competitors[i] for i in heapq.nlargest(n, range(len(shares)), key=shares.__getitem__)]
+
+
+class MarketSharePanel:
+    """
+    Time-indexed market shares with incrementally maintained trend metrics.
+    
+    Each ``update`` aligns the new period's shares to the known competitors and
+    refreshes HHI/CR4, the share-shift decomposition against the previous
+    period and an EWMA of share changes per competitor, all in O(competitors).
+    Only the last ``window`` share vectors are kept for rolling comparisons.
+    Periods without any positive share are skipped so they never become the
+    baseline for the next period.
+    """
+    
+    def __init__(self, window: int = 12, momentum_alpha: float = 0.3,
+                 momentum_threshold: float = 0.001, top_n: int = 3):
+        self.window = window
+        self.momentum_alpha = momentum_alpha
+        self.momentum_threshold = momentum_threshold  # Share points per period, as a fraction
+        self.top_n = top_n
+        self.names: List[str] = []
+        self._index: Dict[str, int] = {}
+        self.periods: List[str] = []
+        self.hhi_series: List[float] = []
+        self.cr4_series: List[float] = []
+        self.momentum = np.zeros(0)
+        self._history: deque = deque(maxlen=window)
+    
+    def _align(self, shares: Dict[str, float]) -> np.ndarray:
+        """Share vector in panel column order; unseen competitors get new columns."""
+        for name in shares:
+            if name not in self._index:
+                self._index[name] = len(self.names)
+                self.names.append(name)
+        vector = np.zeros(len(self.names))
+        vector[[self._index[name] for name in shares]] = list(shares.values())
+        return vector
+    
+    def _top(self, values: np.ndarray, n: int, largest: bool = True) -> List[Tuple[str, float]]:
+        """Up to ``n`` largest positive (or, with ``largest=False``, most negative) entries."""
+        pick = heapq.nlargest if largest else heapq.nsmallest
+        values_list = values.tolist()
+        candidates = np.flatnonzero(values > 0 if largest else values < 0).tolist()
+        return [(self.names[i], values_list[i]) for i in pick(n, candidates, key=values_list.__getitem__)]
+    
+    def update(self, period: str, shares: Dict[str, float]) -> Optional[Dict[str, Any]]:
+        """Add one period of market shares (fractions) and return its metrics; None if it is empty."""
+        if not any(share > 0 for share in shares.values()):
+            return None
+        current = self._align(shares)
+        n = len(current)
+        previous = self._history[-1] if self._history else np.zeros(0)
+        previous = np.pad(previous, (0, n - len(previous)))
+        
+        hhi = float(np.square(current * 100).sum())
+        cr4 = float((np.partition(current, n - 4)[-4:] if n > 4 else current).sum()) * 100
+        self.periods.append(period)
+        self.hhi_series.append(hhi)
+        self.cr4_series.append(cr4)
+        
+        # Share-shift decomposition: dHHI = 2*sum(s_prev*ds) + sum(ds^2), in HHI points
+        change = current - previous if self._history else np.zeros(n)
+        reallocation = float(2e4 * (previous * change).sum())
+        dispersion = float(1e4 * np.square(change).sum())
+        shift = {
+            'hhi_change': reallocation + dispersion,
+            'reallocation_effect': reallocation,
+            'dispersion_effect': dispersion,
+            'turnover': float(np.abs(change).sum() / 2),
+            'entry_share': float(current[(previous == 0) & (current > 0)].sum()) if self._history else 0.0,
+            'exit_share': float(previous[(previous > 0) & (current == 0)].sum()),
+            'gainers': self._top(change, self.top_n) if self._history else [],
+            'losers': self._top(change, self.top_n, largest=False) if self._history else []
+        }
+        
+        # Momentum: EWMA of period-over-period share change
+        momentum = np.pad(self.momentum, (0, n - len(self.momentum)))
+        momentum += self.momentum_alpha * (change - momentum)
+        self.momentum = momentum
+        rising = np.flatnonzero(momentum >= self.momentum_threshold)
+        momentum_threats = [(self.names[i], float(momentum[i]), float(current[i]))
+                            for i in heapq.nlargest(len(rising), rising.tolist(), key=momentum.__getitem__)]
+        
+        self._history.append(current)
+        oldest = np.pad(self._history[0], (0, n - len(self._history[0])))
+        
+        return {
+            'period': period,
+            'competitors': n,
+            'hhi': hhi,
+            'cr4': cr4,
+            'hhi_trend': self.trend(self.hhi_series),
+            'cr4_trend': self.trend(self.cr4_series),
+            'share_shift': shift,
+            'window_gainers': self._top(current - oldest, self.top_n),
+            'momentum_threats': momentum_threats
+        }
+    
+    def trend(self, series: List[float]) -> float:
+        """OLS slope per period over the last ``window`` points (O(window))."""
+        values = series[-self.window:]
+        if len(values) < 2:
+            return 0.0
+        x = np.arange(len(values)) - (len(values) - 1) / 2
+        return float((x * np.array(values)).sum() / np.square(x).sum())
+
+
 @dataclass
 class CompetitivePosition:
     """Our competitive position analysis."""
@@ -64,6 +210,11 @@ class CompetitiveLandscapeAssessor:
             "market_share", "brand_strength", "product_quality", "pricing",
             "distribution", "innovation", "financial_resources", "customer_loyalty"
         ]
+        self.share_panel = MarketSharePanel()
+    
+    def track_market_shares(self, period: str, competitors: Sequence[Competitor]) -> Optional[Dict[str, Any]]:
+        """Feed one period's competitor shares into the panel and return its trend metrics."""
+        return self.share_panel.update(period, {c.name: c.market_share for c in competitors})
     
     def calculate_competitive_strength(self, competitor: Competitor,
                                      factor_scores: Dict[str, float] = None) -> float:
@@ -91,13 +242,90 @@ class CompetitiveLandscapeAssessor:
         
         return weighted_score
     
+    def competitive_strengths(self, table: CompetitorTable) -> np.ndarray:
+        """Basic ``calculate_competitive_strength`` for every competitor at once."""
+        market_share_score = np.minimum(10, table.market_share * 20)
+        growth_score = np.clip(table.growth_rate * 20 + 5, 0, 10)
+        return (market_share_score + growth_score + table.strength_score) / 3
+    
+    def classify_threats(self, table: CompetitorTable,
+                         strength: Optional[np.ndarray] = None) -> Dict[str, List[str]]:
+        """Threat matrix for the whole table, same precedence as ``identify_competitive_threats``."""
+        if strength is None:
+            strength = self.competitive_strengths(table)
+        growth = table.growth_rate
+        
+        immediate = table.high_threat & (strength >= 7.0) & (growth > 0.10)
+        emerging = ~immediate & (growth > 0.20) & (strength >= 6.0)
+        leaders = ~immediate & ~emerging & (table.market_share >= 0.15)
+        disruptors = ~immediate & ~emerging & ~leaders & table.innovative & (growth > 0.15)
+        
+        return {
+            'immediate_threats': table.names(immediate),
+            'emerging_threats': table.names(emerging),
+            'potential_disruptors': table.names(disruptors),
+            'market_leaders': table.names(leaders)
+        }
+    
+    def analyze_competitor_table(self, competitors: Union[CompetitorTable, Sequence[Competitor]]) -> Dict[str, Any]:
+        """
+        Concentration, strength and threat analytics in one vectorized pass.
+        
+        CR4/CR8 use a partial partition instead of a full sort and leaders come
+        from ``heapq.nlargest``, so cost is O(n) plus O(n log 3).
+        """
+        table = competitors if isinstance(competitors, CompetitorTable) else CompetitorTable.from_competitors(competitors)
+        strength = self.competitive_strengths(table)
+        
+        return {
+            **self._concentration_metrics(table),
+            'strength_scores': dict(zip((c.name for c in table.competitors), strength.tolist())),
+            'threat_matrix': self.classify_threats(table, strength),
+            **self._gap_metrics(table)
+        }
+    
+    def _gap_metrics(self, table: CompetitorTable) -> Dict[str, Any]:
+        """Leading market share and number of fast-growing (>15%) competitors."""
+        return {
+            'max_market_share': float(table.market_share.max()) if len(table) else 0.0,
+            'fast_growers': int((table.growth_rate > 0.15).sum())
+        }
+    
+    def _concentration_metrics(self, table: CompetitorTable) -> Dict[str, Any]:
+        """HHI, CR4/CR8, concentration level and the top three competitors."""
+        shares = table.market_share
+        
+        def top_share(k: int) -> float:
+            if len(shares) <= k:
+                return float(shares.sum()) * 100
+            return float(np.partition(shares, len(shares) - k)[-k:].sum()) * 100
+        
+        # Herfindahl-Hirschman Index (HHI)
+        hhi = float(np.square(shares * 100).sum())
+        
+        if hhi < 1500:
+            concentration_level, competitive_intensity = "low", "high"
+        elif hhi < 2500:
+            concentration_level, competitive_intensity = "moderate", "moderate"
+        else:
+            concentration_level, competitive_intensity = "high", "low"
+        
+        return {
+            'hhi': hhi,
+            'cr4': top_share(4),
+            'cr8': top_share(8),
+            'concentration_level': concentration_level,
+            'competitive_intensity': competitive_intensity,
+            'market_leaders': table.leaders(3)
+        }
+    
     def analyze_market_concentration(self, competitors: List[Competitor]) -> Dict[str, Any]:
         """Analyze market concentration and competitive structure."""
         if not competitors:
             return {'hhi': 0, 'cr4': 0, 'concentration_level': 'unknown'}
         
-        # Sort competitors by market share
-        sorted_competitors = sorted(competitors, key=lambda x: x.market_share, reverse=True)
+        # Top firms by market share without a full sort
+        sorted_competitors = heapq.nlargest(4, competitors, key=lambda x: x.market_share)
         
         # Calculate Herfindahl-Hirschman Index (HHI)
         hhi = sum((comp.market_share * 100) ** 2 for comp in competitors)
@@ -158,33 +386,38 @@ class CompetitiveLandscapeAssessor:
         return threat_matrix
     
     def analyze_competitive_gaps(self, our_position: CompetitivePosition,
-                               competitors: List[Competitor]) -> List[str]:
-        """Identify competitive gaps and improvement opportunities."""
-        gaps = []
-        
-        if not competitors:
+                               competitors: Union[CompetitorTable, Sequence[Competitor]]) -> List[str]:
+        """
+        Identify competitive gaps and improvement opportunities.
+        
+        Share and growth gaps come from the same table metrics as
+        ``analyze_competitor_table``; capability gaps list competitor
+        strengths we lack in order of first appearance.
+        """
+        table = competitors if isinstance(competitors, CompetitorTable) else CompetitorTable.from_competitors(competitors)
+        if not len(table):
             return ["Insufficient competitor data for gap analysis"]
         
+        gaps = []
+        metrics = self._gap_metrics(table)
+        
         # Market share gap
-        max_market_share = max(comp.market_share for comp in competitors)
+        max_market_share = metrics['max_market_share']
         if our_position.market_share < max_market_share * 0.7:
             gaps.append(f"Market share gap: Leading competitor has {max_market_share*100:.1f}% vs our {our_position.market_share*100:.1f}%")
         
         # Growth rate comparison
-        avg_growth = sum(comp.growth_rate for comp in competitors) / len(competitors)
-        if len([comp for comp in competitors if comp.growth_rate > 0.15]) >= 2:
+        if metrics['fast_growers'] >= 2:
             gaps.append("Multiple competitors showing strong growth - need to accelerate growth initiatives")
         
         # Competitive strength analysis
-        competitor_strengths = set()
-        for comp in competitors:
-            competitor_strengths.update(comp.key_strengths)
-        
         our_advantages = set(our_position.competitive_advantages)
-        missing_capabilities = competitor_strengths - our_advantages
+        missing_capabilities = [strength for strength in dict.fromkeys(
+            strength for comp in table.competitors for strength in comp.key_strengths)
+            if strength not in our_advantages]
         
         if missing_capabilities:
-            gaps.append(f"Capability gaps identified: {', '.join(list(missing_capabilities)[:3])}")
+            gaps.append(f"Capability gaps identified: {', '.join(missing_capabilities[:3])}")
         
         return gaps
     
@@ -267,8 +500,10 @@ class CompetitiveLandscapeAssessor:
                                    market_growth_rate: float = 0.05) -> CompetitiveAssessment:
         """Perform comprehensive competitive landscape assessment."""
         
-        # Analyze market concentration
-        concentration_analysis = self.analyze_market_concentration(competitors)
+        # Concentration, strengths and threats in one pass over the competitor table
+        table = CompetitorTable.from_competitors(competitors)
+        concentration_analysis = (self._concentration_metrics(table) if competitors
+                                  else self.analyze_market_concentration(competitors))
         
         # Create market analysis
         market_analysis = MarketAnalysis(
@@ -293,10 +528,10 @@ class CompetitiveLandscapeAssessor:
         )
         
         # Identify threats
-        threat_matrix = self.identify_competitive_threats(competitors, our_position)
+        threat_matrix = self.classify_threats(table)
         
         # Identify opportunities
-        gaps = self.analyze_competitive_gaps(our_position, competitors)
+        gaps = self.analyze_competitive_gaps(our_position, table)
         opportunities = [
             "Market expansion in underserved segments",
             "Product innovation and differentiation",
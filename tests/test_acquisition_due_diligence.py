@@ -0,0 +1,85 @@
+import pytest
+
+from acquisition_due_diligence import (AcquisitionTarget, DCFAssumptions, FinancialMetrics, TargetTable,
+                                       AcquisitionDueDiligenceAnalyzer)
+
+
+def test_batch_scores_match_single_target_with_custom_factors():
+    metrics = FinancialMetrics(0.2, 18.0, 0.8, 1.6, 14.0, 12.0)
+    targets = [
+        AcquisitionTarget("Custom", 50e6, metrics,
+                          strategic_factors={'market_position': 8.0, 'ip_portfolio': 9.5},
+                          risk_factors={'key_person_dependency': 9.0}, revenue=40e6, ebitda=8e6),
+        AcquisitionTarget("Plain", 30e6, metrics, revenue=25e6, ebitda=5e6),
+    ]
+    analyzer = AcquisitionDueDiligenceAnalyzer()
+    table = TargetTable.from_targets(targets)
+    scores = analyzer.score_targets(table)
+    
+    assert 'ip_portfolio' in table.strategic_keys and 'key_person_dependency' in table.risk_keys
+    for i, target in enumerate(targets):
+        strategic = analyzer.assess_strategic_fit(target.strategic_factors)
+        risks = analyzer.evaluate_risks(target.risk_factors)
+        assert scores['strategic_score'][i] == pytest.approx(strategic['overall_score'])
+        assert scores['risk_score'][i] == pytest.approx(risks['overall_score'])
+    assert table.target(0).strategic_factors['ip_portfolio'] == 9.5
+    assert 'ip_portfolio' not in table.target(1).strategic_factors
+    
+    screened = analyzer.screen_targets(targets)
+    report = analyzer.generate_comprehensive_report("Custom", 50e6, metrics, targets[0].strategic_factors,
+                                                    targets[0].risk_factors, 40e6, 8e6)
+    assert screened.overall_scores["Custom"] == pytest.approx(
+        report.financial_score * analyzer.weight_financial + report.strategic_score * analyzer.weight_strategic
+        + report.risk_score * analyzer.weight_risk)
+    assert 'ip_portfolio' in next(r for r in screened.shortlist if r.target_company == "Custom").synergies
+
+
+def test_dcf_matches_closed_form_and_simulation_is_seeded():
+    analyzer = AcquisitionDueDiligenceAnalyzer()
+    metrics = FinancialMetrics(revenue_3yr_cagr=12.0, ebitda_margin=20.0, free_cash_flow_margin=15.0)
+    revenue, ebitda = 100.0, 20.0
+    
+    # Growth 12%, margin 20%, 75% cash conversion, 10% WACC, 10x exit on year-5 EBITDA
+    yearly_ebitda = [revenue * 1.12 ** t * 0.20 for t in range(1, 6)]
+    expected = (sum(e * 0.75 / 1.10 ** t for t, e in enumerate(yearly_ebitda, 1))
+                + yearly_ebitda[-1] * 10.0 / 1.10 ** 5)
+    assert analyzer.calculate_valuation_range(metrics, revenue, ebitda)['dcf_estimate'] == pytest.approx(expected)
+    
+    fixed = DCFAssumptions(revenue_growth_std=0.0, ebitda_margin_std=0.0, wacc_std=0.0, exit_multiple_std=0.0)
+    deterministic = analyzer.simulate_dcf(metrics, revenue, ebitda, deal_value=expected + 1,
+                                          assumptions=fixed, n_paths=100, seed=0)
+    assert deterministic['base_case'] == pytest.approx(expected)
+    assert list(deterministic['percentiles'].values()) == pytest.approx([expected] * 5)
+    assert deterministic['probability_overpay'] == 1.0
+    
+    first = analyzer.simulate_dcf(metrics, revenue, ebitda, deal_value=expected, n_paths=20_000, seed=5)
+    assert first == analyzer.simulate_dcf(metrics, revenue, ebitda, deal_value=expected, n_paths=20_000, seed=5)
+    percentiles = list(first['percentiles'].values())
+    assert percentiles == sorted(percentiles)
+    assert first['percentiles']['p50'] == pytest.approx(expected, rel=0.05)
+
+
+def test_synergy_percentiles_are_ordered_and_feed_the_report():
+    analyzer = AcquisitionDueDiligenceAnalyzer()
+    factors = {'market_position': 8.0, 'cost_synergies': 9.0, 'cross_selling': 8.0}
+    strategic = analyzer.assess_strategic_fit(factors)
+    synergy = analyzer.simulate_synergies(strategic, 100.0, 20.0, seed=3)
+    assert synergy == analyzer.simulate_synergies(strategic, 100.0, 20.0, seed=3)
+    
+    for summary in list(synergy['scenarios'].values()) + [synergy['overall']]:
+        p10, p50, p90 = summary['npv_percentiles'].values()
+        assert p10 <= p50 <= p90
+        assert 0.0 <= summary['probability_negative'] <= 1.0
+    medians = [synergy['scenarios'][name]['npv_percentiles']['p50'] for name in ('downside', 'base', 'upside')]
+    assert medians == sorted(medians)
+    overall = synergy['overall']['npv_percentiles']
+    assert synergy['scenarios']['downside']['npv_percentiles']['p10'] <= overall['p10']
+    assert overall['p90'] <= synergy['scenarios']['upside']['npv_percentiles']['p90']
+    
+    metrics = FinancialMetrics(12.0, 20.0, 0.8, 1.6, 14.0, 15.0)
+    report = analyzer.generate_comprehensive_report("Target", 150.0, metrics, factors, {}, 100.0, 20.0,
+                                                    simulate_synergies=True, seed=3)
+    assert (f"Synergy NPV P10/P50/P90: {overall['p10']:.1f} / {overall['p50']:.1f} / {overall['p90']:.1f}"
+            in report.key_findings)
+    plain = analyzer.generate_comprehensive_report("Target", 150.0, metrics, factors, {}, 100.0, 20.0)
+    assert not any(finding.startswith("Synergy NPV") for finding in plain.key_findings)
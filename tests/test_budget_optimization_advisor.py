@@ -0,0 +1,146 @@
+import copy
+import random
+
+import pytest
+
+from budget_optimization_advisor import BudgetCategory, BudgetNode, BudgetOptimizationAdvisor, ResponseCurve
+
+
+def _categories():
+    return [
+        BudgetCategory("Growth", 0.20, 0.20, roi=3.0, priority_score=9.0),
+        BudgetCategory("Niche", 0.20, 0.20, roi=3.5, priority_score=2.0),
+        BudgetCategory("Legacy", 0.60, 0.60, roi=0.8, priority_score=5.0, cost_type="discretionary"),
+    ]
+
+
+def test_heuristic_remains_the_default_method():
+    advisor = BudgetOptimizationAdvisor()
+    default = advisor.optimize_allocation(_categories(), 1_000_000)
+    heuristic = advisor.optimize_allocation(_categories(), 1_000_000, method="heuristic")
+    assert [c.proposed_allocation for c in default.categories] == \
+        [c.proposed_allocation for c in heuristic.categories]
+
+
+def test_lp_weights_roi_by_priority_and_caps_increases():
+    advisor = BudgetOptimizationAdvisor()
+    result = advisor.optimize_allocation(_categories(), 1_000_000, method="lp")
+    growth, niche, legacy = result.categories
+    
+    # Priority-weighted ROI: Growth 2.7x, Niche 0.7x, Legacy 0.4x
+    assert legacy.proposed_allocation == pytest.approx(0.60 * (1 - advisor.max_reallocation))
+    assert growth.proposed_allocation == pytest.approx(0.20 * (1 + advisor.max_increase))
+    assert niche.proposed_allocation == pytest.approx(1.0 - 0.30 - 0.51)
+    assert any("low priority-weighted ROI" in r for r in result.recommendations)
+    assert not any("efficiency score" in r for r in result.recommendations)
+
+
+def test_parametric_response_curve_requires_positive_scale():
+    with pytest.raises(ValueError):
+        ResponseCurve()
+    with pytest.raises(ValueError):
+        ResponseCurve(max_return=100.0, saturation=0.0)
+    
+    curve = ResponseCurve(max_return=100.0, saturation=50.0)
+    chords = curve.segments(0.0, 200.0, resolution=4)
+    assert sum(length for _, length in chords) == pytest.approx(200.0)
+    assert [slope for slope, _ in chords] == sorted((slope for slope, _ in chords), reverse=True)
+
+
+def _tree(seed, with_limits=False):
+    rng = random.Random(seed)
+    
+    def leaf(name):
+        categories = [BudgetCategory(f"{name}-{k}", 0.25, 0.25, roi=rng.uniform(0.5, 4.0),
+                                     response_curve=ResponseCurve(max_return=rng.uniform(5e4, 2e5),
+                                                                  saturation=rng.uniform(1e4, 5e4))
+                                     if with_limits and k % 2 else None)
+                      for k in range(4)]
+        return BudgetNode(name, categories=categories, current_budget=100000.0)
+    
+    divisions = [BudgetNode(f"d{d}", children=[leaf(f"d{d}l{l}") for l in range(6)]) for d in range(4)]
+    if with_limits:
+        divisions[0].max_budget = 560000.0
+        divisions[1].min_budget = 700000.0
+    return BudgetNode("company", children=divisions)
+
+
+def _reset_cache(root):
+    for node in [root] + [node for _, node in BudgetOptimizationAdvisor()._iter_paths(root, root.name)]:
+        node._summary = node._merged = node._exposed = node._assigned = None
+
+
+def test_hierarchy_matches_flat_lp_optimum():
+    advisor = BudgetOptimizationAdvisor()
+    root = _tree(1)
+    total = 2_200_000.0
+    result = advisor.optimize_hierarchy(root, total)
+    
+    leaves = list(root.iter_leaves())
+    categories = [c for leaf in leaves for c in leaf.categories]
+    lower, upper = [], []
+    for leaf in leaves:
+        leaf_lower, leaf_upper = advisor._leaf_bounds(leaf)
+        lower += [amount / total for amount in leaf_lower]
+        upper += [amount / total for amount in leaf_upper]
+    flat = advisor.solve_allocation([c.roi for c in categories], lower, upper, budget=1.0)
+    
+    hierarchical = sum(c.roi * c.proposed_allocation * leaf.current_budget
+                       for leaf in leaves for c in leaf.categories)
+    assert hierarchical == pytest.approx(sum(c.roi * x * total for c, x in zip(categories, flat)))
+    assert result.allocated_budget == pytest.approx(sum(flat) * total)
+
+
+def test_incremental_update_matches_full_recompute():
+    advisor = BudgetOptimizationAdvisor()
+    root = _tree(2, with_limits=True)
+    advisor.optimize_hierarchy(root, 2_300_000.0)
+    
+    for division, leaf in ((0, 1), (1, 4), (3, 0)):
+        node = root.children[division].children[leaf]
+        node.categories[0].roi *= 3.0
+        node.categories[1].current_allocation = 0.4
+        advisor.mark_changed(root, [f"d{division}", node.name])
+    incremental = advisor.optimize_hierarchy(root, 2_300_000.0)
+    
+    fresh = copy.deepcopy(root)
+    _reset_cache(fresh)
+    full = advisor.optimize_hierarchy(fresh, 2_300_000.0)
+    
+    assert len(incremental.reoptimized) < len(full.reoptimized)
+    assert incremental.node_budgets.keys() == full.node_budgets.keys()
+    for path, budget in full.node_budgets.items():
+        assert incremental.node_budgets[path] == pytest.approx(budget)
+    assert incremental.efficiency_gain == pytest.approx(full.efficiency_gain)
+    assert incremental.node_budgets["company/d0"] <= 560000.0 + 1e-6
+    assert incremental.node_budgets["company/d1"] >= 700000.0 - 1e-6
+
+
+def test_dashboard_output_modes():
+    advisor = BudgetOptimizationAdvisor()
+    result = advisor.optimize_allocation(_categories(), 1_000_000)
+    
+    table = advisor.create_budget_dashboard(result)
+    assert len(table) == 3
+    assert table.columns['Category'] == ["Growth", "Niche", "Legacy"]
+    assert table.columns['Current_Allocation_$'] == pytest.approx([200_000, 200_000, 600_000])
+    assert table.to_string().splitlines()[0].split()[0] == 'Category'
+    
+    records = advisor.create_budget_dashboard(result, output="records")
+    assert records == table.to_records()
+    for record, category in zip(records, result.categories):
+        assert record['Proposed_Allocation_$'] == pytest.approx(category.proposed_allocation * 1_000_000)
+        assert record['Change_$'] == pytest.approx(record['Proposed_Allocation_$'] - record['Current_Allocation_$'])
+    
+    with pytest.raises(ValueError):
+        advisor.create_budget_dashboard(result, output="html")
+
+
+def test_dashboard_pandas_output():
+    pytest.importorskip("pandas")
+    advisor = BudgetOptimizationAdvisor()
+    result = advisor.optimize_allocation(_categories(), 1_000_000)
+    frame = advisor.create_budget_dashboard(result, output="pandas")
+    table = advisor.create_budget_dashboard(result)
+    assert list(frame.columns) == list(table.columns)
+    assert frame.to_dict('records') == table.to_records()
@@ -0,0 +1,77 @@
+import random
+
+import pytest
+
+from competitive_landscape_assessor import (CompetitiveLandscapeAssessor, CompetitivePosition, Competitor,
+                                            CompetitorTable, MarketSharePanel)
+
+
+def _competitors(seed, n=200):
+    rng = random.Random(seed)
+    strengths = ["innovation", "pricing", "distribution", "brand", "service"]
+    return [Competitor(f"C{i}", market_share=rng.uniform(0, 0.25), revenue=rng.uniform(1e6, 1e9),
+                       growth_rate=rng.uniform(-0.1, 0.4), strength_score=rng.uniform(1, 10),
+                       threat_level=rng.choice(["low", "medium", "high", "critical"]),
+                       key_strengths=rng.sample(strengths, 2))
+            for i in range(n)]
+
+
+def test_table_threats_and_gaps_match_legacy_list_analysis():
+    assessor = CompetitiveLandscapeAssessor()
+    competitors = _competitors(3)
+    table = CompetitorTable.from_competitors(competitors)
+    position = CompetitivePosition(market_share=0.05, competitive_advantages=["pricing"])
+    
+    assert assessor.classify_threats(table) == assessor.identify_competitive_threats(competitors, position)
+    
+    analysis = assessor.analyze_competitor_table(table)
+    assert analysis['max_market_share'] == max(c.market_share for c in competitors)
+    assert analysis['fast_growers'] == sum(c.growth_rate > 0.15 for c in competitors)
+    
+    gaps = assessor.analyze_competitive_gaps(position, table)
+    assert gaps == assessor.analyze_competitive_gaps(position, competitors)
+    assert gaps[0] == (f"Market share gap: Leading competitor has {analysis['max_market_share']*100:.1f}% "
+                       f"vs our 5.0%")
+    assert gaps[1].startswith("Multiple competitors showing strong growth")
+    first_seen = list(dict.fromkeys(s for c in competitors for s in c.key_strengths if s != "pricing"))
+    assert gaps[2] == f"Capability gaps identified: {', '.join(first_seen[:3])}"
+    
+    assert assessor.analyze_competitive_gaps(position, []) == ["Insufficient competitor data for gap analysis"]
+
+
+def test_panel_tracks_concentration_and_share_shift():
+    panel = MarketSharePanel(window=3, top_n=3)
+    first = panel.update("2024-Q1", {'A': 0.5, 'B': 0.3, 'C': 0.2})
+    assert first['hhi'] == pytest.approx(2500 + 900 + 400)
+    assert first['share_shift']['gainers'] == [] and first['share_shift']['losers'] == []
+    
+    second = panel.update("2024-Q2", {'A': 0.45, 'B': 0.35, 'D': 0.2})
+    shift = second['share_shift']
+    assert shift['hhi_change'] == pytest.approx(second['hhi'] - first['hhi'])
+    assert shift['reallocation_effect'] + shift['dispersion_effect'] == pytest.approx(shift['hhi_change'])
+    assert shift['entry_share'] == pytest.approx(0.2)
+    assert shift['exit_share'] == pytest.approx(0.2)
+    assert [name for name, _ in shift['gainers']] == ['D', 'B']
+    assert [name for name, _ in shift['losers']] == ['C', 'A']
+    assert all(change > 0 for _, change in second['window_gainers'])
+
+
+def test_flat_period_reports_no_gainers_or_losers():
+    panel = MarketSharePanel()
+    panel.update("2024-Q1", {'A': 0.6, 'B': 0.4})
+    flat = panel.update("2024-Q2", {'A': 0.6, 'B': 0.4})
+    assert flat['share_shift']['gainers'] == [] and flat['share_shift']['losers'] == []
+    assert flat['window_gainers'] == []
+
+
+def test_empty_periods_are_skipped_as_baseline():
+    panel = MarketSharePanel()
+    assert panel.update("2024-Q1", {}) is None
+    assert panel.update("2024-Q2", {'A': 0.0}) is None
+    first = panel.update("2024-Q3", {'A': 0.8, 'B': 0.2})
+    
+    assert panel.periods == ["2024-Q3"]
+    assert first['share_shift']['entry_share'] == 0.0
+    assert first['momentum_threats'] == []
+    second = panel.update("2024-Q4", {'A': 0.8, 'B': 0.2})
+    assert second['share_shift']['turnover'] == 0.0
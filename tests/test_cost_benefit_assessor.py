@@ -0,0 +1,232 @@
+import random
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from cost_benefit_assessor import BenefitItem, CostBenefitAssessor, CostItem
+
+
+def _scalar_pv(assessor, item):
+    """Month-by-month present value, as the assessor priced items before vectorization."""
+    if item.recurring:
+        return sum(assessor.calculate_present_value(item.amount, month)
+                   for month in range(item.timing_months, assessor.analysis_period_months))
+    return assessor.calculate_present_value(item.amount, item.timing_months)
+
+
+def _scalar_cash_flow(assessor, items):
+    """Month-by-month undiscounted cash flow of the items."""
+    cash_flow = [0.0] * assessor.analysis_period_months
+    for item in items:
+        if item.timing_months < len(cash_flow):
+            if item.recurring:
+                for month in range(item.timing_months, assessor.analysis_period_months):
+                    cash_flow[month] += item.amount
+            else:
+                cash_flow[item.timing_months] += item.amount
+    return cash_flow
+
+
+def _line_items(seed, n=12):
+    rng = random.Random(seed)
+    costs = [CostItem(f"cost {i}", rng.uniform(1_000, 50_000), rng.randint(0, 45),
+                      rng.choice(["capital", "operational"]), rng.random() < 0.5) for i in range(n)]
+    benefits = [BenefitItem(f"benefit {i}", rng.uniform(1_000, 40_000), rng.randint(0, 45),
+                            rng.choice(["revenue", "cost_savings"]), rng.random() < 0.7,
+                            rng.uniform(0.5, 1.0)) for i in range(n)]
+    return costs, benefits
+
+
+def _reference_monthly_rates(cash_flows):
+    """Unique monthly IRR of each single-sign-change row from the real positive root of NPV(x)."""
+    rates = []
+    for row in cash_flows:
+        roots = np.roots(row[::-1])
+        real = roots[(np.abs(roots.imag) < 1e-9) & (roots.real > 0)].real
+        rates.append(1 / real[0] - 1)
+    return np.array(rates)
+
+
+def _single_sign_change_flows(seed, n=512, months=36):
+    rng = np.random.default_rng(seed)
+    investment = rng.uniform(50_000, 500_000, n)
+    # Returns over the first 1-3 months repaying 0.005x to 3x, so some IRRs sit near -99% a month
+    paid_months = rng.integers(1, 4, n)
+    multiple = np.exp(rng.uniform(np.log(0.005), np.log(3.0), n))
+    cash_flows = np.zeros((n, months))
+    active = np.arange(1, months) <= paid_months[:, None]
+    cash_flows[:, 1:] = np.where(active, (investment * multiple / paid_months)[:, None], 0.0)
+    cash_flows[:, 1:] *= rng.uniform(0.5, 1.5, (n, months - 1))
+    cash_flows[:, 0] = -investment
+    return cash_flows
+
+
+def test_batch_irr_matches_reference_roots():
+    assessor = CostBenefitAssessor()
+    cash_flows = _single_sign_change_flows(0)
+    expected = _reference_monthly_rates(cash_flows) * 12 * 100
+    
+    assert (expected < -12 * 90).any()
+    np.testing.assert_allclose(assessor.calculate_irr_batch(cash_flows), expected, rtol=1e-6)
+
+
+def test_bracketed_irr_finds_deeply_negative_roots():
+    assessor = CostBenefitAssessor()
+    cash_flows = _single_sign_change_flows(1, n=64)
+    expected = _reference_monthly_rates(cash_flows)
+    
+    brent = [assessor._bracketed_irr(row) for row in cash_flows]
+    np.testing.assert_allclose(brent, expected, rtol=1e-6)
+    # Closed form: -100 then 110 one month later is exactly 10% a month
+    assert assessor._bracketed_irr(np.array([-100.0, 110.0])) == pytest.approx(0.10)
+
+
+def test_missing_irr_is_nan_and_ranked_last():
+    assessor = CostBenefitAssessor(analysis_period_years=1)
+    months = assessor.analysis_period_months
+    assert np.isnan(assessor.calculate_irr([-100.0] * months, [50.0] * months))
+    assert np.isnan(assessor.calculate_irr([], []))
+    
+    chunk = next(assessor.screen_portfolio(
+        project_ids=['no_irr', 'low', 'low', 'high', 'high'],
+        amounts=[1000.0, 1000.0, 90.0, 1000.0, 200.0],
+        timing_months=[0, 0, 1, 0, 1],
+        recurring=[False, False, True, False, True],
+        is_benefit=[False, False, True, False, True]
+    ))
+    irr = chunk['irr']
+    assert np.isnan(irr[list(chunk['project_id']).index('no_irr')])
+    assert list(chunk['project_id'][assessor.rank_by_irr(irr)]) == ['high', 'low', 'no_irr']
+
+
+@pytest.mark.parametrize("discount_rate", [0.10, 0.0])
+def test_vectorized_pricing_matches_scalar_discounting(discount_rate):
+    assessor = CostBenefitAssessor(discount_rate=discount_rate)
+    costs, benefits = _line_items(5)
+    
+    discount, annuity = assessor.discount_vectors()
+    months = assessor.analysis_period_months
+    assert discount == pytest.approx([assessor.calculate_present_value(1.0, t) for t in range(months)])
+    assert annuity == pytest.approx([sum(assessor.calculate_present_value(1.0, m) for m in range(t, months))
+                                     for t in range(months + 1)])
+    
+    cost_analysis = assessor.analyze_costs(costs)
+    assert cost_analysis['total_pv'] == pytest.approx(sum(_scalar_pv(assessor, c) for c in costs))
+    assert cost_analysis['cash_flow'] == pytest.approx([-v for v in _scalar_cash_flow(assessor, costs)])
+    for category in ("capital", "operational"):
+        assert cost_analysis['by_category'].get(category, 0.0) == pytest.approx(
+            sum(_scalar_pv(assessor, c) for c in costs if c.category == category))
+    
+    benefit_analysis = assessor.analyze_benefits(benefits)
+    assert benefit_analysis['total_pv'] == pytest.approx(sum(_scalar_pv(assessor, b) for b in benefits))
+    assert benefit_analysis['risk_adjusted_pv'] == pytest.approx(
+        sum(_scalar_pv(assessor, b) * b.confidence for b in benefits))
+    assert benefit_analysis['cash_flow'] == pytest.approx(_scalar_cash_flow(assessor, benefits))
+
+
+def test_sensitivity_and_tornado_match_scalar_repricing():
+    assessor = CostBenefitAssessor()
+    costs, benefits = _line_items(8, n=6)
+    
+    def npv(cost_items, benefit_items):
+        return (sum(_scalar_pv(assessor, b) for b in benefit_items) -
+                sum(_scalar_pv(assessor, c) for c in cost_items))
+    
+    def change(cost_items, benefit_items):
+        return (npv(cost_items, benefit_items) - base) / base * 100
+    
+    base = npv(costs, benefits)
+    sensitivity = assessor.perform_sensitivity_analysis(costs, benefits)
+    assert sensitivity['costs_+20%'] == pytest.approx(
+        change([replace(c, amount=c.amount * 1.2) for c in costs], benefits))
+    assert sensitivity['benefits_-20%'] == pytest.approx(
+        change(costs, [replace(b, amount=b.amount * 0.8) for b in benefits]))
+    assert sensitivity['benefits_delayed_3mo'] == pytest.approx(
+        change(costs, [replace(b, timing_months=b.timing_months + 3) for b in benefits]))
+    
+    rows = assessor.tornado_analysis(costs, benefits, amount_flex=0.2, timing_shift_months=3)
+    assert len(rows) == 2 * (len(costs) + len(benefits))
+    assert [row['swing'] for row in rows] == sorted((row['swing'] for row in rows), reverse=True)
+    by_key = {(row['item'], row['driver']): row for row in rows}
+    for items, is_cost in ((costs, True), (benefits, False)):
+        for i, item in enumerate(items):
+            variants = {
+                'amount': [replace(item, amount=item.amount * f) for f in (0.8, 1.2)],
+                'timing': [replace(item, timing_months=max(item.timing_months - 3, 0)),
+                           replace(item, timing_months=item.timing_months + 3)]
+            }
+            for driver, flexed in variants.items():
+                npvs = [npv(costs[:i] + [v] + costs[i + 1:], benefits) if is_cost
+                        else npv(costs, benefits[:i] + [v] + benefits[i + 1:]) for v in flexed]
+                row = by_key[(item.description, driver)]
+                assert row['npv_low'] == pytest.approx(min(npvs))
+                assert row['npv_high'] == pytest.approx(max(npvs))
+
+
+def test_portfolio_screen_matches_per_project_assessment():
+    assessor = CostBenefitAssessor()
+    projects = {f"P{k}": _line_items(20 + k, n=3) for k in range(5)}
+    rows = [(pid, item, isinstance(item, BenefitItem))
+            for pid, (costs, benefits) in projects.items() for item in costs + benefits]
+    random.Random(0).shuffle(rows)
+    
+    chunks = list(assessor.screen_portfolio(
+        project_ids=[pid for pid, _, _ in rows],
+        amounts=[item.amount for _, item, _ in rows],
+        timing_months=[item.timing_months for _, item, _ in rows],
+        recurring=[item.recurring for _, item, _ in rows],
+        is_benefit=[benefit for _, _, benefit in rows],
+        confidence=[item.confidence if benefit else 1.0 for _, item, benefit in rows],
+        chunk_size=2
+    ))
+    assert [len(chunk['project_id']) for chunk in chunks] == [2, 2, 1]
+    
+    for chunk in chunks:
+        for i, pid in enumerate(chunk['project_id']):
+            costs, benefits = projects[pid]
+            result = assessor.assess_project(costs, benefits)
+            assert chunk['total_costs'][i] == pytest.approx(sum(_scalar_pv(assessor, c) for c in costs))
+            assert chunk['total_benefits'][i] == pytest.approx(sum(_scalar_pv(assessor, b) for b in benefits))
+            assert chunk['npv'][i] == pytest.approx(result.npv)
+            assert chunk['benefit_cost_ratio'][i] == pytest.approx(result.benefit_cost_ratio)
+            assert chunk['roi_percentage'][i] == pytest.approx(result.roi_percentage)
+            assert chunk['risk_adjusted_npv'][i] == pytest.approx(result.risk_adjusted_npv)
+            assert chunk['payback_months'][i] == result.payback_months
+            assert chunk['irr'][i] == pytest.approx(result.irr, nan_ok=True)
+            assert chunk['recommendation'][i] == result.recommendation
+
+
+def test_risk_simulation_matches_scalar_draws():
+    assessor = CostBenefitAssessor()
+    costs, benefits = _line_items(11, n=4)
+    benefits = [replace(b, amount_volatility=0.3, timing_std_months=2.0) for b in benefits]
+    n_draws, seed = 400, 17
+    
+    # Replay the simulation's draws in the same order, one scenario at a time
+    rng = np.random.default_rng(seed)
+    shape = (n_draws, len(benefits))
+    realized = rng.random(shape) < [b.confidence for b in benefits]
+    scale = np.maximum(1 + 0.3 * rng.standard_normal(shape), 0.0)
+    shift = np.rint(2.0 * rng.standard_normal(shape)).astype(int)
+    
+    cost_pv = sum(_scalar_pv(assessor, c) for c in costs)
+    cost_cash_flow = [-v for v in _scalar_cash_flow(assessor, costs)]
+    npv, payback = [], []
+    for d in range(n_draws):
+        drawn = [replace(b, amount=b.amount * realized[d, j] * scale[d, j],
+                         timing_months=max(b.timing_months + int(shift[d, j]), 0))
+                 for j, b in enumerate(benefits)]
+        npv.append(sum(_scalar_pv(assessor, b) for b in drawn) - cost_pv)
+        payback.append(assessor.calculate_payback_period(cost_cash_flow, _scalar_cash_flow(assessor, drawn)))
+    npv, payback = np.array(npv), np.array(payback)
+    
+    risk = assessor.simulate_risk(costs, benefits, n_draws=n_draws, seed=seed, chunk_size=n_draws)
+    assert risk['mean_npv'] == pytest.approx(npv.mean())
+    assert risk['std_npv'] == pytest.approx(npv.std())
+    assert risk['probability_negative_npv'] == (npv < 0).mean()
+    assert list(risk['npv_percentiles'].values()) == pytest.approx(np.quantile(npv, [0.1, 0.5, 0.9]))
+    assert risk['expected_shortfall'] == pytest.approx(np.sort(npv)[:20].mean())
+    assert risk['probability_of_payback'] == (payback > 0).mean()
+    assert list(risk['payback_percentiles'].values()) == pytest.approx(
+        np.quantile(payback[payback > 0], [0.1, 0.5, 0.9]))
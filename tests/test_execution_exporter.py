@@ -0,0 +1,80 @@
+import csv
+from datetime import datetime, timedelta
+
+import pytest
+
+from prompt_manager import PromptExecution, PromptContext, IndustryType, ExecutiveRole, PromptCategory
+from execution_exporter import EXECUTION_COLUMNS, ExecutionExporter
+
+
+START = datetime(2025, 1, 1, 9, 0)
+CATEGORIES = [PromptCategory.STRATEGIC_ANALYSIS, PromptCategory.FINANCIAL_ANALYSIS]
+
+
+def _executions(n=25):
+    return [PromptExecution(
+        prompt_id=CATEGORIES[i % 2].value,
+        context=PromptContext(industry=IndustryType.TECHNOLOGY, role=ExecutiveRole.CEO,
+                              company_size="enterprise"),
+        quality_score=float(i % 10),
+        feedback={'rating': i} if i % 3 == 0 else None,
+        execution_time=START + timedelta(hours=i)
+    ) for i in range(n)]
+
+
+def _exporter(batch_size):
+    return ExecutionExporter(batch_size=batch_size, category_resolver=PromptCategory)
+
+
+def test_column_batches_split_at_batch_size_after_filtering():
+    executions = _executions()
+    batches = list(_exporter(4).iter_column_batches(
+        executions, start_date=START + timedelta(hours=2), end_date=START + timedelta(hours=20),
+        categories=[PromptCategory.STRATEGIC_ANALYSIS]))
+    
+    # Even hours 2..20 pass both filters: 10 rows as 4 + 4 + 2
+    assert [len(columns[0]) for columns in batches] == [4, 4, 2]
+    assert all(len(column) == len(columns[0]) for columns in batches for column in columns)
+    times = [t for columns in batches for t in columns[EXECUTION_COLUMNS.index('execution_time')]]
+    assert times == [START + timedelta(hours=h) for h in range(2, 21, 2)]
+    
+    exact = list(_exporter(5).iter_column_batches(executions[:10]))
+    assert [len(columns[0]) for columns in exact] == [5, 5]
+    assert list(_exporter(5).iter_column_batches([])) == []
+
+
+def test_csv_export_round_trip(tmp_path):
+    executions = _executions()
+    path = str(tmp_path / "history.csv")
+    info = _exporter(10).export(executions, path, file_format="csv")
+    assert (info['rows_written'], info['row_groups']) == (25, 3)
+    
+    with open(path, newline='') as f:
+        rows = list(csv.DictReader(f))
+    assert tuple(rows[0].keys()) == EXECUTION_COLUMNS
+    assert [row['id'] for row in rows] == [e.id for e in executions]
+    assert [datetime.fromisoformat(row['execution_time']) for row in rows] == [e.execution_time for e in executions]
+    assert rows[3]['feedback'] == '{"rating": 3}' and rows[1]['feedback'] == ''
+
+
+def test_parquet_export_round_trip_with_filters(tmp_path):
+    pytest.importorskip("pyarrow")
+    executions = _executions()
+    path = str(tmp_path / "history.parquet")
+    info = _exporter(10).export(executions, path, file_format="parquet")
+    assert (info['rows_written'], info['row_groups']) == (25, 3)
+    
+    exporter = _exporter(10)
+    table = exporter.read_parquet(path)
+    assert table.column_names == list(EXECUTION_COLUMNS)
+    assert table.column('id').to_pylist() == [e.id for e in executions]
+    assert table.column('execution_time').to_pylist() == [e.execution_time for e in executions]
+    assert table.column('quality_score').to_pylist() == [e.quality_score for e in executions]
+    
+    filtered = exporter.read_parquet(path, start_date=START + timedelta(hours=5),
+                                     end_date=START + timedelta(hours=15),
+                                     categories=[PromptCategory.FINANCIAL_ANALYSIS],
+                                     columns=['id', 'category'])
+    assert filtered.column_names == ['id', 'category']
+    assert filtered.column('id').to_pylist() == [executions[h].id for h in range(5, 16, 2)]
+    assert set(filtered.column('category').to_pylist()) == {PromptCategory.FINANCIAL_ANALYSIS.value}
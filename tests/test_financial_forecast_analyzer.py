@@ -0,0 +1,219 @@
+import numpy as np
+import pytest
+
+from financial_forecast_analyzer import (BusinessUnit, FinancialForecastAnalyzer, ForecastAssumptions,
+                                        HistogramSketch, HistoricalData, HistoricalSeries,
+                                        ScenarioDefinition, TrendState, parse_periods)
+
+
+HISTORY = [
+    HistoricalData("2022-Q1", 850000, 680000, 170000, 140000),
+    HistoricalData("2022-Q2", 920000, 720000, 200000, 165000),
+    HistoricalData("2022-Q3", 980000, 750000, 230000, 195000),
+    HistoricalData("2022-Q4", 1100000, 825000, 275000, 230000),
+    HistoricalData("2023-Q1", 950000, 750000, 200000, 170000),
+]
+
+
+def test_rolling_update_projects_from_incremental_trends():
+    analyzer = FinancialForecastAnalyzer()
+    analyzer.start_rolling_forecast(HISTORY, ForecastAssumptions(), seed=7)
+    actual = HistoricalData("2023-Q2", 1050000, 800000, 250000, 210000)
+    result = analyzer.update(actual)
+    
+    assert result.forecast_periods[0] == "2023-Q3"
+    trends = analyzer.analyze_historical_trends(HISTORY + [actual])
+    expected = analyzer._project_base_forecast(
+        actual.revenue, result.forecast_periods,
+        ForecastAssumptions(revenue_growth_rate=trends['growth_rate'] * 4,
+                            seasonal_factor=trends['seasonality']))
+    assert result.revenue_forecast == pytest.approx(expected['revenue'])
+
+
+def test_rolling_update_rejects_unexpected_periods():
+    analyzer = FinancialForecastAnalyzer()
+    analyzer.start_rolling_forecast(HISTORY, ForecastAssumptions(), seed=7)
+    for period in ("2023-Q3", "2023-Q1", "2023-05"):
+        with pytest.raises(ValueError):
+            analyzer.update(HistoricalData(period, 1000000, 750000, 250000, 200000))
+    assert len(analyzer.rolling_state.historical_data) == len(HISTORY)
+
+
+def test_rolling_update_follows_monthly_frequency():
+    history = [HistoricalData(f"{2022 + (m - 1) // 12}-{(m - 1) % 12 + 1:02d}", 300000 * 1.01 ** m,
+                              225000 * 1.01 ** m, 75000 * 1.01 ** m, 60000 * 1.01 ** m)
+               for m in range(1, 15)]
+    analyzer = FinancialForecastAnalyzer()
+    start = analyzer.start_rolling_forecast(history, ForecastAssumptions(), seed=7)
+    assert start.forecast_periods[:2] == ["2023-03", "2023-04"]
+    assert len(start.forecast_periods) == 24 and start.forecast_periods[-1] == "2025-02"
+    
+    actual = HistoricalData("2023-03", 300000 * 1.01 ** 15, 225000 * 1.01 ** 15,
+                            75000 * 1.01 ** 15, 60000 * 1.01 ** 15)
+    result = analyzer.update(actual)
+    
+    assert result.forecast_periods[0] == "2023-04" and result.forecast_periods[-1] == "2025-03"
+    trends = analyzer.analyze_historical_trends(history + [actual])
+    assert trends['growth_rate'] == pytest.approx(0.01)
+    expected = analyzer._project_base_forecast(
+        actual.revenue, result.forecast_periods,
+        ForecastAssumptions(revenue_growth_rate=trends['growth_rate'] * 12,
+                            seasonal_factor=trends['seasonality']))
+    assert result.revenue_forecast == pytest.approx(expected['revenue'])
+    # Twelve monthly steps of 1% between the same calendar month a year apart
+    assert result.revenue_forecast[12] / result.revenue_forecast[0] == pytest.approx(1.01 ** 12)
+
+
+def test_rolling_forecast_rolls_annual_periods():
+    history = [HistoricalData(str(year), 1000000 * 1.1 ** i, 750000 * 1.1 ** i, 250000 * 1.1 ** i, 200000)
+               for i, year in enumerate(range(2019, 2024))]
+    analyzer = FinancialForecastAnalyzer()
+    analyzer.start_rolling_forecast(history, ForecastAssumptions(), seed=7)
+    result = analyzer.update(HistoricalData("2024", 1000000 * 1.1 ** 5, 750000 * 1.1 ** 5, 250000 * 1.1 ** 5, 200000))
+    
+    assert result.forecast_periods == ["2025", "2026"]
+    assert result.revenue_forecast[0] == pytest.approx(1000000 * 1.1 ** 6, rel=1e-6)
+
+
+def test_rolling_forecast_keeps_path_dependent_mode():
+    analyzer = FinancialForecastAnalyzer()
+    analyzer.simulation_mode = "path_dependent"
+    analyzer.start_rolling_forecast(HISTORY, ForecastAssumptions(), seed=7)
+    analyzer.simulation_mode = "independent"
+    result = analyzer.update(HistoricalData("2023-Q2", 1050000, 800000, 250000, 210000))
+    
+    assert analyzer.rolling_state.normalized_bands is None
+    widths = [upper - lower for lower, upper in result.confidence_bands['revenue']]
+    assert widths[-1] > widths[0] > 0  # Compounding shocks widen the bands
+
+
+@pytest.mark.parametrize("mode", ["independent", "path_dependent"])
+def test_portfolio_band_width_does_not_depend_on_chunk_size(mode):
+    units = [BusinessUnit(f"unit-{i}", [HistoricalData("2023-Q1", 1000000 * (i % 4 + 1), 750000 * (i % 4 + 1),
+                                                       250000 * (i % 4 + 1), 200000 * (i % 4 + 1))])
+             for i in range(16)]
+    analyzer = FinancialForecastAnalyzer()
+    analyzer.simulation_mode = mode
+    analyzer.monte_carlo_simulations = 4000
+    pooled = analyzer.forecast_portfolio(units, seed=11, max_workers=1)
+    
+    for chunk_size in (400, 16):
+        analyzer.simulation_chunk_size = chunk_size
+        chunked = analyzer.forecast_portfolio(units, seed=11, max_workers=1)
+        for metric, bands in pooled.consolidated_bands.items():
+            for (lo, hi), (chunk_lo, chunk_hi) in zip(bands, chunked.consolidated_bands[metric]):
+                assert chunk_hi - chunk_lo == pytest.approx(hi - lo, rel=0.1)
+                assert chunk_lo == pytest.approx(lo, rel=0.01)
+    
+    total = sum(pooled.consolidated_forecast['revenue'])
+    assert total == pytest.approx(sum(sum(r.revenue_forecast) for r in pooled.unit_results.values()))
+
+
+def test_portfolio_bands_are_identical_across_worker_counts():
+    units = [BusinessUnit(f"unit-{i}", [HistoricalData("2023-Q1", 1e6, 7.5e5, 2.5e5, 2e5)]) for i in range(4)]
+    analyzer = FinancialForecastAnalyzer()
+    analyzer.simulation_chunk_size = 250
+    serial = analyzer.forecast_portfolio(units, seed=3, max_workers=1)
+    pooled = analyzer.forecast_portfolio(units, seed=3, max_workers=2)
+    assert pooled.consolidated_bands == serial.consolidated_bands
+
+
+def test_chunked_bands_match_unchunked_bands_for_the_same_seed():
+    analyzer = FinancialForecastAnalyzer()
+    periods = ["2024-Q1", "2024-Q2", "2024-Q3", "2024-Q4"]
+    pooled = analyzer.calculate_path_dependent_bands(1e6, periods, ForecastAssumptions(),
+                                                     simulations=20000, seed=5)
+    for chunk_size in (5000, 500, 20):
+        analyzer.simulation_chunk_size = chunk_size
+        chunked = analyzer.calculate_path_dependent_bands(1e6, periods, ForecastAssumptions(),
+                                                          simulations=20000, seed=5)
+        for metric, bands in pooled.items():
+            for (lo, hi), (chunk_lo, chunk_hi) in zip(bands, chunked[metric]):
+                assert chunk_hi - chunk_lo == pytest.approx(hi - lo, rel=0.02)
+                assert chunk_lo == pytest.approx(lo, rel=0.01)
+
+
+def test_histogram_sketch_quantiles_and_merge():
+    rng = np.random.default_rng(0)
+    values = rng.normal(100.0, 10.0, (50000, 2))
+    left, right = HistogramSketch(), HistogramSketch()
+    for chunk in np.array_split(values[:25000], 10):
+        left.add(chunk)
+    right.add(values[25000:] * 1.5)  # Wider range forces re-binning on merge
+    left.merge(right)
+    pooled = np.concatenate([values[:25000], values[25000:] * 1.5])
+    
+    expected = np.quantile(pooled, [0.05, 0.5, 0.95], axis=0)
+    assert left.total == len(pooled)
+    assert left.quantiles([0.05, 0.5, 0.95]) == pytest.approx(expected, rel=0.005)
+
+
+def test_confidence_bands_are_seeded_and_match_uniform_shock_quantiles():
+    analyzer = FinancialForecastAnalyzer()
+    assumptions = ForecastAssumptions()
+    base = analyzer._project_base_forecast(1000000, ["2024-Q1", "2024-Q2", "2024-Q3"], assumptions)
+    bands = analyzer.calculate_confidence_bands(base, assumptions, simulations=50_000, seed=11)
+    
+    assert bands == analyzer.calculate_confidence_bands(base, assumptions, simulations=50_000, seed=11)
+    assert bands.keys() == {'revenue', 'ebitda', 'cash_flow'}
+    # Revenue shocks are uniform on +/-5%, so the 80% band is base x (1 -/+ 4%)
+    for (lower, upper), revenue in zip(bands['revenue'], base['revenue']):
+        assert lower == pytest.approx(revenue * 0.96, rel=2e-3)
+        assert upper == pytest.approx(revenue * 1.04, rel=2e-3)
+    for metric in ('ebitda', 'cash_flow'):
+        assert all(lower < upper for lower, upper in bands[metric])
+    assert all(cf_hi < eb_hi for (_, cf_hi), (_, eb_hi) in zip(bands['cash_flow'], bands['ebitda']))
+
+
+def test_parse_periods_detects_frequency():
+    years, quarters, per_year = parse_periods(["2023-Q3", "2023-Q4", "2024-Q1"])
+    assert years.tolist() == [2023, 2023, 2024] and quarters.tolist() == [3, 4, 1] and per_year == 4
+    years, quarters, per_year = parse_periods(["2023-01", "2023-06", "2023-12"])
+    assert quarters.tolist() == [1, 2, 4] and per_year == 12
+    years, quarters, per_year = parse_periods(["2022", "2023"])
+    assert years.tolist() == [2022, 2023] and quarters.tolist() == [0, 0] and per_year == 1
+    assert parse_periods(["2023", "2024-Q1"])[2] == 4
+
+
+def test_trend_state_matches_batch_trend_analysis():
+    rng = np.random.default_rng(2)
+    periods = [f"{2021 + m // 12}-{m % 12 + 1:02d}" for m in range(30)]
+    revenue = 1e6 * np.cumprod(1 + rng.normal(0.01, 0.03, (3, 30)), axis=1)
+    ebitda = revenue * rng.uniform(0.15, 0.3, (3, 30))
+    analyzer = FinancialForecastAnalyzer()
+    batch = analyzer.analyze_trends_batch(HistoricalSeries.from_arrays(periods, revenue, revenue - ebitda,
+                                                                       ebitda, ebitda * 0.8))
+    assert batch['periods_per_year'] == 12
+    
+    for entity in range(3):
+        records = [HistoricalData(p, r, r - e, e, e * 0.8)
+                   for p, r, e in zip(periods, revenue[entity], ebitda[entity])]
+        state = TrendState()
+        for record in records:
+            state.add(record)
+        incremental, single = state.to_trends(), analyzer.analyze_historical_trends(records)
+        for key in ('growth_rate', 'volatility', 'avg_revenue', 'avg_margin'):
+            assert incremental[key] == pytest.approx(single[key])
+            assert single[key] == pytest.approx(float(batch[key][entity]))
+        assert incremental['seasonality'] == pytest.approx(single['seasonality'])
+
+
+def test_scenarios_are_ordered_and_match_scalar_multipliers():
+    analyzer = FinancialForecastAnalyzer()
+    assumptions = ForecastAssumptions()
+    base = analyzer._project_base_forecast(1000000, ["2024-Q1", "2024-Q2", "2024-Q3", "2024-Q4"], assumptions)
+    
+    scenarios = analyzer.generate_scenario_analysis(base, assumptions)
+    assert list(scenarios) == ["optimistic", "pessimistic", "conservative"]
+    for metric in ('revenue', 'ebitda', 'cash_flow'):
+        for q in range(4):
+            assert (scenarios['pessimistic'][metric][q] < scenarios['conservative'][metric][q]
+                    < scenarios['optimistic'][metric][q])
+    
+    ramp = ScenarioDefinition("ramp", [1.0, 1.1, 1.2, 1.3], 1.0, 0.8)
+    results = analyzer.evaluate_scenarios(base, [ramp])
+    assert results.shape == (1, 4, 4)
+    for q, multiplier in enumerate(ramp.revenue_multiplier):
+        revenue = base['revenue'][q] * multiplier
+        ebitda = revenue - base['expenses'][q]
+        assert results[0, q].tolist() == pytest.approx([revenue, base['expenses'][q], ebitda, ebitda * 0.8])
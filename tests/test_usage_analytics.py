@@ -0,0 +1,168 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from prompt_manager import PromptExecution, PromptContext, IndustryType, ExecutiveRole, PromptCategory
+from analytics_store import SQLiteExecutionStore
+from usage_analytics import ChangePointDetector, SlidingWindow, UsageAnalytics
+
+
+class CategorizedAnalytics(UsageAnalytics):
+    """Resolve categories from the template id so category sections have data."""
+    
+    def _get_execution_category(self, execution):
+        return PromptCategory(execution.prompt_id)
+
+
+def _execution(category, industry, role, score, when):
+    return PromptExecution(
+        prompt_id=category.value,
+        context=PromptContext(industry=industry, role=role, company_size="enterprise"),
+        quality_score=score,
+        execution_time=when
+    )
+
+
+def _worker(executions):
+    analytics = CategorizedAnalytics()
+    for execution in executions:
+        analytics.record_execution(execution)
+    return analytics
+
+
+def test_merged_partials_cover_every_report_section():
+    now = datetime.now().replace(minute=0, second=0, microsecond=0)
+    first = [_execution(PromptCategory.STRATEGIC_ANALYSIS, IndustryType.TECHNOLOGY, ExecutiveRole.CEO,
+                        5.0, now - timedelta(minutes=i)) for i in range(12)]
+    second = [_execution(PromptCategory.FINANCIAL_ANALYSIS, IndustryType.HEALTHCARE, ExecutiveRole.CFO,
+                         9.0, now - timedelta(hours=3, minutes=i)) for i in range(8)]
+    reference = _worker(first + second)
+    
+    collector = CategorizedAnalytics.from_partials([_worker(first).export_partial(),
+                                                    _worker(second).export_partial()])
+    
+    summary, expected = collector.get_usage_summary(), reference.get_usage_summary()
+    assert summary.total_executions == expected.total_executions == 20
+    assert summary.average_quality_score == pytest.approx(expected.average_quality_score)
+    assert summary.success_rate == expected.success_rate
+    assert summary.peak_usage_hour == expected.peak_usage_hour
+    assert summary.most_popular_category == expected.most_popular_category
+    assert summary.top_industries == expected.top_industries
+    assert summary.top_roles == expected.top_roles
+    
+    for section in ('get_industry_insights', 'get_role_effectiveness'):
+        merged, local = getattr(collector, section)(), getattr(reference, section)()
+        assert merged.keys() == local.keys()
+        for key, values in local.items():
+            for field, value in values.items():
+                assert merged[key][field] == (pytest.approx(value) if isinstance(value, float) else value)
+    
+    categories = collector.get_category_performance()
+    assert categories.keys() == {'strategic_analysis', 'financial_analysis'}
+    for name, stats in reference.get_category_performance().items():
+        assert categories[name]['count'] == stats['count']
+        assert categories[name]['average_score'] == pytest.approx(stats['average_score'])
+        assert categories[name]['std_dev'] == pytest.approx(stats['std_dev'])
+    assert collector.get_category_performance(PromptCategory.FINANCIAL_ANALYSIS).keys() == {'financial_analysis'}
+    
+    quality = [i for i in collector.generate_performance_insights() if i.category == "quality"]
+    assert quality and quality[0].data_points['current_avg'] == pytest.approx(6.6)
+    assert quality[0].data_points['window'] == 'all_time'
+    
+    with pytest.raises(ValueError):
+        collector.get_usage_summary(start_date=now - timedelta(days=1))
+
+
+def test_merge_partial_into_worker_switches_to_merged_reports():
+    now = datetime.now()
+    local = _worker([_execution(PromptCategory.STRATEGIC_ANALYSIS, IndustryType.TECHNOLOGY,
+                                ExecutiveRole.CEO, 8.0, now)])
+    remote = _worker([_execution(PromptCategory.MARKET_INTELLIGENCE, IndustryType.TECHNOLOGY,
+                                 ExecutiveRole.CTO, 6.0, now)])
+    local.merge_partial(remote.export_partial())
+    
+    assert local.get_usage_summary().total_executions == 2
+    assert local.get_category_performance().keys() == {'strategic_analysis', 'market_intelligence'}
+    assert local.get_role_effectiveness().keys() == {'ceo', 'cto'}
+
+
+def test_anomaly_alerts_age_out_after_retention():
+    now = datetime.now()
+    analytics = CategorizedAnalytics()
+    for i in range(40):
+        analytics.record_execution(_execution(PromptCategory.STRATEGIC_ANALYSIS, IndustryType.TECHNOLOGY,
+                                              ExecutiveRole.CEO, 9.0, now - timedelta(hours=3, minutes=40 - i)))
+    for i in range(10):
+        analytics.record_execution(_execution(PromptCategory.STRATEGIC_ANALYSIS, IndustryType.TECHNOLOGY,
+                                              ExecutiveRole.CEO, 2.0, now - timedelta(hours=2, minutes=10 - i)))
+    assert analytics.anomaly_insights
+    
+    def regressions(as_of=None):
+        return [i for i in analytics.generate_performance_insights(as_of=as_of)
+                if i.category == "quality_regression"]
+    
+    # By default alerts are judged against the newest recorded execution
+    assert regressions()
+    analytics.anomaly_retention = timedelta(hours=4)
+    assert regressions(as_of=now)
+    analytics.anomaly_retention = timedelta(hours=1)
+    assert not regressions(as_of=now)
+    assert not analytics.anomaly_insights
+
+
+def test_insights_on_historic_data_use_the_newest_execution():
+    last_year = datetime(2025, 3, 14, 10, 0)
+    analytics = CategorizedAnalytics()
+    for i in range(20):
+        analytics.record_execution(_execution(PromptCategory.STRATEGIC_ANALYSIS, IndustryType.TECHNOLOGY,
+                                              ExecutiveRole.CEO, 4.0, last_year + timedelta(minutes=i)))
+    
+    categories = {i.category for i in analytics.generate_performance_insights()}
+    assert {'quality', 'usage_patterns', 'category_performance'} <= categories
+    assert not analytics.generate_performance_insights(as_of=last_year + timedelta(days=60))
+
+
+def test_sliding_window_evicts_expired_buckets():
+    start = datetime(2025, 3, 14, 10, 0)
+    window = SlidingWindow(timedelta(minutes=10), buckets=10)
+    window.add(start, 8.0, success=True)
+    window.add(start + timedelta(minutes=4), 4.0)
+    assert (window.count, window.successes) == (2, 1)
+    assert window.average_quality == pytest.approx(6.0)
+    
+    window.advance(start + timedelta(minutes=10))
+    assert (window.count, window.successes) == (1, 0)
+    assert window.average_quality == pytest.approx(4.0)
+    
+    window.add(start, 9.0)  # Older than the window: ignored
+    window.advance(start + timedelta(hours=1))
+    assert window.count == window.quality_count == 0
+    assert window.hourly_usage == [0] * 24
+
+
+def test_change_point_detector_triggers_on_sustained_shift():
+    detector = ChangePointDetector(warmup=10)
+    assert all(detector.update(8.0 + 0.1 * (i % 3)) is None for i in range(30))
+    
+    signals = [detector.update(5.0) for _ in range(5)]
+    assert "decrease" in signals
+    assert "increase" not in signals
+    
+    detector = ChangePointDetector(warmup=10)
+    for i in range(30):
+        detector.update(8.0 + 0.1 * (i % 3))
+    assert "increase" in [detector.update(11.0) for _ in range(5)]
+
+
+def test_store_mode_tracks_sessions_and_rejects_merges():
+    now = datetime.now()
+    analytics = CategorizedAnalytics(store=SQLiteExecutionStore(":memory:"))
+    analytics.record_execution(_execution(PromptCategory.STRATEGIC_ANALYSIS, IndustryType.TECHNOLOGY,
+                                          ExecutiveRole.CEO, 8.0, now), user_id="u1")
+    assert analytics.user_sessions["u1"] == [now]
+    
+    partial = _worker([_execution(PromptCategory.FINANCIAL_ANALYSIS, IndustryType.HEALTHCARE,
+                                  ExecutiveRole.CFO, 9.0, now)]).export_partial()
+    with pytest.raises(ValueError):
+        analytics.merge_partial(partial)
+    assert analytics.get_usage_summary().total_executions == 1
@@ -8,11 +8,14 @@ usage patterns, and optimization insights for executive AI prompts.
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from collections import defaultdict
+from collections import defaultdict, deque
 import statistics
 import json
+import math
+import os
 
 from prompt_manager import PromptExecution, IndustryType, ExecutiveRole, PromptCategory
+from analytics_store import SQLiteExecutionStore
 
 
 @dataclass
@@ -40,10 +43,468 @@ class PerformanceInsight:
     data_points: Dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class RunningStats:
+    """Mergeable count/mean/variance/min/max accumulator (Chan et al. parallel update)."""
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    minimum: Optional[float] = None
+    maximum: Optional[float] = None
+    
+    def add(self, value: float) -> None:
+        """Fold a single observation into the accumulator."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.minimum = value if self.minimum is None else min(self.minimum, value)
+        self.maximum = value if self.maximum is None else max(self.maximum, value)
+    
+    def merge(self, other: 'RunningStats') -> 'RunningStats':
+        """Combine two accumulators without mutating either."""
+        if not other.count:
+            return RunningStats(self.count, self.mean, self.m2, self.minimum, self.maximum)
+        if not self.count:
+            return RunningStats(other.count, other.mean, other.m2, other.minimum, other.maximum)
+        
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        return RunningStats(
+            count=count,
+            mean=self.mean + delta * other.count / count,
+            m2=self.m2 + other.m2 + delta * delta * self.count * other.count / count,
+            minimum=min(self.minimum, other.minimum),
+            maximum=max(self.maximum, other.maximum)
+        )
+    
+    @property
+    def stdev(self) -> float:
+        """Sample standard deviation, matching statistics.stdev."""
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {'count': self.count, 'mean': self.mean, 'm2': self.m2,
+                'minimum': self.minimum, 'maximum': self.maximum}
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'RunningStats':
+        return cls(**data)
+
+
+@dataclass
+class UsageAggregate:
+    """
+    Serializable, mergeable partial aggregate of usage analytics.
+    
+    Aggregates form a monoid: ``UsageAggregate()`` is the identity and
+    ``merge`` is associative, so per-worker partials can be combined in any
+    grouping to produce fleet-wide reports without shipping raw executions.
+    """
+    total_executions: int = 0
+    successful_executions: int = 0
+    quality: RunningStats = field(default_factory=RunningStats)
+    hourly_usage: Dict[int, int] = field(default_factory=dict)
+    category_usage: Dict[str, int] = field(default_factory=dict)
+    category_quality: Dict[str, RunningStats] = field(default_factory=dict)
+    industry_executions: Dict[str, int] = field(default_factory=dict)
+    industry_quality: Dict[str, RunningStats] = field(default_factory=dict)
+    role_executions: Dict[str, int] = field(default_factory=dict)
+    role_quality: Dict[str, RunningStats] = field(default_factory=dict)
+    first_execution: Optional[datetime] = None
+    last_execution: Optional[datetime] = None
+    
+    def add(self, execution: PromptExecution, category: Optional[PromptCategory] = None,
+            success_threshold: float = 7.0) -> None:
+        """Fold a single execution into the aggregate."""
+        self.total_executions += 1
+        score = execution.quality_score
+        if score is not None:
+            self.quality.add(score)
+        if score and score >= success_threshold:
+            self.successful_executions += 1
+        
+        hour = execution.execution_time.hour
+        self.hourly_usage[hour] = self.hourly_usage.get(hour, 0) + 1
+        if category:
+            self.category_usage[category.value] = self.category_usage.get(category.value, 0) + 1
+            if score is not None:
+                self.category_quality.setdefault(category.value, RunningStats()).add(score)
+        
+        if execution.context:
+            industry = execution.context.industry.value
+            self.industry_executions[industry] = self.industry_executions.get(industry, 0) + 1
+            if score is not None:
+                self.industry_quality.setdefault(industry, RunningStats()).add(score)
+            if execution.context.role:
+                role = execution.context.role.value
+                self.role_executions[role] = self.role_executions.get(role, 0) + 1
+                if score is not None:
+                    self.role_quality.setdefault(role, RunningStats()).add(score)
+        
+        if self.first_execution is None or execution.execution_time < self.first_execution:
+            self.first_execution = execution.execution_time
+        if self.last_execution is None or execution.execution_time > self.last_execution:
+            self.last_execution = execution.execution_time
+    
+    def merge(self, other: 'UsageAggregate') -> 'UsageAggregate':
+        """Combine two partial aggregates into a new one."""
+        times = [t for t in (self.first_execution, other.first_execution) if t is not None]
+        last_times = [t for t in (self.last_execution, other.last_execution) if t is not None]
+        
+        return UsageAggregate(
+            total_executions=self.total_executions + other.total_executions,
+            successful_executions=self.successful_executions + other.successful_executions,
+            quality=self.quality.merge(other.quality),
+            hourly_usage=_merge_counts(self.hourly_usage, other.hourly_usage),
+            category_usage=_merge_counts(self.category_usage, other.category_usage),
+            category_quality=_merge_stats(self.category_quality, other.category_quality),
+            industry_executions=_merge_counts(self.industry_executions, other.industry_executions),
+            industry_quality=_merge_stats(self.industry_quality, other.industry_quality),
+            role_executions=_merge_counts(self.role_executions, other.role_executions),
+            role_quality=_merge_stats(self.role_quality, other.role_quality),
+            first_execution=min(times) if times else None,
+            last_execution=max(last_times) if last_times else None
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dict."""
+        return {
+            'total_executions': self.total_executions,
+            'successful_executions': self.successful_executions,
+            'quality': self.quality.to_dict(),
+            'hourly_usage': {str(h): c for h, c in self.hourly_usage.items()},
+            'category_usage': dict(self.category_usage),
+            'category_quality': {k: v.to_dict() for k, v in self.category_quality.items()},
+            'industry_executions': dict(self.industry_executions),
+            'industry_quality': {k: v.to_dict() for k, v in self.industry_quality.items()},
+            'role_executions': dict(self.role_executions),
+            'role_quality': {k: v.to_dict() for k, v in self.role_quality.items()},
+            'first_execution': self.first_execution.isoformat() if self.first_execution else None,
+            'last_execution': self.last_execution.isoformat() if self.last_execution else None
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'UsageAggregate':
+        """Rebuild an aggregate from ``to_dict`` output."""
+        first = data.get('first_execution')
+        last = data.get('last_execution')
+        return cls(
+            total_executions=data.get('total_executions', 0),
+            successful_executions=data.get('successful_executions', 0),
+            quality=RunningStats.from_dict(data['quality']) if data.get('quality') else RunningStats(),
+            hourly_usage={int(h): c for h, c in data.get('hourly_usage', {}).items()},
+            category_usage=dict(data.get('category_usage', {})),
+            category_quality={k: RunningStats.from_dict(v) for k, v in data.get('category_quality', {}).items()},
+            industry_executions=dict(data.get('industry_executions', {})),
+            industry_quality={k: RunningStats.from_dict(v) for k, v in data.get('industry_quality', {}).items()},
+            role_executions=dict(data.get('role_executions', {})),
+            role_quality={k: RunningStats.from_dict(v) for k, v in data.get('role_quality', {}).items()},
+            first_execution=datetime.fromisoformat(first) if first else None,
+            last_execution=datetime.fromisoformat(last) if last else None
+        )
+    
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict())
+    
+    @classmethod
+    def from_json(cls, json_data: str) -> 'UsageAggregate':
+        return cls.from_dict(json.loads(json_data))
+
+
+def _merge_counts(left: Dict[Any, int], right: Dict[Any, int]) -> Dict[Any, int]:
+    """Sum two count dicts, preserving first-seen key order."""
+    merged = dict(left)
+    for key, count in right.items():
+        merged[key] = merged.get(key, 0) + count
+    return merged
+
+
+def _merge_stats(left: Dict[str, RunningStats], right: Dict[str, RunningStats]) -> Dict[str, RunningStats]:
+    """Merge two keyed RunningStats dicts."""
+    merged = dict(left)
+    for key, stats in right.items():
+        merged[key] = merged[key].merge(stats) if key in merged else stats.merge(RunningStats())
+    return merged
+
+
+def merge_aggregates(partials: List[UsageAggregate]) -> UsageAggregate:
+    """Reduce any number of partial aggregates into one."""
+    combined = UsageAggregate()
+    for partial in partials:
+        combined = combined.merge(partial)
+    return combined
+
+
+def write_partial(aggregate: UsageAggregate, directory: str, worker_id: str) -> str:
+    """Atomically write a worker's partial aggregate into a shared directory."""
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{worker_id}.json")
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        f.write(aggregate.to_json())
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_partials(directory: str) -> List[UsageAggregate]:
+    """Load every partial aggregate written to a shared directory."""
+    partials = []
+    for name in sorted(os.listdir(directory)):
+        if name.endswith('.json'):
+            with open(os.path.join(directory, name)) as f:
+                partials.append(UsageAggregate.from_json(f.read()))
+    return partials
+
+
+class SlidingWindow:
+    """
+    Fixed-size, time-bucketed ring buffer over recent executions.
+    
+    The window span is split into ``buckets`` equal slots indexed by absolute
+    bucket number modulo the ring size. Recording an execution touches one slot
+    and expiring old data clears at most ``buckets`` slots, so updates and
+    queries are O(1) with respect to history length.
+    """
+    
+    def __init__(self, span: timedelta, buckets: int = 60):
+        self.span = span
+        self.bucket_count = buckets
+        self.bucket_seconds = span.total_seconds() / buckets
+        self._head: Optional[int] = None
+        self._slot_ids = [-1] * buckets
+        self._slot_hours = [0] * buckets
+        self._counts = [0] * buckets
+        self._quality_sums = [0.0] * buckets
+        self._quality_counts = [0] * buckets
+        self._successes = [0] * buckets
+        self.latest: Optional[datetime] = None  # Newest execution time recorded
+        
+        # Running totals across live slots
+        self.count = 0
+        self.quality_sum = 0.0
+        self.quality_count = 0
+        self.successes = 0
+        self.hourly_usage = [0] * 24
+    
+    def _bucket_id(self, when: datetime) -> int:
+        return int(when.timestamp() // self.bucket_seconds)
+    
+    def _evict(self, slot: int) -> None:
+        if self._slot_ids[slot] == -1:
+            return
+        self.count -= self._counts[slot]
+        self.quality_sum -= self._quality_sums[slot]
+        self.quality_count -= self._quality_counts[slot]
+        self.successes -= self._successes[slot]
+        self.hourly_usage[self._slot_hours[slot]] -= self._counts[slot]
+        self._slot_ids[slot] = -1
+        self._counts[slot] = 0
+        self._quality_sums[slot] = 0.0
+        self._quality_counts[slot] = 0
+        self._successes[slot] = 0
+    
+    def advance(self, now: datetime) -> None:
+        """Move the window head forward to ``now``, expiring stale buckets."""
+        bucket = self._bucket_id(now)
+        if self._head is None:
+            self._head = bucket
+            return
+        if bucket <= self._head:
+            return
+        for expired in range(max(self._head + 1, bucket - self.bucket_count + 1), bucket + 1):
+            self._evict(expired % self.bucket_count)
+        self._head = bucket
+    
+    def add(self, when: datetime, quality_score: Optional[float] = None, success: bool = False) -> None:
+        """Record one execution; executions older than the window are ignored."""
+        self.advance(when)
+        if self.latest is None or when > self.latest:
+            self.latest = when
+        bucket = self._bucket_id(when)
+        if bucket <= self._head - self.bucket_count:
+            return
+        
+        slot = bucket % self.bucket_count
+        if self._slot_ids[slot] != bucket:
+            self._evict(slot)
+            self._slot_ids[slot] = bucket
+            self._slot_hours[slot] = when.hour
+        
+        self._counts[slot] += 1
+        self.count += 1
+        self.hourly_usage[self._slot_hours[slot]] += 1
+        if quality_score is not None:
+            self._quality_sums[slot] += quality_score
+            self._quality_counts[slot] += 1
+            self.quality_sum += quality_score
+            self.quality_count += 1
+        if success:
+            self._successes[slot] += 1
+            self.successes += 1
+    
+    @property
+    def average_quality(self) -> float:
+        return self.quality_sum / self.quality_count if self.quality_count else 0.0
+    
+    @property
+    def success_rate(self) -> float:
+        return self.successes / self.count if self.count else 0.0
+    
+    @property
+    def peak_hour(self) -> int:
+        return max(range(24), key=self.hourly_usage.__getitem__) if self.count else 0
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Dashboard view of the window's current totals."""
+        return {
+            'executions': self.count,
+            'executions_per_minute': self.count / (self.span.total_seconds() / 60),
+            'average_quality': self.average_quality,
+            'success_rate': self.success_rate,
+            'peak_hour': self.peak_hour
+        }
+
+
+class ChangePointDetector:
+    """
+    Online EWMA baseline with a two-sided CUSUM on standardized residuals.
+    
+    Each observation is scored against the EWMA mean/variance seen so far, then
+    folded into both the baseline and the CUSUM sums in O(1). ``update``
+    returns "increase" or "decrease" when a sum crosses ``threshold``.
+    """
+    
+    def __init__(self, alpha: float = 0.1, slack: float = 0.5, threshold: float = 5.0,
+                 warmup: int = 10, min_std: float = 0.1):
+        self.alpha = alpha
+        self.slack = slack
+        self.threshold = threshold
+        self.warmup = warmup
+        self.min_std = min_std
+        self.mean = 0.0
+        self.variance = 0.0
+        self.observations = 0
+        self.cusum_high = 0.0
+        self.cusum_low = 0.0
+    
+    @property
+    def std(self) -> float:
+        return max(math.sqrt(self.variance), self.min_std)
+    
+    def update(self, value: float) -> Optional[str]:
+        """Score ``value`` against the baseline, then fold it in."""
+        self.observations += 1
+        if self.observations == 1:
+            self.mean = value
+            return None
+        
+        z = (value - self.mean) / self.std
+        diff = value - self.mean
+        increment = self.alpha * diff
+        self.mean += increment
+        self.variance = (1 - self.alpha) * (self.variance + diff * increment)
+        
+        if self.observations <= self.warmup:
+            return None
+        
+        self.cusum_high = max(0.0, self.cusum_high + z - self.slack)
+        self.cusum_low = max(0.0, self.cusum_low - z - self.slack)
+        if self.cusum_low > self.threshold:
+            self.cusum_low = 0.0
+            return "decrease"
+        if self.cusum_high > self.threshold:
+            self.cusum_high = 0.0
+            return "increase"
+        return None
+
+
+class AnomalyDetector:
+    """Per-template change-point detection over quality scores and request rate."""
+    
+    def __init__(self, rate_interval: timedelta = timedelta(minutes=5),
+                 max_idle_intervals: int = 12, **detector_options):
+        self.rate_interval_seconds = rate_interval.total_seconds()
+        self.max_idle_intervals = max_idle_intervals
+        self.detector_options = detector_options
+        self.quality_detectors: Dict[str, ChangePointDetector] = {}
+        self.rate_detectors: Dict[str, ChangePointDetector] = {}
+        self.rate_buckets: Dict[str, List[int]] = {}  # template -> [interval_id, count]
+    
+    def _detector(self, detectors: Dict[str, ChangePointDetector], key: str,
+                  min_std: float) -> ChangePointDetector:
+        detector = detectors.get(key)
+        if detector is None:
+            options = {'min_std': min_std, **self.detector_options}
+            detector = detectors[key] = ChangePointDetector(**options)
+        return detector
+    
+    def observe(self, execution: PromptExecution) -> List[PerformanceInsight]:
+        """Fold one execution into the template's detectors; return any new issues."""
+        insights = []
+        template_id = execution.prompt_id
+        
+        if execution.quality_score is not None:
+            detector = self._detector(self.quality_detectors, template_id, 0.25)
+            baseline = detector.mean
+            if detector.update(execution.quality_score) == "decrease":
+                insights.append(PerformanceInsight(
+                    category="quality_regression",
+                    insight_type="issue",
+                    description=f"Quality regression detected for template {template_id} "
+                                f"(score {execution.quality_score:.1f} vs baseline {baseline:.1f})",
+                    impact_level="high",
+                    recommendation=f"Review recent changes to template {template_id} and its inputs",
+                    data_points={'template_id': template_id, 'baseline': baseline,
+                                 'observed': execution.quality_score,
+                                 'detected_at': execution.execution_time.isoformat()}
+                ))
+        
+        interval = int(execution.execution_time.timestamp() // self.rate_interval_seconds)
+        bucket = self.rate_buckets.get(template_id)
+        if bucket is None:
+            self.rate_buckets[template_id] = [interval, 1]
+        elif interval <= bucket[0]:
+            bucket[1] += 1
+        else:
+            # Close the finished interval, plus a bounded number of idle ones
+            detector = self._detector(self.rate_detectors, template_id, 1.0)
+            idle = min(interval - bucket[0] - 1, self.max_idle_intervals)
+            for count in [bucket[1]] + [0] * idle:
+                baseline = detector.mean
+                direction = detector.update(count)
+                if direction:
+                    insights.append(PerformanceInsight(
+                        category="volume_anomaly",
+                        insight_type="issue",
+                        description=f"Request rate {'spike' if direction == 'increase' else 'drop'} for template "
+                                    f"{template_id} ({count} vs baseline {baseline:.1f} per interval)",
+                        impact_level="medium",
+                        recommendation="Check upstream traffic sources and capacity for this template",
+                        data_points={'template_id': template_id, 'direction': direction,
+                                     'baseline': baseline, 'observed': count,
+                                     'interval_seconds': self.rate_interval_seconds}
+                    ))
+            bucket[0], bucket[1] = interval, 1
+        
+        return insights
+
+
 class UsageAnalytics:
-    """Comprehensive analytics system for executive AI prompt usage."""
+    """
+    Comprehensive analytics system for executive AI prompt usage.
+    
+    Once partials from other workers have been merged (``merge_partial`` /
+    ``from_partials``) the instance acts as a collector: every report section
+    is computed from the merged all-time aggregate, and date-filtered
+    summaries raise ``ValueError`` because partials carry no raw executions.
+    Online anomaly alerts are the only local-only section. Store-backed
+    instances answer reports from SQLite and reject merges.
+    """
     
-    def __init__(self):
+    def __init__(self, store: Optional[SQLiteExecutionStore] = None):
+        # With a store, history lives in SQLite and reports run as SQL aggregates
+        self.store = store
         self.execution_history: List[PromptExecution] = []
         self.user_sessions: Dict[str, List[datetime]] = defaultdict(list)
         self.performance_benchmarks: Dict[str, float] = {
@@ -51,17 +512,83 @@ class UsageAnalytics:
             'max_response_time': 5.0,  # seconds
             'target_success_rate': 0.85
         }
+        # All-time aggregate over local executions plus any merged partials
+        self.aggregate = UsageAggregate()
+        self.partials_merged = 0
+        # Real-time sliding windows; insights read from `insight_window`
+        self.windows: Dict[str, SlidingWindow] = {
+            '5m': SlidingWindow(timedelta(minutes=5), buckets=60),
+            '1h': SlidingWindow(timedelta(hours=1), buckets=60),
+            '24h': SlidingWindow(timedelta(hours=24), buckets=96)
+        }
+        self.insight_window = '24h'
+        # Online regression detection; alerts are reported until they age out
+        self.anomaly_detector = AnomalyDetector()
+        self.anomaly_insights: deque = deque(maxlen=100)  # (detected_at, insight)
+        self.anomaly_retention = timedelta(hours=1)
     
     def record_execution(self, execution: PromptExecution, user_id: Optional[str] = None) -> None:
         """Record a prompt execution for analytics."""
-        self.execution_history.append(execution)
+        threshold = self.performance_benchmarks['min_quality_score']
+        category = self._get_execution_category(execution)
+        self.aggregate.add(execution, category, threshold)
+        
+        if self.store:
+            self.store.add(execution, user_id=user_id, category=category)
+        else:
+            self.execution_history.append(execution)
+        
+        score = execution.quality_score
+        success = bool(score and score >= threshold)
+        for window in self.windows.values():
+            window.add(execution.execution_time, score, success)
+        
+        for insight in self.anomaly_detector.observe(execution):
+            self.anomaly_insights.append((execution.execution_time, insight))
         
         if user_id:
             self.user_sessions[user_id].append(execution.execution_time)
     
+    def get_realtime_dashboard(self, now: Optional[datetime] = None) -> Dict[str, Dict[str, Any]]:
+        """Current activity for each sliding window (5m, 1h, 24h)."""
+        now = now or datetime.now()
+        dashboard = {}
+        for name, window in self.windows.items():
+            window.advance(now)
+            dashboard[name] = window.snapshot()
+        return dashboard
+    
+    def export_partial(self) -> UsageAggregate:
+        """Snapshot this instance's aggregate state for shipping to a collector."""
+        return self.aggregate.merge(UsageAggregate())
+    
+    def merge_partial(self, partial: UsageAggregate) -> None:
+        """Fold a partial aggregate from another worker into this instance."""
+        if self.store:
+            raise ValueError("Cannot merge partials into a store-backed instance; "
+                             "its reports are answered from the SQLite store only")
+        self.aggregate = self.aggregate.merge(partial)
+        self.partials_merged += 1
+    
+    @classmethod
+    def from_partials(cls, partials: List[UsageAggregate]) -> 'UsageAnalytics':
+        """Build a collector instance whose reports cover all given partials."""
+        analytics = cls()
+        analytics.aggregate = merge_aggregates(partials)
+        analytics.partials_merged = len(partials)
+        return analytics
+    
     def get_usage_summary(self, start_date: Optional[datetime] = None,
                          end_date: Optional[datetime] = None) -> UsageMetrics:
         """Generate comprehensive usage summary."""
+        if self.store:
+            return self._summary_from_store(start_date, end_date)
+        if start_date is None and end_date is None:
+            return self._summary_from_aggregate(self.aggregate)
+        if self.partials_merged:
+            raise ValueError("Date-filtered summaries are unavailable after merging partials; "
+                             "partials only carry all-time aggregates")
+        
         filtered_executions = self._filter_executions_by_date(start_date, end_date)
         
         if not filtered_executions:
@@ -94,9 +621,34 @@ class UsageAnalytics:
         )
     
     def get_category_performance(self, category: Optional[PromptCategory] = None,
-                               days: int = 30) -> Dict[str, Any]:
-        """Analyze performance by prompt category."""
-        start_date = datetime.now() - timedelta(days=days)
+                               days: int = 30, as_of: Optional[datetime] = None) -> Dict[str, Any]:
+        """Analyze performance by prompt category over the ``days`` before ``as_of`` (default now)."""
+        start_date = (as_of or datetime.now()) - timedelta(days=days)
+        if self.store:
+            groups = self.store.grouped_quality('category', start_date,
+                                                category=category.value if category else None)
+            return {
+                cat: {
+                    'count': stats['scored'],
+                    'average_score': stats['mean'],
+                    'min_score': stats['min'],
+                    'max_score': stats['max'],
+                    'std_dev': stats['stdev']
+                } for cat, stats in groups.items() if stats['scored']
+            }
+        if self.partials_merged:
+            # Collector: partials have no timestamps per execution, so report all-time stats
+            return {
+                cat: {
+                    'count': stats.count,
+                    'average_score': stats.mean,
+                    'min_score': stats.minimum,
+                    'max_score': stats.maximum,
+                    'std_dev': stats.stdev
+                } for cat, stats in self.aggregate.category_quality.items()
+                if stats.count and (category is None or cat == category.value)
+            }
+        
         filtered_executions = self._filter_executions_by_date(start_date)
         
         if category:
@@ -126,73 +678,95 @@ class UsageAnalytics:
     
     def get_industry_insights(self, industry: Optional[IndustryType] = None) -> Dict[str, Any]:
         """Generate insights for specific industry or all industries."""
-        if industry:
-            executions = [e for e in self.execution_history 
-                         if e.context and e.context.industry == industry]
-        else:
-            executions = self.execution_history
-        
-        if not executions:
-            return {}
-        
-        # Analyze industry-specific patterns
-        industry_patterns = defaultdict(lambda: {'executions': 0, 'quality_scores': []})
+        if self.store:
+            groups = self.store.grouped_quality('industry', industry=industry.value if industry else None)
+            return {
+                ind: {
+                    'total_executions': stats['executions'],
+                    'average_quality': stats['mean'],
+                    'performance_rating': self._rate_performance(stats['mean'])
+                } for ind, stats in groups.items()
+            }
         
-        for execution in executions:
-            if execution.context:
-                ind = execution.context.industry.value
-                industry_patterns[ind]['executions'] += 1
-                if execution.quality_score is not None:
-                    industry_patterns[ind]['quality_scores'].append(execution.quality_score)
+        # Served from the all-time aggregate so merged partials are included
+        industries = self.aggregate.industry_executions
+        if industry:
+            industries = {k: v for k, v in industries.items() if k == industry.value}
         
-        # Calculate industry statistics
         insights = {}
-        for ind, data in industry_patterns.items():
-            scores = data['quality_scores']
+        for ind, count in industries.items():
+            stats = self.aggregate.industry_quality.get(ind)
+            average = stats.mean if stats and stats.count else 0.0
             insights[ind] = {
-                'total_executions': data['executions'],
-                'average_quality': statistics.mean(scores) if scores else 0.0,
-                'performance_rating': self._rate_performance(statistics.mean(scores) if scores else 0.0)
+                'total_executions': count,
+                'average_quality': average,
+                'performance_rating': self._rate_performance(average)
             }
         
         return insights
     
     def get_role_effectiveness(self) -> Dict[str, Dict[str, float]]:
         """Analyze prompt effectiveness by executive role."""
-        role_performance = defaultdict(lambda: {'scores': [], 'executions': 0})
-        
-        for execution in self.execution_history:
-            if execution.context and execution.context.role:
-                role = execution.context.role.value
-                role_performance[role]['executions'] += 1
-                if execution.quality_score is not None:
-                    role_performance[role]['scores'].append(execution.quality_score)
+        if self.store:
+            effectiveness = {}
+            for role, stats in self.store.grouped_quality('role').items():
+                consistency = 1.0 - (stats['stdev'] / 10.0) if stats['scored'] > 1 else 1.0
+                effectiveness[role] = {
+                    'total_executions': stats['executions'],
+                    'average_quality': stats['mean'],
+                    'consistency': consistency,
+                    'effectiveness_rating': self._rate_effectiveness(stats['mean'], consistency)
+                }
+            return effectiveness
         
         effectiveness = {}
-        for role, data in role_performance.items():
-            scores = data['scores']
+        for role, count in self.aggregate.role_executions.items():
+            stats = self.aggregate.role_quality.get(role, RunningStats())
+            average = stats.mean if stats.count else 0.0
+            consistency = 1.0 - (stats.stdev / 10.0) if stats.count > 1 else 1.0
             effectiveness[role] = {
-                'total_executions': data['executions'],
-                'average_quality': statistics.mean(scores) if scores else 0.0,
-                'consistency': 1.0 - (statistics.stdev(scores) / 10.0) if len(scores) > 1 else 1.0,
-                'effectiveness_rating': self._rate_effectiveness(
-                    statistics.mean(scores) if scores else 0.0,
-                    1.0 - (statistics.stdev(scores) / 10.0) if len(scores) > 1 else 1.0
-                )
+                'total_executions': count,
+                'average_quality': average,
+                'consistency': consistency,
+                'effectiveness_rating': self._rate_effectiveness(average, consistency)
             }
         
         return effectiveness
     
-    def generate_performance_insights(self, min_executions: int = 10) -> List[PerformanceInsight]:
-        """Generate actionable performance insights."""
+    def generate_performance_insights(self, min_executions: int = 10,
+                                      as_of: Optional[datetime] = None) -> List[PerformanceInsight]:
+        """
+        Generate actionable performance insights.
+        
+        Windows, anomaly retention and category stats are evaluated at
+        ``as_of``, which defaults to the newest recorded execution so that
+        replayed or historic data is not aged out against the wall clock.
+        """
         insights = []
+        window = self.windows[self.insight_window]
+        as_of = as_of or window.latest or datetime.now()
+        
+        if self.partials_merged:
+            # Collector: local windows miss other workers, use the merged aggregate
+            aggregate = self.aggregate
+            source = 'all_time'
+            quality_count = aggregate.quality.count
+            average_quality = aggregate.quality.mean
+            hourly_usage = aggregate.hourly_usage
+            total_usage = aggregate.total_executions
+            peak_hour = max(hourly_usage, key=hourly_usage.get) if hourly_usage else 0
+        else:
+            window.advance(as_of)
+            source = self.insight_window
+            quality_count = window.quality_count
+            average_quality = window.average_quality if window.quality_count else 0.0
+            hourly_usage = window.hourly_usage
+            total_usage = window.count
+            peak_hour = window.peak_hour if window.count else 0
         
         # Quality score trends
-        recent_scores = [e.quality_score for e in self.execution_history[-50:] 
-                        if e.quality_score is not None]
-        
-        if len(recent_scores) >= min_executions:
-            avg_recent = statistics.mean(recent_scores)
+        if quality_count >= min_executions:
+            avg_recent = average_quality
             if avg_recent < self.performance_benchmarks['min_quality_score']:
                 insights.append(PerformanceInsight(
                     category="quality",
@@ -200,19 +774,13 @@ class UsageAnalytics:
                     description=f"Average quality score ({avg_recent:.1f}) below target ({self.performance_benchmarks['min_quality_score']})",
                     impact_level="high",
                     recommendation="Review and optimize underperforming prompt templates",
-                    data_points={'current_avg': avg_recent, 'target': self.performance_benchmarks['min_quality_score']}
+                    data_points={'current_avg': avg_recent, 'target': self.performance_benchmarks['min_quality_score'],
+                                 'window': source}
                 ))
         
         # Usage pattern analysis
-        usage_by_hour = defaultdict(int)
-        for execution in self.execution_history[-100:]:  # Last 100 executions
-            hour = execution.execution_time.hour
-            usage_by_hour[hour] += 1
-        
-        if usage_by_hour:
-            peak_hour = max(usage_by_hour, key=usage_by_hour.get)
-            peak_usage = usage_by_hour[peak_hour]
-            total_usage = sum(usage_by_hour.values())
+        if total_usage:
+            peak_usage = hourly_usage[peak_hour]
             
             if peak_usage / total_usage > 0.3:  # More than 30% usage in single hour
                 insights.append(PerformanceInsight(
@@ -221,11 +789,18 @@ class UsageAnalytics:
                     description=f"High usage concentration at hour {peak_hour} ({peak_usage/total_usage*100:.1f}%)",
                     impact_level="medium",
                     recommendation="Consider load balancing or capacity planning for peak hours",
-                    data_points={'peak_hour': peak_hour, 'concentration': peak_usage/total_usage}
+                    data_points={'peak_hour': peak_hour, 'concentration': peak_usage/total_usage,
+                                 'window': source}
                 ))
         
+        # Online anomaly alerts raised as executions were recorded, minus expired ones
+        cutoff = as_of - self.anomaly_retention
+        while self.anomaly_insights and self.anomaly_insights[0][0] < cutoff:
+            self.anomaly_insights.popleft()
+        insights.extend(insight for _, insight in self.anomaly_insights)
+        
         # Category performance analysis
-        category_performance = self.get_category_performance()
+        category_performance = self.get_category_performance(as_of=as_of)
         for category, stats in category_performance.items():
             if stats['count'] >= min_executions and stats['average_score'] < 6.0:
                 insights.append(PerformanceInsight(
@@ -246,14 +821,14 @@ class UsageAnalytics:
         category_perf = self.get_category_performance()
         industry_insights = self.get_industry_insights()
         role_effectiveness = self.get_role_effectiveness()
-        performance_insights = self.generate_performance_insights()
+        performance_insights = self.generate_performance_insights(as_of=end_date)
         
         report = {
             'report_metadata': {
                 'generated_at': datetime.now().isoformat(),
                 'period_start': start_date.isoformat() if start_date else None,
                 'period_end': end_date.isoformat() if end_date else None,
-                'total_executions_analyzed': len(self.execution_history)
+                'total_executions_analyzed': self.store.count() if self.store else self.aggregate.total_executions
             },
             'usage_summary': {
                 'total_executions': summary.total_executions,
@@ -282,6 +857,46 @@ class UsageAnalytics:
         
         return report
     
+    def _summary_from_store(self, start_date: Optional[datetime] = None,
+                            end_date: Optional[datetime] = None) -> UsageMetrics:
+        """Build a usage summary from aggregate SQL queries."""
+        totals = self.store.quality_summary(start_date, end_date,
+                                            self.performance_benchmarks['min_quality_score'])
+        if not totals['total_executions']:
+            return UsageMetrics()
+        
+        peak_hour = self.store.top_counts('hour', start_date, end_date, limit=1)
+        popular_category = self.store.top_counts('category', start_date, end_date, limit=1)
+        return UsageMetrics(
+            total_executions=totals['total_executions'],
+            average_quality_score=totals['average_quality'],
+            success_rate=totals['successes'] / totals['total_executions'],
+            peak_usage_hour=peak_hour[0][0] if peak_hour else 0,
+            most_popular_category=popular_category[0][0] if popular_category else "",
+            top_industries=self.store.top_counts('industry', start_date, end_date, limit=5),
+            top_roles=self.store.top_counts('role', start_date, end_date, limit=5)
+        )
+    
+    def _summary_from_aggregate(self, aggregate: UsageAggregate) -> UsageMetrics:
+        """Build an all-time usage summary from an aggregate."""
+        if not aggregate.total_executions:
+            return UsageMetrics()
+        
+        def top(counts: Dict[Any, int], limit: int = 5) -> List[Tuple[str, int]]:
+            return sorted(counts.items(), key=lambda x: x[1], reverse=True)[:limit]
+        
+        hourly = aggregate.hourly_usage
+        categories = aggregate.category_usage
+        return UsageMetrics(
+            total_executions=aggregate.total_executions,
+            average_quality_score=aggregate.quality.mean if aggregate.quality.count else 0.0,
+            success_rate=aggregate.successful_executions / aggregate.total_executions,
+            peak_usage_hour=max(hourly, key=hourly.get) if hourly else 0,
+            most_popular_category=max(categories, key=categories.get) if categories else "",
+            top_industries=top(aggregate.industry_executions),
+            top_roles=top(aggregate.role_executions)
+        )
+    
     def _filter_executions_by_date(self, start_date: Optional[datetime] = None,
                                   end_date: Optional[datetime] = None) -> List[PromptExecution]:
         """Filter executions by date range."""
@@ -369,6 +984,7 @@ class UsageAnalytics:
         quality_issues = [i for i in insights if i.category == "quality"]
         usage_issues = [i for i in insights if i.category == "usage_patterns"]
         category_issues = [i for i in insights if i.category == "category_performance"]
+        anomaly_issues = [i for i in insights if i.category in ("quality_regression", "volume_anomaly")]
         
         if quality_issues:
             recommendations.append("Implement systematic quality improvement program for underperforming prompts")
@@ -379,6 +995,9 @@ class UsageAnalytics:
         if category_issues:
             recommendations.append("Focus on category-specific template enhancements and training")
         
+        if anomaly_issues:
+            recommendations.append("Investigate templates flagged by regression and volume anomaly alerts")
+        
         if len(insights) > 5:
             recommendations.append("Conduct comprehensive prompt library audit and optimization")
         